@@ -13,6 +13,7 @@ from fastapi.responses import JSONResponse
 
 from ..council.orchestrator import Orchestrator, DeliberationRequest
 from ..council.consensus import ConsensusMethod
+from ..council.deliberation_cache import get_deliberation_cache
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,12 @@ class DeliberationRequestModel(BaseModel):
     required_personas: Optional[List[str]] = Field(None, description="Specific personas to include")
     consensus_method: Optional[str] = Field(None, description="How to reach consensus")
     timeout: float = Field(30.0, description="Maximum deliberation time in seconds")
+    stop_early: bool = Field(False, description="Stop once remaining personas cannot change the decision")
+
+class BatchDeliberationRequestModel(BaseModel):
+    """Request model for batch deliberation"""
+    requests: List[DeliberationRequestModel] = Field(..., description="Deliberation requests to process")
+    max_concurrency: int = Field(8, ge=1, le=64, description="Maximum persona deliberations in flight")
 
 class DeliberationResponseModel(BaseModel):
     """Response model for deliberation"""
@@ -54,6 +61,16 @@ class DeliberationResponseModel(BaseModel):
     statistics: Dict[str, Any]
     persona_responses: Optional[List[Dict[str, Any]]] = None
 
+class BatchDeliberationResponseModel(BaseModel):
+    """Response model for batch deliberation"""
+    batch_id: str
+    total: int
+    completed: int
+    failed: int
+    batch_time: float
+    results: List[DeliberationResponseModel]
+    errors: Dict[int, str]
+
 class PersonaInfoModel(BaseModel):
     """Information about a persona"""
     id: str
@@ -80,7 +97,8 @@ async def send_websocket_update(deliberation_id: str, message_type: str, data: A
 async def deliberate_with_realtime_updates(
     orchestrator: Orchestrator,
     request: DeliberationRequest,
-    deliberation_id: str
+    deliberation_id: str,
+    stop_early: bool = False
 ) -> Any:
     """Perform deliberation with real-time WebSocket updates"""
     try:
@@ -102,20 +120,33 @@ async def deliberate_with_realtime_updates(
             "total_personas": len(orchestrator.personas)
         })
 
-        # Perform deliberation
-        result = await orchestrator.deliberate(request)
+        # Stream persona responses and provisional consensus as they arrive
+        result = None
+        async for update in orchestrator.deliberate_stream(request, stop_early=stop_early):
+            if update.event == "complete":
+                result = update.result
+                break
 
-        # Send persona responses as they complete
-        personas_completed = []
-        for response in result.persona_responses:
-            personas_completed.append(response.persona_id)
+            response = update.response
+            total_personas = len(update.personas_completed) + len(update.personas_pending)
             await send_websocket_update(deliberation_id, "persona_response", {
                 "deliberation_id": deliberation_id,
                 "persona_id": response.persona_id,
                 "confidence": response.confidence,
                 "recommendation": response.recommendation[:100] + "..." if len(response.recommendation) > 100 else response.recommendation,
-                "personas_completed": personas_completed,
-                "total_personas": len(result.persona_responses)
+                "personas_completed": update.personas_completed,
+                "total_personas": total_personas
+            })
+
+            provisional = update.provisional_consensus
+            await send_websocket_update(deliberation_id, "consensus_update", {
+                "deliberation_id": deliberation_id,
+                "stage": "provisional",
+                "decision": provisional.decision,
+                "confidence": provisional.confidence,
+                "agreement_level": provisional.agreement_level,
+                "decided": update.decided,
+                "personas_pending": update.personas_pending
             })
 
         # Send consensus update
@@ -133,7 +164,8 @@ async def deliberate_with_realtime_updates(
             "decision": result.consensus.decision,
             "confidence": result.consensus.confidence,
             "agreement_level": result.consensus.agreement_level,
-            "deliberation_time": result.deliberation_time
+            "deliberation_time": result.deliberation_time,
+            "personas_skipped": result.statistics.get("personas_skipped", [])
         })
 
         return result
@@ -147,15 +179,78 @@ async def deliberate_with_realtime_updates(
         })
         raise
 
+def _to_deliberation_request(request: DeliberationRequestModel) -> DeliberationRequest:
+    """Convert an API request model into a DeliberationRequest"""
+    # Convert consensus method string to enum
+    consensus_method = None
+    if request.consensus_method:
+        try:
+            consensus_method = ConsensusMethod(request.consensus_method)
+        except ValueError:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Invalid consensus method: {request.consensus_method}"
+            )
+    
+    return DeliberationRequest(
+        query=request.query,
+        context=request.context,
+        topic=request.topic,
+        required_personas=request.required_personas,
+        consensus_method=consensus_method,
+        timeout=request.timeout
+    )
+
+def _to_response_model(deliberation_id: str, result: Any) -> DeliberationResponseModel:
+    """Convert a DeliberationResult into the API response model"""
+    persona_details = []
+    for persona_response in result.persona_responses:
+        persona_details.append({
+            "persona_id": persona_response.persona_id,
+            "persona_name": persona_response.persona_name,
+            "recommendation": persona_response.recommendation,
+            "reasoning": persona_response.reasoning,
+            "confidence": persona_response.confidence,
+            "priority": persona_response.priority.value if hasattr(persona_response.priority, 'value') else str(persona_response.priority),
+            "concerns": persona_response.concerns,
+            "opportunities": persona_response.opportunities,
+            "data_points": persona_response.data_points
+        })
+    
+    return DeliberationResponseModel(
+        id=deliberation_id,
+        query=result.request.query,
+        decision=result.consensus.decision,
+        confidence=result.consensus.confidence,
+        agreement_level=result.consensus.agreement_level,
+        deliberation_time=result.deliberation_time,
+        personas_consulted=len(result.persona_responses),
+        timestamp=result.timestamp.isoformat(),
+        consensus_details=result.consensus.to_dict(),
+        supporting_personas=result.consensus.supporting_personas,
+        dissenting_personas=result.consensus.dissenting_personas,
+        alternative_views=result.consensus.alternative_views,
+        statistics=result.statistics,
+        persona_responses=persona_details
+    )
+
 async def get_orchestrator() -> Orchestrator:
     """Get or create orchestrator instance"""
     global _orchestrator
     if _orchestrator is None:
-        _orchestrator = Orchestrator(use_all_personas=True)
+        _orchestrator = Orchestrator(
+            use_all_personas=True,
+            result_cache=get_deliberation_cache()
+        )
         await _orchestrator.initialize()
         logger.info("Council orchestrator initialized")
     return _orchestrator
 
+async def shutdown_orchestrator():
+    """Flush queued deliberation persistence on application shutdown"""
+    if _orchestrator is not None:
+        await _orchestrator.shutdown()
+
 @router.post("/deliberate", response_model=DeliberationResponseModel)
 async def create_deliberation(
     request: DeliberationRequestModel,
@@ -166,76 +261,81 @@ async def create_deliberation(
     Submit a query for deliberation by the Council of Minds
     """
     try:
-        # Convert consensus method string to enum
-        consensus_method = None
-        if request.consensus_method:
-            try:
-                consensus_method = ConsensusMethod(request.consensus_method)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Invalid consensus method: {request.consensus_method}"
-                )
+        deliberation_request = _to_deliberation_request(request)
         
         # Generate unique ID
         deliberation_id = f"delib_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
         
-        # Create deliberation request
-        deliberation_request = DeliberationRequest(
-            query=request.query,
-            context=request.context,
-            topic=request.topic,
-            required_personas=request.required_personas,
-            consensus_method=consensus_method,
-            timeout=request.timeout
-        )
-        
         # Perform deliberation with real-time updates
         result = await deliberate_with_realtime_updates(
             orchestrator, 
             deliberation_request, 
-            deliberation_id
+            deliberation_id,
+            stop_early=request.stop_early
         )
         
-        # Convert to response model
-        persona_details = []
-        for persona_response in result.persona_responses:
-            persona_details.append({
-                "persona_id": persona_response.persona_id,
-                "persona_name": persona_response.persona_name,
-                "recommendation": persona_response.recommendation,
-                "reasoning": persona_response.reasoning,
-                "confidence": persona_response.confidence,
-                "priority": persona_response.priority.value if hasattr(persona_response.priority, 'value') else str(persona_response.priority),
-                "concerns": persona_response.concerns,
-                "opportunities": persona_response.opportunities,
-                "data_points": persona_response.data_points
-            })
-        
-        response = DeliberationResponseModel(
-            id=deliberation_id,
-            query=result.request.query,
-            decision=result.consensus.decision,
-            confidence=result.consensus.confidence,
-            agreement_level=result.consensus.agreement_level,
-            deliberation_time=result.deliberation_time,
-            personas_consulted=len(result.persona_responses),
-            timestamp=result.timestamp.isoformat(),
-            consensus_details=result.consensus.to_dict(),
-            supporting_personas=result.consensus.supporting_personas,
-            dissenting_personas=result.consensus.dissenting_personas,
-            alternative_views=result.consensus.alternative_views,
-            statistics=result.statistics,
-            persona_responses=persona_details
-        )
+        response = _to_response_model(deliberation_id, result)
         
         logger.info(f"Deliberation completed: {deliberation_id} - {response.confidence:.1%} confidence")
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error in deliberation: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Deliberation failed: {str(e)}")
 
+@router.post("/deliberate/batch", response_model=BatchDeliberationResponseModel)
+async def create_batch_deliberation(
+    request: BatchDeliberationRequestModel,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+) -> BatchDeliberationResponseModel:
+    """
+    Submit many queries for deliberation in one call
+    
+    Persona selection and memory recall are shared across the batch and
+    persona analysis runs with bounded concurrency. Results are returned
+    in request order; failed requests are reported in ``errors``.
+    """
+    if not request.requests:
+        raise HTTPException(status_code=400, detail="Batch contains no requests")
+    
+    deliberation_requests = [_to_deliberation_request(r) for r in request.requests]
+    
+    try:
+        batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        start_time = datetime.now()
+        
+        results: Dict[int, DeliberationResponseModel] = {}
+        errors: Dict[int, str] = {}
+        async for index, outcome in orchestrator.deliberate_batch(
+            deliberation_requests,
+            max_concurrency=request.max_concurrency,
+            return_exceptions=True
+        ):
+            if isinstance(outcome, BaseException):
+                errors[index] = str(outcome)
+            else:
+                results[index] = _to_response_model(f"{batch_id}_{index}", outcome)
+        
+        batch_time = (datetime.now() - start_time).total_seconds()
+        logger.info(f"Batch deliberation completed: {batch_id} - "
+                    f"{len(results)}/{len(deliberation_requests)} in {batch_time:.2f}s")
+        
+        return BatchDeliberationResponseModel(
+            batch_id=batch_id,
+            total=len(deliberation_requests),
+            completed=len(results),
+            failed=len(errors),
+            batch_time=batch_time,
+            results=[results[i] for i in sorted(results)],
+            errors=errors
+        )
+        
+    except Exception as e:
+        logger.error(f"Error in batch deliberation: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Batch deliberation failed: {str(e)}")
+
 @router.get("/deliberations/{deliberation_id}")
 async def get_deliberation(deliberation_id: str):
     """
@@ -352,6 +452,9 @@ async def detailed_health_check(
                 "personas_loaded": len(orchestrator.personas),
                 "deliberations_processed": len(orchestrator.deliberation_history)
             },
+            "deliberation_cache": orchestrator.result_cache.get_stats() if orchestrator.result_cache else None,
+            "blackboard_retention": orchestrator.blackboard.get_retention_stats(),
+            "persistence": orchestrator.persistence.get_stats(),
             "personas": {}
         }
         
@@ -387,6 +490,8 @@ async def reset_orchestrator():
             for persona in _orchestrator.personas.values():
                 persona.decision_history.clear()
                 persona.memory.clear()
+            if _orchestrator.result_cache:
+                await _orchestrator.result_cache.clear()
             
             logger.info("Orchestrator state reset")
         
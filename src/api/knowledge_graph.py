@@ -28,6 +28,7 @@ from sqlalchemy import select, func, desc, and_, or_
 
 from ..config import get_db_session
 from ..council.optimus_knowledge_graph import OptimusKnowledgeGraph
+from ..council.deliberation_cache import get_deliberation_cache
 from ..models.knowledge_graph import (
     GraphNode, GraphEdge, GraphCluster, 
     NodeTypeEnum, EdgeTypeEnum
@@ -47,6 +48,24 @@ async def get_knowledge_graph() -> OptimusKnowledgeGraph:
         await _knowledge_graph.initialize()
     return _knowledge_graph
 
+async def _invalidate_deliberations_for_nodes(kg: OptimusKnowledgeGraph, node_ids: List[str]):
+    """Invalidate cached deliberations that mention the given graph nodes"""
+    try:
+        cache = get_deliberation_cache()
+        terms = []
+        for node_id in node_ids:
+            node = kg.node_cache.get(node_id)
+            if node is None:
+                continue
+            terms.append(node.name)
+            topic = (node.attributes or {}).get('topic')
+            if topic:
+                await cache.invalidate_topic(topic)
+        if terms:
+            await cache.invalidate_terms(terms)
+    except Exception as e:
+        logger.warning(f"Failed to invalidate cached deliberations: {e}")
+
 # =================== REQUEST/RESPONSE MODELS ===================
 
 class NodeResponse(BaseModel):
@@ -287,6 +306,9 @@ async def create_node(
             importance=node_request.importance
         )
         
+        # Cached council answers about this concept may now be stale
+        await _invalidate_deliberations_for_nodes(kg, [str(node.id)])
+        
         return NodeResponse(
             id=str(node.id),
             name=node.name,
@@ -386,6 +408,11 @@ async def create_edge(
             attributes=edge_request.attributes
         )
         
+        # Cached council answers about either endpoint may now be stale
+        await _invalidate_deliberations_for_nodes(
+            kg, [str(edge_request.source_id), str(edge_request.target_id)]
+        )
+        
         return EdgeResponse(
             id=str(edge.id),
             source_id=str(edge.source_id),
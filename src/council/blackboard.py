@@ -9,16 +9,48 @@ The blackboard acts as a central repository where all personas can:
 """
 
 import asyncio
+import bisect
+import heapq
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Set
+from itertools import islice
+from typing import Dict, List, Optional, Any, Set, Iterator, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 import logging
+import math
+import re
+
+if TYPE_CHECKING:
+    from .blackboard_archive import BlackboardArchive
 
 logger = logging.getLogger(__name__)
 
+# BM25 ranking parameters for Blackboard.search
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9_]+')
+
+
+def _tokenize(text: str) -> List[str]:
+    """Lowercased word tokens used by the search index"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _contains_phrase(tokens: List[str], phrase: List[str]) -> bool:
+    """Whether the phrase tokens appear contiguously in tokens"""
+    width = len(phrase)
+    if not width:
+        return True
+    first = phrase[0]
+    for i in range(len(tokens) - width + 1):
+        if tokens[i] == first and tokens[i:i + width] == phrase:
+            return True
+    return False
+
 
 class EntryType(Enum):
     """Types of entries that can be posted to the blackboard"""
@@ -58,12 +90,298 @@ class BlackboardEntry:
             'tags': list(self.tags)
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BlackboardEntry':
+        """Create an entry from its serialized dictionary"""
+        return cls(
+            id=data['id'],
+            persona_id=data['persona_id'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            entry_type=EntryType(data['entry_type']),
+            content=data['content'],
+            metadata=data.get('metadata', {}),
+            confidence=data.get('confidence', 0.5),
+            references=data.get('references', []),
+            tags=set(data.get('tags', []))
+        )
+    
     def relates_to(self, other_entry_id: str):
         """Mark this entry as related to another"""
         if other_entry_id not in self.references:
             self.references.append(other_entry_id)
 
 
+class SubscriptionPolicy(Enum):
+    """What a subscriber receives when it falls behind"""
+    DROP_OLDEST = "drop_oldest"  # Skip the oldest undelivered entries beyond the lag limit
+    COALESCE = "coalesce"        # Skip straight to the newest entry
+
+
+class _TopicFeed:
+    """
+    Fixed-size ring buffer of recent entries for one topic
+    
+    Subscribers keep their own cursor into the ring, so posting is a single
+    slot write and never waits for a consumer.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.buffer: List[Optional[BlackboardEntry]] = [None] * capacity
+        self.next_seq = 0
+        self._new_entry = asyncio.Event()
+    
+    @property
+    def oldest_seq(self) -> int:
+        return max(0, self.next_seq - self.capacity)
+    
+    def publish(self, entry: BlackboardEntry):
+        self.buffer[self.next_seq % self.capacity] = entry
+        self.next_seq += 1
+        self.wake()
+    
+    def wake(self):
+        """Release every consumer waiting for the next entry"""
+        event, self._new_entry = self._new_entry, asyncio.Event()
+        event.set()
+    
+    def entry_at(self, seq: int) -> BlackboardEntry:
+        return self.buffer[seq % self.capacity]
+    
+    async def wait(self):
+        await self._new_entry.wait()
+
+
+class Subscription:
+    """
+    A subscriber's view of a topic feed
+    
+    Exposes the asyncio.Queue read methods (``get``, ``get_nowait``, ``qsize``,
+    ``empty``) and async iteration.
+    """
+    
+    def __init__(self,
+                 topic: str,
+                 feed: _TopicFeed,
+                 policy: SubscriptionPolicy = SubscriptionPolicy.DROP_OLDEST,
+                 max_lag: Optional[int] = None):
+        self.id = str(uuid.uuid4())
+        self.topic = topic
+        self.policy = policy
+        self.max_lag = min(max_lag, feed.capacity) if max_lag else feed.capacity
+        self.cursor = feed.next_seq
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+        self._feed = feed
+    
+    @property
+    def lag(self) -> int:
+        """Entries published but not yet consumed"""
+        return self._feed.next_seq - self.cursor
+    
+    def qsize(self) -> int:
+        """Entries that the next reads will deliver"""
+        if self.policy == SubscriptionPolicy.COALESCE:
+            return min(self.lag, 1)
+        return min(self.lag, self.max_lag)
+    
+    def empty(self) -> bool:
+        return self.lag == 0
+    
+    def get_nowait(self) -> BlackboardEntry:
+        """Next entry for this subscriber, applying its backpressure policy"""
+        lag = self.lag
+        if lag <= 0:
+            raise asyncio.QueueEmpty()
+        
+        if self.policy == SubscriptionPolicy.COALESCE and lag > 1:
+            self.coalesced += lag - 1
+            self.cursor = self._feed.next_seq - 1
+        elif lag > self.max_lag:
+            self.dropped += lag - self.max_lag
+            self.cursor = self._feed.next_seq - self.max_lag
+        
+        entry = self._feed.entry_at(self.cursor)
+        self.cursor += 1
+        self.delivered += 1
+        return entry
+    
+    async def get(self) -> BlackboardEntry:
+        """
+        Wait for the next entry
+        
+        Raises:
+            RuntimeError: If the subscription was closed by unsubscribe
+        """
+        while True:
+            if self.closed:
+                raise RuntimeError(f"Subscription to {self.topic} is closed")
+            if self.lag > 0:
+                return self.get_nowait()
+            await self._feed.wait()
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> BlackboardEntry:
+        if self.closed:
+            raise StopAsyncIteration
+        try:
+            return await self.get()
+        except RuntimeError:
+            if self.closed:
+                raise StopAsyncIteration
+            raise
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'topic': self.topic,
+            'policy': self.policy.value,
+            'lag': self.lag,
+            'max_lag': self.max_lag,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced
+        }
+
+
+class _TimeOrderedEntries:
+    """Entries kept in timestamp order with a parallel timestamp array for bisection"""
+    
+    __slots__ = ('entries', 'timestamps')
+    
+    def __init__(self):
+        self.entries: List[BlackboardEntry] = []
+        self.timestamps: List[datetime] = []
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def add(self, entry: BlackboardEntry):
+        """Insert an entry, appending in the common in-order case"""
+        if not self.timestamps or entry.timestamp >= self.timestamps[-1]:
+            self.entries.append(entry)
+            self.timestamps.append(entry.timestamp)
+        else:
+            index = bisect.bisect_right(self.timestamps, entry.timestamp)
+            self.entries.insert(index, entry)
+            self.timestamps.insert(index, entry.timestamp)
+    
+    def newest_first(self,
+                     since: Optional[datetime] = None,
+                     predicate: Optional[Callable[[BlackboardEntry], bool]] = None
+                     ) -> Iterator[BlackboardEntry]:
+        """Iterate entries newer than ``since`` from newest to oldest"""
+        stop = bisect.bisect_right(self.timestamps, since) if since else 0
+        entries = self.entries
+        for index in range(len(entries) - 1, stop - 1, -1):
+            entry = entries[index]
+            if predicate is None or predicate(entry):
+                yield entry
+
+
+@dataclass
+class _TopicStatistics:
+    """Running counters for a topic, updated as entries are posted"""
+    total_entries: int = 0
+    confidence_sum: float = 0.0
+    persona_counts: Dict[str, int] = field(default_factory=dict)
+    entry_type_counts: Dict[str, int] = field(default_factory=dict)
+    first_timestamp: Optional[datetime] = None
+    last_timestamp: Optional[datetime] = None
+    
+    def record(self, entry: BlackboardEntry):
+        self.total_entries += 1
+        self.confidence_sum += entry.confidence
+        self.persona_counts[entry.persona_id] = self.persona_counts.get(entry.persona_id, 0) + 1
+        entry_type = entry.entry_type.value
+        self.entry_type_counts[entry_type] = self.entry_type_counts.get(entry_type, 0) + 1
+        if self.first_timestamp is None or entry.timestamp < self.first_timestamp:
+            self.first_timestamp = entry.timestamp
+        if self.last_timestamp is None or entry.timestamp > self.last_timestamp:
+            self.last_timestamp = entry.timestamp
+
+
+class _TopicIndex:
+    """Per-topic storage with secondary indexes by persona and entry type"""
+    
+    __slots__ = ('all', 'by_persona', 'by_type', 'stats', 'has_archived',
+                 'postings', 'doc_lengths', 'total_length', 'by_tag')
+    
+    def __init__(self):
+        self.all = _TimeOrderedEntries()
+        self.by_persona: Dict[str, _TimeOrderedEntries] = {}
+        self.by_type: Dict[EntryType, _TimeOrderedEntries] = {}
+        self.stats = _TopicStatistics()
+        self.has_archived = False  # Older entries were moved to the archive
+        
+        # Full-text index
+        self.postings: Dict[str, Dict[str, int]] = {}  # token -> entry id -> term frequency
+        self.doc_lengths: Dict[str, int] = {}  # entry id -> token count
+        self.total_length = 0
+        self.by_tag: Dict[str, Set[str]] = {}  # tag -> entry ids
+    
+    def add(self, entry: BlackboardEntry):
+        self.all.add(entry)
+        self._index(entry)
+    
+    def _index(self, entry: BlackboardEntry):
+        self.by_persona.setdefault(entry.persona_id, _TimeOrderedEntries()).add(entry)
+        self.by_type.setdefault(entry.entry_type, _TimeOrderedEntries()).add(entry)
+        self.stats.record(entry)
+        
+        tokens = _tokenize(entry.content)
+        for token in tokens:
+            postings = self.postings.setdefault(token, {})
+            postings[entry.id] = postings.get(entry.id, 0) + 1
+        self.doc_lengths[entry.id] = len(tokens)
+        self.total_length += len(tokens)
+        for tag in entry.tags:
+            self.by_tag.setdefault(tag, set()).add(entry.id)
+    
+    def drop_oldest(self, count: int) -> List[BlackboardEntry]:
+        """Remove the oldest entries and rebuild the secondary indexes"""
+        dropped = self.all.entries[:count]
+        del self.all.entries[:count]
+        del self.all.timestamps[:count]
+        
+        self.by_persona = {}
+        self.by_type = {}
+        self.stats = _TopicStatistics()
+        self.postings = {}
+        self.doc_lengths = {}
+        self.total_length = 0
+        self.by_tag = {}
+        for entry in self.all.entries:
+            self._index(entry)
+        
+        return dropped
+    
+    def query(self,
+              persona_id: Optional[str],
+              entry_type: Optional[EntryType],
+              since: Optional[datetime]) -> Iterator[BlackboardEntry]:
+        """Newest-first iterator over matching entries using the smallest index"""
+        if persona_id and entry_type:
+            by_persona = self.by_persona.get(persona_id)
+            by_type = self.by_type.get(entry_type)
+            if not by_persona or not by_type:
+                return iter(())
+            if len(by_persona) <= len(by_type):
+                return by_persona.newest_first(since, lambda e: e.entry_type == entry_type)
+            return by_type.newest_first(since, lambda e: e.persona_id == persona_id)
+        if persona_id:
+            by_persona = self.by_persona.get(persona_id)
+            return by_persona.newest_first(since) if by_persona else iter(())
+        if entry_type:
+            by_type = self.by_type.get(entry_type)
+            return by_type.newest_first(since) if by_type else iter(())
+        return self.all.newest_first(since)
+
+
 class Blackboard:
     """
     Central knowledge repository for multi-persona collaboration
@@ -71,17 +389,56 @@ class Blackboard:
     Features:
     - Thread-safe async operations
     - Topic-based organization
+    - Per-topic indexes by persona, entry type and time
     - Entry filtering and search
     - Knowledge persistence
-    - Real-time updates via subscriptions
+    - Real-time updates via bounded, non-blocking subscriptions
+    
+    Writers serialize on ``lock``. Indexes are updated synchronously inside
+    ``post`` before any await, so readers never observe a partial write and
+    do not need to take the lock.
+    
+    Retention limits keep resident memory bounded on long-running servers.
+    Topics are evicted least recently written first, and an oversized topic
+    sheds its oldest entries. Evicted entries go to the archive when one is
+    configured and are loaded back lazily by ``get_consensus_trail`` and
+    ``get_entry``.
     """
     
-    def __init__(self):
-        self.entries: Dict[str, List[BlackboardEntry]] = {}  # topic -> entries
+    def __init__(self,
+                 max_topics: Optional[int] = None,
+                 max_entries: Optional[int] = None,
+                 max_entries_per_topic: Optional[int] = None,
+                 archive: Optional['BlackboardArchive'] = None,
+                 subscriber_buffer_size: int = 1000):
+        """
+        Initialize the blackboard
+        
+        Args:
+            max_topics: Maximum resident topics (None for unbounded)
+            max_entries: Maximum resident entries across all topics (None for unbounded)
+            max_entries_per_topic: Maximum resident entries in one topic (None for unbounded)
+            archive: Where evicted entries are stored (None to discard them)
+            subscriber_buffer_size: Recent entries kept per subscribed topic
+        """
+        self.entries: Dict[str, List[BlackboardEntry]] = {}  # topic -> entries in time order
         self.all_entries: Dict[str, BlackboardEntry] = {}  # id -> entry
-        self.subscribers: Dict[str, List[asyncio.Queue]] = {}  # topic -> queues
+        self.subscribers: Dict[str, List[Subscription]] = {}  # topic -> subscriptions
+        self.subscriber_buffer_size = subscriber_buffer_size
+        self._feeds: Dict[str, _TopicFeed] = {}  # topic -> ring buffer for subscribers
         self.lock = asyncio.Lock()
         self.topics: Set[str] = set()
+        self._indexes: Dict[str, _TopicIndex] = {}  # topic -> indexes
+        
+        # Retention
+        self.max_topics = max_topics
+        self.max_entries = max_entries
+        self.max_entries_per_topic = max_entries_per_topic
+        self.archive = archive
+        self._topic_activity: "OrderedDict[str, None]" = OrderedDict()  # least recently written first
+        self._resident_entries = 0
+        self.evicted_topics = 0
+        self.evicted_entries = 0
         
     async def post(self, topic: str, entry: BlackboardEntry) -> str:
         """
@@ -95,16 +452,23 @@ class Blackboard:
             The ID of the posted entry
         """
         async with self.lock:
-            # Add to topic-specific list
-            if topic not in self.entries:
-                self.entries[topic] = []
+            # Add to topic indexes
+            index = self._indexes.get(topic)
+            if index is None:
+                index = self._indexes[topic] = _TopicIndex()
+                self.entries[topic] = index.all.entries
                 self.topics.add(topic)
             
-            self.entries[topic].append(entry)
+            index.add(entry)
             self.all_entries[entry.id] = entry
+            self._resident_entries += 1
+            self._topic_activity[topic] = None
+            self._topic_activity.move_to_end(topic)
+            
+            self._enforce_retention(topic)
             
             # Notify subscribers
-            await self._notify_subscribers(topic, entry)
+            self._notify_subscribers(topic, entry)
             
             logger.debug(f"Posted {entry.entry_type.value} from {entry.persona_id} to {topic}")
             
@@ -127,140 +491,239 @@ class Blackboard:
             limit: Maximum number of entries to return
             
         Returns:
-            List of matching entries, sorted by timestamp
+            List of matching entries, newest first
         """
-        async with self.lock:
-            entries = []
-            
-            # Collect entries from specified topic or all topics
-            if topic:
-                entries = self.entries.get(topic, []).copy()
-            else:
-                for topic_entries in self.entries.values():
-                    entries.extend(topic_entries)
-            
-            # Apply filters
-            if persona_id:
-                entries = [e for e in entries if e.persona_id == persona_id]
-            
-            if entry_type:
-                entries = [e for e in entries if e.entry_type == entry_type]
-            
-            if since:
-                entries = [e for e in entries if e.timestamp > since]
-            
-            # Sort by timestamp and apply limit
-            entries.sort(key=lambda e: e.timestamp, reverse=True)
-            return entries[:limit]
+        return self._read(topic, persona_id, entry_type, since, limit)
+    
+    def _read(self,
+              topic: Optional[str] = None,
+              persona_id: Optional[str] = None,
+              entry_type: Optional[EntryType] = None,
+              since: Optional[datetime] = None,
+              limit: int = 100) -> List[BlackboardEntry]:
+        """Lock-free read over the topic indexes"""
+        if topic:
+            index = self._indexes.get(topic)
+            if index is None:
+                return []
+            return list(islice(index.query(persona_id, entry_type, since), limit))
+        
+        # Merge the newest-first streams of every topic
+        streams = [
+            index.query(persona_id, entry_type, since)
+            for index in list(self._indexes.values())
+        ]
+        merged = heapq.merge(*streams, key=lambda e: e.timestamp, reverse=True)
+        return list(islice(merged, limit))
     
     async def get_entry(self, entry_id: str) -> Optional[BlackboardEntry]:
-        """Get a specific entry by ID"""
-        async with self.lock:
-            return self.all_entries.get(entry_id)
+        """Get a specific entry by ID, falling back to the archive"""
+        entry = self.all_entries.get(entry_id)
+        if entry is None and self.archive is not None:
+            entry = self.archive.get_entry(entry_id)
+        return entry
     
-    async def search(self, query: str, topic: Optional[str] = None) -> List[BlackboardEntry]:
+    async def search(self,
+                     query: str,
+                     topic: Optional[str] = None,
+                     tags: Optional[Set[str]] = None,
+                     limit: int = 1000) -> List[BlackboardEntry]:
         """
         Search entries by content
         
+        Uses the inverted index maintained by ``post``, so the cost depends on
+        the number of matching entries rather than the size of the blackboard.
+        Double-quoted parts of the query must appear as exact phrases.
+        
         Args:
             query: Search string (case-insensitive)
             topic: Optionally limit search to specific topic
+            tags: Only return entries carrying all of these tags
+            limit: Maximum number of entries to return
             
         Returns:
             Matching entries sorted by relevance
         """
-        query_lower = query.lower()
-        entries = await self.read(topic=topic, limit=1000)
+        phrases = [_tokenize(p) for p in re.findall(r'"([^"]*)"', query)]
+        phrases = [p for p in phrases if p]
+        terms = list(dict.fromkeys(_tokenize(query)))
+        if not terms and not tags:
+            return []
         
-        # Simple relevance scoring
-        scored_entries = []
-        for entry in entries:
-            score = 0
-            content_lower = entry.content.lower()
-            
-            # Exact match scores highest
-            if query_lower == content_lower:
-                score = 10
-            # Contains query
-            elif query_lower in content_lower:
-                score = 5
-            # Word-level matches
-            else:
-                query_words = set(query_lower.split())
-                content_words = set(content_lower.split())
-                matching_words = query_words & content_words
-                score = len(matching_words)
-            
-            if score > 0:
-                scored_entries.append((score, entry))
+        if topic:
+            indexes = [self._indexes[topic]] if topic in self._indexes else []
+        else:
+            indexes = list(self._indexes.values())
+        
+        # Corpus statistics for the query terms across the searched topics
+        doc_count = sum(len(index.all) for index in indexes)
+        if not doc_count:
+            return []
+        avg_length = sum(index.total_length for index in indexes) / doc_count or 1.0
+        idf = {}
+        for term in terms:
+            df = sum(len(index.postings.get(term, ())) for index in indexes)
+            idf[term] = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+        
+        query_tokens = _tokenize(query)
+        scored = []
+        for index in indexes:
+            candidates = self._search_candidates(index, terms, phrases, tags)
+            for entry_id in candidates:
+                entry = self.all_entries.get(entry_id)
+                if entry is None:
+                    continue
+                
+                length_norm = 1 - BM25_B + BM25_B * index.doc_lengths.get(entry_id, 0) / avg_length
+                score = 0.0
+                for term in terms:
+                    tf = index.postings.get(term, {}).get(entry_id, 0)
+                    if tf:
+                        score += idf[term] * tf * (BM25_K1 + 1) / (tf + BM25_K1 * length_norm)
+                
+                # Phrase checks only touch candidate entries
+                if phrases or len(query_tokens) > 1:
+                    content_tokens = _tokenize(entry.content)
+                    if not all(_contains_phrase(content_tokens, p) for p in phrases):
+                        continue
+                    if len(query_tokens) > 1 and _contains_phrase(content_tokens, query_tokens):
+                        score *= 2 if content_tokens == query_tokens else 1.5
+                
+                scored.append((score, entry.timestamp, entry))
+        
+        scored.sort(key=lambda x: (x[0], x[1]), reverse=True)
+        return [entry for _, _, entry in scored[:limit]]
+    
+    @staticmethod
+    def _search_candidates(index: _TopicIndex,
+                           terms: List[str],
+                           phrases: List[List[str]],
+                           tags: Optional[Set[str]]) -> Set[str]:
+        """Entry IDs matching any term, every phrase term and every tag"""
+        tags = list(tags or ())
+        if terms:
+            candidates: Set[str] = set()
+            for term in terms:
+                candidates.update(index.postings.get(term, ()))
+        else:
+            candidates = set(index.by_tag.get(tags[0], ()))
+        
+        for phrase in phrases:
+            for token in phrase:
+                candidates.intersection_update(index.postings.get(token, ()))
         
-        # Sort by score and return entries
-        scored_entries.sort(key=lambda x: x[0], reverse=True)
-        return [entry for score, entry in scored_entries]
+        for tag in tags:
+            candidates.intersection_update(index.by_tag.get(tag, ()))
+        
+        return candidates
     
     async def get_consensus_trail(self, topic: str) -> List[BlackboardEntry]:
         """
         Get the decision-making trail for a topic
         
-        Returns entries in chronological order showing how consensus was reached
+        Returns entries in chronological order showing how consensus was reached.
+        Archived entries are loaded back when the topic was evicted.
         """
-        entries = await self.read(topic=topic, limit=1000)
-        entries.sort(key=lambda e: e.timestamp)
-        return entries
+        index = self._indexes.get(topic)
+        resident = index.all.entries[-1000:] if index is not None else []
+        
+        if self.archive is not None and (index is None or index.has_archived) and len(resident) < 1000:
+            archived = self.archive.load_topic(topic)
+            resident_ids = {entry.id for entry in resident}
+            archived = [entry for entry in archived if entry.id not in resident_ids]
+            return (archived + resident)[-1000:]
+        
+        return resident
     
-    async def subscribe(self, topic: str) -> asyncio.Queue:
+    async def subscribe(self,
+                        topic: str,
+                        policy: SubscriptionPolicy = SubscriptionPolicy.DROP_OLDEST,
+                        max_lag: Optional[int] = None) -> Subscription:
         """
         Subscribe to real-time updates for a topic
         
+        Args:
+            topic: Topic to follow
+            policy: What to skip when the subscriber falls behind
+            max_lag: Undelivered entries kept for this subscriber (default: buffer size)
+        
         Returns:
-            An async queue that will receive new entries
+            A subscription that will receive new entries
         """
-        async with self.lock:
-            if topic not in self.subscribers:
-                self.subscribers[topic] = []
-            
-            queue = asyncio.Queue()
-            self.subscribers[topic].append(queue)
-            return queue
+        feed = self._feeds.get(topic)
+        if feed is None:
+            feed = self._feeds[topic] = _TopicFeed(self.subscriber_buffer_size)
+        
+        subscription = Subscription(topic, feed, policy=policy, max_lag=max_lag)
+        self.subscribers.setdefault(topic, []).append(subscription)
+        return subscription
     
-    async def unsubscribe(self, topic: str, queue: asyncio.Queue):
+    async def unsubscribe(self, topic: str, subscription: Subscription):
         """Unsubscribe from a topic"""
-        async with self.lock:
-            if topic in self.subscribers:
-                self.subscribers[topic].remove(queue)
-    
-    async def _notify_subscribers(self, topic: str, entry: BlackboardEntry):
-        """Notify all subscribers of a new entry"""
-        if topic in self.subscribers:
-            for queue in self.subscribers[topic]:
-                try:
-                    await queue.put(entry)
-                except asyncio.QueueFull:
-                    logger.warning(f"Subscriber queue full for topic {topic}")
+        subscriptions = self.subscribers.get(topic)
+        if subscriptions and subscription in subscriptions:
+            subscriptions.remove(subscription)
+            subscription.closed = True
+            # Wake a consumer blocked in get() so it sees the close
+            feed = self._feeds.get(topic)
+            if feed is not None:
+                feed.wake()
+            if not subscriptions:
+                del self.subscribers[topic]
+                self._feeds.pop(topic, None)
+    
+    def _notify_subscribers(self, topic: str, entry: BlackboardEntry):
+        """Publish an entry to the topic feed; consumers read at their own pace"""
+        feed = self._feeds.get(topic)
+        if feed is not None:
+            feed.publish(entry)
+    
+    def get_subscription_stats(self, topic: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Per-subscriber lag and drop counters"""
+        topics = [topic] if topic else list(self.subscribers.keys())
+        return [
+            subscription.get_stats()
+            for t in topics
+            for subscription in self.subscribers.get(t, [])
+        ]
     
     async def clear_topic(self, topic: str):
         """Clear all entries for a specific topic"""
         async with self.lock:
-            if topic in self.entries:
+            index = self._indexes.get(topic)
+            if index is not None:
                 # Remove from all_entries
-                for entry in self.entries[topic]:
+                for entry in index.all.entries:
                     self.all_entries.pop(entry.id, None)
+                self._resident_entries -= len(index.all)
                 
-                # Clear topic entries
-                self.entries[topic] = []
+                # Clear topic entries and indexes
+                fresh = self._indexes[topic] = _TopicIndex()
+                self.entries[topic] = fresh.all.entries
                 
                 logger.info(f"Cleared all entries for topic {topic}")
+            
+            if self.archive is not None:
+                self.archive.delete_topic(topic)
     
     async def get_statistics(self, topic: Optional[str] = None) -> Dict[str, Any]:
         """
         Get statistics about blackboard usage
         
+        Served from running counters, so the cost does not depend on the
+        number of entries.
+        
         Returns:
             Dictionary with stats like entry counts, active personas, etc.
         """
-        entries = await self.read(topic=topic, limit=10000)
+        if topic:
+            index = self._indexes.get(topic)
+            topic_stats = [index.stats] if index else []
+        else:
+            topic_stats = [index.stats for index in list(self._indexes.values())]
         
-        if not entries:
+        total_entries = sum(stats.total_entries for stats in topic_stats)
+        if not total_entries:
             return {
                 'total_entries': 0,
                 'topics': [],
@@ -268,47 +731,110 @@ class Blackboard:
                 'entry_types': {}
             }
         
-        # Calculate statistics
-        persona_counts = {}
-        entry_type_counts = {}
-        confidence_sum = 0
+        # Combine counters
+        persona_counts: Dict[str, int] = {}
+        entry_type_counts: Dict[str, int] = {}
+        confidence_sum = 0.0
+        starts = []
+        ends = []
         
-        for entry in entries:
-            persona_counts[entry.persona_id] = persona_counts.get(entry.persona_id, 0) + 1
-            entry_type_counts[entry.entry_type.value] = entry_type_counts.get(entry.entry_type.value, 0) + 1
-            confidence_sum += entry.confidence
+        for stats in topic_stats:
+            if not stats.total_entries:
+                continue
+            for persona_id, count in stats.persona_counts.items():
+                persona_counts[persona_id] = persona_counts.get(persona_id, 0) + count
+            for entry_type, count in stats.entry_type_counts.items():
+                entry_type_counts[entry_type] = entry_type_counts.get(entry_type, 0) + count
+            confidence_sum += stats.confidence_sum
+            starts.append(stats.first_timestamp)
+            ends.append(stats.last_timestamp)
         
         return {
-            'total_entries': len(entries),
+            'total_entries': total_entries,
             'topics': list(self.topics),
             'active_personas': list(persona_counts.keys()),
             'persona_activity': persona_counts,
             'entry_types': entry_type_counts,
-            'average_confidence': confidence_sum / len(entries) if entries else 0,
+            'average_confidence': confidence_sum / total_entries,
             'time_range': {
-                'start': min(e.timestamp for e in entries).isoformat() if entries else None,
-                'end': max(e.timestamp for e in entries).isoformat() if entries else None
+                'start': min(starts).isoformat(),
+                'end': max(ends).isoformat()
             }
         }
     
+    def get_retention_stats(self) -> Dict[str, Any]:
+        """Resident size and eviction counters"""
+        stats = {
+            'resident_topics': len(self._indexes),
+            'resident_entries': self._resident_entries,
+            'max_topics': self.max_topics,
+            'max_entries': self.max_entries,
+            'max_entries_per_topic': self.max_entries_per_topic,
+            'evicted_topics': self.evicted_topics,
+            'evicted_entries': self.evicted_entries
+        }
+        if self.archive is not None:
+            stats.update(self.archive.get_stats())
+        return stats
+    
+    def _enforce_retention(self, current_topic: str):
+        """Shed entries and topics beyond the configured limits (called under lock)"""
+        # Trim the topic just written, leaving headroom so trims are not per-post
+        index = self._indexes[current_topic]
+        if self.max_entries_per_topic and len(index.all) > self.max_entries_per_topic:
+            keep = max(1, self.max_entries_per_topic - self.max_entries_per_topic // 10)
+            dropped = index.drop_oldest(len(index.all) - keep)
+            self._release(current_topic, dropped)
+            index.has_archived = index.has_archived or self.archive is not None
+        
+        # Evict whole topics, least recently written first
+        while self._over_limits():
+            victim = next(
+                (t for t in self._topic_activity
+                 if t != current_topic and not self.subscribers.get(t)),
+                None
+            )
+            if victim is None:
+                break
+            self._evict_topic(victim)
+    
+    def _over_limits(self) -> bool:
+        if self.max_topics is not None and len(self._indexes) > self.max_topics:
+            return True
+        if self.max_entries is not None and self._resident_entries > self.max_entries:
+            return True
+        return False
+    
+    def _evict_topic(self, topic: str):
+        """Remove a topic from memory, archiving its entries"""
+        index = self._indexes.pop(topic)
+        self.entries.pop(topic, None)
+        self.topics.discard(topic)
+        self._topic_activity.pop(topic, None)
+        self._release(topic, index.all.entries)
+        self.evicted_topics += 1
+        logger.debug(f"Evicted blackboard topic {topic} ({len(index.all)} entries)")
+    
+    def _release(self, topic: str, entries: List[BlackboardEntry]):
+        """Drop entries from memory, writing them to the archive first"""
+        if self.archive is not None:
+            try:
+                self.archive.store(topic, entries)
+            except Exception as e:
+                logger.error(f"Failed to archive {len(entries)} entries for topic {topic}: {e}")
+        
+        for entry in entries:
+            self.all_entries.pop(entry.id, None)
+        self._resident_entries -= len(entries)
+        self.evicted_entries += len(entries)
+    
     def export_to_json(self, topic: Optional[str] = None) -> str:
         """Export blackboard entries to JSON for persistence or analysis"""
-        entries = asyncio.run(self.read(topic=topic, limit=10000))
+        entries = self._read(topic=topic, limit=10000)
         return json.dumps([e.to_dict() for e in entries], indent=2)
     
     async def import_from_json(self, json_str: str, topic: str):
         """Import entries from JSON"""
         data = json.loads(json_str)
         for entry_data in data:
-            entry = BlackboardEntry(
-                id=entry_data['id'],
-                persona_id=entry_data['persona_id'],
-                timestamp=datetime.fromisoformat(entry_data['timestamp']),
-                entry_type=EntryType(entry_data['entry_type']),
-                content=entry_data['content'],
-                metadata=entry_data.get('metadata', {}),
-                confidence=entry_data.get('confidence', 0.5),
-                references=entry_data.get('references', []),
-                tags=set(entry_data.get('tags', []))
-            )
-            await self.post(topic, entry)
\ No newline at end of file
+            await self.post(topic, BlackboardEntry.from_dict(entry_data))
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Blackboard Archive - On-Disk Storage for Evicted Blackboard Topics
+
+Topics evicted from the in-memory Blackboard are written here so that
+decision trails stay explainable after the entries leave memory. Entries
+are stored one row each in SQLite and read back lazily by topic or id.
+"""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .blackboard import BlackboardEntry
+
+logger = logging.getLogger(__name__)
+
+
+class BlackboardArchive:
+    """
+    SQLite store of archived blackboard entries
+
+    The database file is only created on the first write, so an archive
+    that never receives evictions leaves nothing on disk.
+    """
+
+    def __init__(self, db_path: str = "data/blackboard/blackboard_archive.db"):
+        self.db_path = db_path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use"""
+        if not self._initialized:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+
+        if not self._initialized:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS archived_entries (
+                    id TEXT PRIMARY KEY,
+                    topic TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    data TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_archived_topic_time
+                ON archived_entries(topic, timestamp)
+            """)
+            conn.commit()
+            self._initialized = True
+
+        return conn
+
+    def _exists(self) -> bool:
+        return self._initialized or Path(self.db_path).exists()
+
+    def store(self, topic: str, entries: List[BlackboardEntry]) -> int:
+        """
+        Archive entries for a topic
+
+        Returns:
+            Number of entries written
+        """
+        if not entries:
+            return 0
+
+        rows = [
+            (entry.id, topic, entry.timestamp.isoformat(), json.dumps(entry.to_dict(), default=str))
+            for entry in entries
+        ]
+
+        conn = self._connect()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO archived_entries (id, topic, timestamp, data) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        logger.debug(f"Archived {len(rows)} entries for topic {topic}")
+        return len(rows)
+
+    def load_topic(self, topic: str) -> List[BlackboardEntry]:
+        """Load the archived entries of a topic in chronological order"""
+        if not self._exists():
+            return []
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT data FROM archived_entries WHERE topic = ? ORDER BY timestamp, rowid",
+                (topic,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [BlackboardEntry.from_dict(json.loads(row[0])) for row in rows]
+
+    def get_entry(self, entry_id: str) -> Optional[BlackboardEntry]:
+        """Load a single archived entry by ID"""
+        if not self._exists():
+            return None
+
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT data FROM archived_entries WHERE id = ?", (entry_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        return BlackboardEntry.from_dict(json.loads(row[0])) if row else None
+
+    def delete_topic(self, topic: str) -> int:
+        """Remove every archived entry of a topic"""
+        if not self._exists():
+            return 0
+
+        conn = self._connect()
+        try:
+            cursor = conn.execute("DELETE FROM archived_entries WHERE topic = ?", (topic,))
+            conn.commit()
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry and topic counts held in the archive"""
+        if not self._exists():
+            return {'archived_entries': 0, 'archived_topics': 0}
+
+        conn = self._connect()
+        try:
+            entries, topics = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT topic) FROM archived_entries"
+            ).fetchone()
+        finally:
+            conn.close()
+
+        return {'archived_entries': entries, 'archived_topics': topics}
@@ -15,6 +15,7 @@ import statistics
 
 from .persona import PersonaResponse, PersonaPriority
 from .blackboard import Blackboard, BlackboardEntry, EntryType
+from .recommendation_clustering import RecommendationClusterer
 
 logger = logging.getLogger(__name__)
 
@@ -70,21 +71,48 @@ class ConsensusEngine:
     - Confidence aggregation
     - Conflict resolution
     - Minority opinion tracking
+    - Votes counted per cluster of equivalent recommendations
     """
     
     def __init__(self, 
                  blackboard: Blackboard,
-                 default_method: ConsensusMethod = ConsensusMethod.HYBRID):
+                 default_method: ConsensusMethod = ConsensusMethod.HYBRID,
+                 cluster_threshold: Optional[float] = 0.5):
         """
         Initialize consensus engine
         
         Args:
             blackboard: Shared blackboard for recording consensus
             default_method: Default consensus method to use
+            cluster_threshold: Similarity at which differently worded
+                recommendations count as the same vote (None to group by
+                exact text only)
         """
         self.blackboard = blackboard
         self.default_method = default_method
         self.consensus_history: List[ConsensusResult] = []
+        self.clusterer = (RecommendationClusterer(threshold=cluster_threshold)
+                          if cluster_threshold is not None else None)
+    
+    def _group_recommendations(self, responses: List[PersonaResponse]) -> List[str]:
+        """
+        Vote group of each response
+        
+        Equivalent recommendations are grouped under the wording of the most
+        confident persona in the group. Clusters are seeded in arrival order,
+        so a later response can join a group but never splits or merges the
+        groups of responses already received; is_decided() relies on that.
+        """
+        recommendations = [r.recommendation for r in responses]
+        if self.clusterer is None:
+            return recommendations
+        
+        leaders = self.clusterer.cluster(recommendations)
+        wording: Dict[int, PersonaResponse] = {}
+        for response, leader in zip(responses, leaders):
+            if leader not in wording or response.confidence > wording[leader].confidence:
+                wording[leader] = response
+        return [wording[leader].recommendation for leader in leaders]
         
     async def reach_consensus(self,
                              topic: str,
@@ -103,6 +131,26 @@ class ConsensusEngine:
         Returns:
             ConsensusResult with final decision
         """
+        result = await self.provisional_consensus(responses, weights, method)
+        
+        # Record to blackboard
+        await self._record_consensus(topic, result)
+        
+        # Store in history
+        self.consensus_history.append(result)
+        
+        return result
+    
+    async def provisional_consensus(self,
+                                    responses: List[PersonaResponse],
+                                    weights: Optional[Dict[str, float]] = None,
+                                    method: Optional[ConsensusMethod] = None) -> ConsensusResult:
+        """
+        Compute consensus without recording it to the blackboard or history
+        
+        Used to keep a running view of the decision while personas are
+        still responding.
+        """
         if not responses:
             raise ValueError("No responses to process for consensus")
         
@@ -114,23 +162,84 @@ class ConsensusEngine:
         
         # Apply consensus method
         if method == ConsensusMethod.WEIGHTED_MAJORITY:
-            result = await self._weighted_majority_consensus(responses, weights)
+            return await self._weighted_majority_consensus(responses, weights)
         elif method == ConsensusMethod.SUPERMAJORITY:
-            result = await self._supermajority_consensus(responses)
+            return await self._supermajority_consensus(responses)
         elif method == ConsensusMethod.UNANIMOUS:
-            result = await self._unanimous_consensus(responses)
+            return await self._unanimous_consensus(responses)
         elif method == ConsensusMethod.CONFIDENCE_WEIGHTED:
-            result = await self._confidence_weighted_consensus(responses)
+            return await self._confidence_weighted_consensus(responses)
         else:  # HYBRID
-            result = await self._hybrid_consensus(responses, weights)
+            return await self._hybrid_consensus(responses, weights)
+    
+    def is_decided(self,
+                   responses: List[PersonaResponse],
+                   weights: Dict[str, float],
+                   pending_expertise: List[float],
+                   method: Optional[ConsensusMethod] = None) -> bool:
+        """
+        Check whether the leading recommendation can still be overturned
         
-        # Record to blackboard
-        await self._record_consensus(topic, result)
+        Args:
+            responses: Responses received so far
+            weights: Expertise weights for the received responses
+            pending_expertise: Upper bound on the expertise weight of each
+                persona that has not answered yet
+            method: Consensus method that will be applied
+            
+        Returns:
+            True if no combination of pending responses can change the decision
+        """
+        if not responses:
+            return False
+        if not pending_expertise:
+            return True
         
-        # Store in history
-        self.consensus_history.append(result)
+        method = method or self.default_method
+        if method == ConsensusMethod.UNANIMOUS:
+            # Any pending dissent changes the outcome
+            return False
+        
+        # Vote weight each side would get under the chosen method. Confidence
+        # is at most 1.0, so pending personas are bounded by their expertise.
+        counts: Dict[str, int] = {}
+        votes: Dict[str, float] = {}
+        for response, rec in zip(responses, self._group_recommendations(responses)):
+            if method == ConsensusMethod.WEIGHTED_MAJORITY:
+                vote = weights.get(response.persona_id, 1.0) * response.confidence
+            elif method == ConsensusMethod.HYBRID:
+                combined = (weights.get(response.persona_id, 1.0) + response.confidence) / 2
+                vote = combined * response.confidence
+            elif method == ConsensusMethod.CONFIDENCE_WEIGHTED:
+                vote = response.confidence * response.confidence
+            else:  # SUPERMAJORITY falls back to unit weights
+                vote = response.confidence
+            counts[rec] = counts.get(rec, 0) + 1
+            votes[rec] = votes.get(rec, 0.0) + vote
         
-        return result
+        if method == ConsensusMethod.WEIGHTED_MAJORITY:
+            pending_votes = sum(pending_expertise)
+        elif method == ConsensusMethod.HYBRID:
+            pending_votes = sum((w + 1.0) / 2 for w in pending_expertise)
+        else:
+            pending_votes = float(len(pending_expertise))
+        
+        ranked_votes = sorted(votes.items(), key=lambda x: x[1], reverse=True)
+        leader, leader_votes = ranked_votes[0]
+        runner_up_votes = ranked_votes[1][1] if len(ranked_votes) > 1 else 0.0
+        if leader_votes - runner_up_votes <= pending_votes:
+            return False
+        
+        if method in (ConsensusMethod.HYBRID, ConsensusMethod.SUPERMAJORITY):
+            # These methods also decide by head count before falling back to votes
+            ranked_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+            if ranked_counts[0][0] != leader:
+                return False
+            runner_up_count = ranked_counts[1][1] if len(ranked_counts) > 1 else 0
+            if ranked_counts[0][1] - runner_up_count <= len(pending_expertise):
+                return False
+        
+        return True
     
     async def _weighted_majority_consensus(self, 
                                           responses: List[PersonaResponse],
@@ -140,19 +249,20 @@ class ConsensusEngine:
         """
         # Group recommendations
         recommendation_votes = {}
-        for response in responses:
-            rec = response.recommendation
+        for response, rec in zip(responses, self._group_recommendations(responses)):
             if rec not in recommendation_votes:
                 recommendation_votes[rec] = {
                     'weight': 0,
                     'supporters': [],
-                    'confidence_sum': 0
+                    'confidence_sum': 0,
+                    'wording': {}
                 }
             
             weight = weights.get(response.persona_id, 1.0) * response.confidence
             recommendation_votes[rec]['weight'] += weight
             recommendation_votes[rec]['supporters'].append(response.persona_id)
             recommendation_votes[rec]['confidence_sum'] += response.confidence
+            recommendation_votes[rec]['wording'][response.persona_id] = response.recommendation
         
         # Find winner
         winner = max(recommendation_votes.items(), key=lambda x: x[1]['weight'])
@@ -170,7 +280,7 @@ class ConsensusEngine:
             if rec != decision:
                 for persona in data['supporters']:
                     dissenters.append(persona)
-                    alternatives[persona] = rec
+                    alternatives[persona] = data['wording'][persona]
         
         # Calculate overall confidence
         avg_confidence = support_data['confidence_sum'] / len(support_data['supporters'])
@@ -212,8 +322,7 @@ class ConsensusEngine:
         """
         # Count recommendations
         recommendation_counts = {}
-        for response in responses:
-            rec = response.recommendation
+        for response, rec in zip(responses, self._group_recommendations(responses)):
             if rec not in recommendation_counts:
                 recommendation_counts[rec] = []
             recommendation_counts[rec].append(response.persona_id)
@@ -248,7 +357,7 @@ class ConsensusEngine:
         """
         Require unanimous agreement
         """
-        recommendations = set(r.recommendation for r in responses)
+        recommendations = set(self._group_recommendations(responses))
         
         if len(recommendations) == 1:
             # Unanimous!
@@ -283,14 +392,14 @@ class ConsensusEngine:
         Hybrid approach combining multiple methods
         """
         # Try unanimous first
-        recommendations = set(r.recommendation for r in responses)
-        if len(recommendations) == 1:
+        groups = self._group_recommendations(responses)
+        if len(set(groups)) == 1:
             return await self._unanimous_consensus(responses)
         
         # Check for supermajority
         rec_counts = {}
-        for r in responses:
-            rec_counts[r.recommendation] = rec_counts.get(r.recommendation, 0) + 1
+        for rec in groups:
+            rec_counts[rec] = rec_counts.get(rec, 0) + 1
         
         max_count = max(rec_counts.values())
         if max_count >= len(responses) * 0.66:
@@ -0,0 +1,309 @@
+"""
+Deliberation Result Cache - Reuse Council Decisions for Repeated Questions
+
+Caches DeliberationResults keyed on a normalized query plus a stable
+fingerprint of the request context, so near-identical questions asked from
+several places are answered without re-running the council.
+
+Backed by the Redis CacheManager when available, with an in-process LRU
+fallback. Entries expire after a TTL and are invalidated when the memory
+system or knowledge graph changes for their topic.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Any, Set
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .orchestrator import DeliberationRequest, DeliberationResult
+    from ..database.redis_cache import CacheManager
+
+logger = logging.getLogger(__name__)
+
+
+# Words that do not change the meaning of a question for caching purposes
+STOP_WORDS = {
+    'a', 'an', 'the', 'is', 'are', 'be', 'to', 'of', 'in', 'on', 'for', 'at',
+    'by', 'with', 'from', 'and', 'or', 'it', 'this', 'that', 'we', 'our', 'us',
+    'i', 'you', 'do', 'does', 'should', 'would', 'could', 'can', 'will', 'please'
+}
+
+# Context keys that vary per call without changing the question
+VOLATILE_CONTEXT_KEYS = {
+    'timestamp', 'request_id', 'session_id', 'user_id', 'trace_id',
+    'remembered_experiences', 'memory_context_available'
+}
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, strip punctuation and filler words, collapse whitespace"""
+    words = re.findall(r'[a-z0-9_]+', query.lower())
+    return ' '.join(w for w in words if w not in STOP_WORDS)
+
+
+def context_fingerprint(context: Dict[str, Any],
+                        context_keys: Optional[Iterable[str]] = None) -> str:
+    """
+    Stable hash of the context keys that affect a deliberation
+
+    Args:
+        context: Request context
+        context_keys: Only fingerprint these keys (default: all non-volatile keys)
+    """
+    if context_keys is not None:
+        allowed = set(context_keys)
+        relevant = {k: v for k, v in context.items() if k in allowed}
+    else:
+        relevant = {k: v for k, v in context.items() if k not in VOLATILE_CONTEXT_KEYS}
+
+    payload = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+@dataclass
+class _IndexEntry:
+    """Bookkeeping for a cached deliberation"""
+    topic: str
+    terms: Set[str]
+    expires_at: float
+
+
+class DeliberationCache:
+    """
+    Cache of deliberation results in front of Orchestrator.deliberate
+
+    Features:
+    - Query normalization and context fingerprinting
+    - Redis storage via CacheManager, in-process LRU when Redis is absent
+    - TTL expiry
+    - Invalidation by topic or by concept terms
+    - Hit/miss statistics
+    """
+
+    def __init__(self,
+                 cache_manager: Optional['CacheManager'] = None,
+                 ttl: int = 900,
+                 max_entries: int = 512,
+                 context_keys: Optional[Iterable[str]] = None):
+        """
+        Initialize the deliberation cache
+
+        Args:
+            cache_manager: Redis-backed cache manager (None for in-process only)
+            ttl: Seconds a cached result stays valid
+            max_entries: Maximum entries tracked in process
+            context_keys: Context keys included in the fingerprint (default: all
+                non-volatile keys)
+        """
+        self.cache_manager = cache_manager
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.context_keys = list(context_keys) if context_keys is not None else None
+
+        self._redis_available = False
+        self._initialized = False
+
+        # In-process storage: key -> result (used when Redis is absent)
+        self._local: "OrderedDict[str, DeliberationResult]" = OrderedDict()
+        # Index of every cached key, for invalidation and expiry
+        self._index: "OrderedDict[str, _IndexEntry]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    async def initialize(self):
+        """Connect to Redis if a cache manager was given"""
+        if self._initialized:
+            return
+        self._initialized = True
+
+        if self.cache_manager is None:
+            return
+
+        try:
+            await self.cache_manager.initialize()
+            self._redis_available = True
+            logger.info("Deliberation cache using Redis backend")
+        except Exception as e:
+            logger.warning(f"Redis unavailable for deliberation cache, using in-process LRU: {e}")
+            self._redis_available = False
+
+    @property
+    def backend(self) -> str:
+        """Name of the active storage backend"""
+        return "redis" if self._redis_available else "memory"
+
+    def make_key(self, request: "DeliberationRequest") -> str:
+        """
+        Build the cache key for a request
+        
+        Keys are prefixed with a hash of the topic so a whole topic can be
+        invalidated by pattern across processes sharing Redis.
+        """
+        personas = ','.join(sorted(request.required_personas or []))
+        method = request.consensus_method.value if request.consensus_method else ''
+        parts = [
+            normalize_query(request.query),
+            context_fingerprint(request.context, self.context_keys),
+            personas,
+            method
+        ]
+        digest = hashlib.sha256('|'.join(parts).encode()).hexdigest()[:32]
+        return f"{self._topic_hash(self._topic(request))}:{digest}"
+
+    async def get(self, request: "DeliberationRequest") -> Optional["DeliberationResult"]:
+        """
+        Look up a cached result for a request
+
+        Returns:
+            A copy of the cached DeliberationResult marked as a cache hit, or None
+        """
+        await self.initialize()
+        key = self.make_key(request)
+
+        if self._redis_available:
+            # Redis owns expiry and may hold entries written by other workers
+            result = await self.cache_manager.get_cached_deliberation(key)
+        else:
+            result = None
+            entry = self._index.get(key)
+            if entry is not None and entry.expires_at <= time.time():
+                await self._drop(key)
+            elif entry is not None:
+                result = self._local.get(key)
+                self._local.move_to_end(key)
+
+        if result is None:
+            self.misses += 1
+            return None
+
+        if key in self._index:
+            self._index.move_to_end(key)
+        self.hits += 1
+        return replace(
+            result,
+            request=request,
+            statistics={**result.statistics, 'cache_hit': True}
+        )
+
+    async def set(self, request: "DeliberationRequest", result: "DeliberationResult"):
+        """Store a deliberation result for a request"""
+        await self.initialize()
+        key = self.make_key(request)
+
+        if self._redis_available:
+            stored = await self.cache_manager.cache_deliberation(key, result, ttl=self.ttl)
+            if not stored:
+                return
+        else:
+            self._local[key] = result
+            self._local.move_to_end(key)
+
+        self._index[key] = _IndexEntry(
+            topic=self._topic(request),
+            terms=set(normalize_query(request.query).split()),
+            expires_at=time.time() + self.ttl
+        )
+        self._index.move_to_end(key)
+        self.sets += 1
+
+        while len(self._index) > self.max_entries:
+            oldest_key = next(iter(self._index))
+            await self._drop(oldest_key)
+            self.evictions += 1
+
+    async def invalidate_topic(self, topic: Optional[str]) -> int:
+        """
+        Invalidate every cached result for a topic
+
+        Returns:
+            Number of entries removed
+        """
+        topic = topic or "general"
+        keys = [k for k, e in self._index.items() if e.topic == topic]
+        if self._redis_available:
+            await self.cache_manager.invalidate_deliberation_topic(self._topic_hash(topic))
+        return await self._invalidate(keys)
+
+    async def invalidate_terms(self, terms: Iterable[str]) -> int:
+        """
+        Invalidate cached results whose query mentions any of the terms
+
+        Used when a knowledge graph concept changes.
+
+        Returns:
+            Number of entries removed
+        """
+        normalized: Set[str] = set()
+        for term in terms:
+            normalized.update(normalize_query(term).split())
+        if not normalized:
+            return 0
+
+        keys = [k for k, e in self._index.items() if e.terms & normalized]
+        return await self._invalidate(keys)
+
+    async def clear(self):
+        """Remove every cached result"""
+        await self._invalidate(list(self._index.keys()))
+        if self._redis_available:
+            await self.cache_manager.invalidate_deliberation_topic("*")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics for health reporting"""
+        total = self.hits + self.misses
+        return {
+            'backend': self.backend,
+            'entries': len(self._index),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total > 0 else 0.0,
+            'sets': self.sets,
+            'invalidations': self.invalidations,
+            'evictions': self.evictions,
+            'ttl': self.ttl
+        }
+
+    async def _invalidate(self, keys: List[str]) -> int:
+        for key in keys:
+            await self._drop(key)
+        self.invalidations += len(keys)
+        if keys:
+            logger.debug(f"Invalidated {len(keys)} cached deliberations")
+        return len(keys)
+
+    async def _drop(self, key: str):
+        self._index.pop(key, None)
+        self._local.pop(key, None)
+        if self._redis_available:
+            await self.cache_manager.invalidate_deliberation(key)
+
+    @staticmethod
+    def _topic(request: "DeliberationRequest") -> str:
+        return request.topic or "general"
+
+    @staticmethod
+    def _topic_hash(topic: str) -> str:
+        return hashlib.sha256(topic.encode()).hexdigest()[:12]
+
+
+# Global instance
+_deliberation_cache: Optional[DeliberationCache] = None
+
+
+def get_deliberation_cache() -> DeliberationCache:
+    """Get the global deliberation cache backed by the global cache manager"""
+    global _deliberation_cache
+    if _deliberation_cache is None:
+        from ..database.redis_cache import get_cache_manager
+        _deliberation_cache = DeliberationCache(cache_manager=get_cache_manager())
+    return _deliberation_cache
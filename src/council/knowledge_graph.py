@@ -5,6 +5,7 @@ A graph-based knowledge representation system that models relationships
 between concepts, entities, and experiences using nodes and edges.
 """
 
+import asyncio
 import json
 import sqlite3
 import networkx as nx
@@ -16,6 +17,8 @@ import numpy as np
 from collections import defaultdict
 import hashlib
 
+from ..database.lazy_loading import PartitionLoader
+
 
 class NodeType(Enum):
     """Types of nodes in the knowledge graph"""
@@ -110,15 +113,31 @@ class KnowledgeGraph:
     """
     Graph-based knowledge representation system for understanding
     relationships between all aspects of life and work.
+    
+    With lazy=True nothing is loaded at startup. A node's neighbourhood
+    (the node, its edges and their endpoints) is loaded on first access,
+    a background warm-up loads the rest, and whole-graph algorithms wait
+    for the warm-up to finish.
     """
     
-    def __init__(self, db_path: str = "optimus_knowledge.db"):
+    _NODE_COLUMNS = 'id, name, node_type, attributes, created_at, updated_at, importance, personas_relevance'
+    _EDGE_COLUMNS = 'id, source_id, target_id, edge_type, weight, attributes, created_at, confidence'
+    
+    def __init__(self, db_path: str = "optimus_knowledge.db", lazy: bool = False):
         self.db_path = db_path
         self.graph = nx.DiGraph()  # Directed graph
         self.nodes: Dict[str, Node] = {}
         self.edges: Dict[str, Edge] = {}
+        self._partitions: Optional[PartitionLoader] = None
         self._init_database()
-        self._load_graph()
+        if lazy:
+            self._partitions = PartitionLoader(
+                f"knowledge_graph:{db_path}",
+                load=self._load_neighbourhoods,
+                list_partitions=self._list_nodes
+            )
+        else:
+            self._load_graph()
     
     def _init_database(self):
         """Initialize SQLite database for persistent storage"""
@@ -170,8 +189,19 @@ class KnowledgeGraph:
         cursor = conn.cursor()
         
         # Load nodes
-        cursor.execute('SELECT * FROM nodes')
-        for row in cursor.fetchall():
+        cursor.execute(f'SELECT {self._NODE_COLUMNS} FROM nodes')
+        self._add_node_rows(cursor.fetchall())
+        
+        # Load edges
+        cursor.execute(f'SELECT {self._EDGE_COLUMNS} FROM edges')
+        self._add_edge_rows(cursor.fetchall())
+        
+        conn.close()
+    
+    def _add_node_rows(self, rows: List[Tuple]):
+        for row in rows:
+            if row[0] in self.nodes:
+                continue
             node = Node(
                 id=row[0],
                 name=row[1],
@@ -184,10 +214,11 @@ class KnowledgeGraph:
             )
             self.nodes[node.id] = node
             self.graph.add_node(node.id, node=node)
-        
-        # Load edges
-        cursor.execute('SELECT * FROM edges')
-        for row in cursor.fetchall():
+    
+    def _add_edge_rows(self, rows: List[Tuple]):
+        for row in rows:
+            if row[0] in self.edges:
+                continue
             edge = Edge(
                 id=row[0],
                 source_id=row[1],
@@ -201,8 +232,64 @@ class KnowledgeGraph:
             self.edges[edge.id] = edge
             self.graph.add_edge(edge.source_id, edge.target_id, 
                               edge_id=edge.id, edge=edge, weight=edge.weight)
-        
-        conn.close()
+    
+    def _fetch_neighbourhoods(self, node_ids: List[str]) -> Tuple[List[Tuple], List[Tuple]]:
+        """Rows of the given nodes, the edges touching them and the other endpoints"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            placeholders = ','.join('?' * len(node_ids))
+            edge_rows = conn.execute(
+                f'SELECT {self._EDGE_COLUMNS} FROM edges '
+                f'WHERE source_id IN ({placeholders}) OR target_id IN ({placeholders})',
+                node_ids + node_ids
+            ).fetchall()
+            
+            wanted = set(node_ids)
+            for row in edge_rows:
+                wanted.update((row[1], row[2]))
+            wanted = [node_id for node_id in wanted if node_id not in self.nodes]
+            
+            node_rows = []
+            for start in range(0, len(wanted), 500):
+                chunk = wanted[start:start + 500]
+                node_rows.extend(conn.execute(
+                    f"SELECT {self._NODE_COLUMNS} FROM nodes WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall())
+            return node_rows, edge_rows
+        finally:
+            conn.close()
+    
+    async def _load_neighbourhoods(self, node_ids: List[str]):
+        """Page in the neighbourhoods of several nodes"""
+        node_rows, edge_rows = await asyncio.to_thread(self._fetch_neighbourhoods, node_ids)
+        self._add_node_rows(node_rows)
+        self._add_edge_rows([row for row in edge_rows if row[1] in self.nodes and row[2] in self.nodes])
+    
+    async def _list_nodes(self) -> List[str]:
+        """Every stored node id, most important first"""
+        def fetch():
+            conn = sqlite3.connect(self.db_path)
+            try:
+                return [row[0] for row in conn.execute('SELECT id FROM nodes ORDER BY importance DESC')]
+            finally:
+                conn.close()
+        return await asyncio.to_thread(fetch)
+    
+    async def _ensure_loaded(self, node_ids: Optional[List[str]] = None):
+        """In lazy mode, load the neighbourhoods of some nodes (or the whole graph)"""
+        if self._partitions is None:
+            return
+        if node_ids is None:
+            await self._partitions.ensure_all()
+        else:
+            await self._partitions.ensure(node_ids)
+    
+    def get_loading_status(self) -> Dict[str, Any]:
+        """Lazy loading progress (always ready when loaded eagerly)"""
+        if self._partitions is None:
+            return {'state': 'ready', 'lazy': False}
+        return {**self._partitions.get_stats(), 'lazy': True}
     
     async def add_node(self,
                       name: str,
@@ -215,6 +302,7 @@ class KnowledgeGraph:
         node_id = hashlib.md5(f"{name}{node_type.value}".encode()).hexdigest()[:16]
         
         # Check if node already exists
+        await self._ensure_loaded([node_id])
         if node_id in self.nodes:
             return self.nodes[node_id]
         
@@ -246,6 +334,7 @@ class KnowledgeGraph:
         """Add an edge between two nodes"""
         
         # Verify nodes exist
+        await self._ensure_loaded([source_id, target_id])
         if source_id not in self.nodes or target_id not in self.nodes:
             raise ValueError(f"Both nodes must exist before creating edge")
         
@@ -290,6 +379,7 @@ class KnowledgeGraph:
                           edge_types: Optional[List[EdgeType]] = None) -> Dict[str, Any]:
         """Find all nodes related to a given node within max_depth"""
         
+        await self._ensure_loaded([node_id])
         if node_id not in self.nodes:
             return {}
         
@@ -308,6 +398,10 @@ class KnowledgeGraph:
             visited.add(current_id)
             related['nodes'].append(self.nodes[current_id])
             
+            # Page in the whole frontier at once
+            if self._partitions is not None and not self._partitions.is_loaded(current_id):
+                await self._partitions.ensure([current_id] + [queued for queued, _ in queue])
+            
             # Get neighbors
             for neighbor_id in self.graph.neighbors(current_id):
                 edge_data = self.graph[current_id][neighbor_id]
@@ -330,6 +424,7 @@ class KnowledgeGraph:
                        edge_types: Optional[List[EdgeType]] = None) -> List[Node]:
         """Find shortest path between two nodes"""
         
+        await self._ensure_loaded()
         if source_id not in self.nodes or target_id not in self.nodes:
             return []
         
@@ -352,6 +447,7 @@ class KnowledgeGraph:
         Simulate spreading activation from seed nodes.
         This helps find conceptually related nodes.
         """
+        await self._ensure_loaded()
         
         # Initialize activation levels
         for node_id in self.nodes:
@@ -399,6 +495,7 @@ class KnowledgeGraph:
         Infer new relationships based on existing graph structure.
         Uses transitivity and pattern matching.
         """
+        await self._ensure_loaded()
         
         new_edges = []
         
@@ -432,6 +529,7 @@ class KnowledgeGraph:
                           edge_types: Optional[List[EdgeType]] = None,
                           min_importance: float = 0.0) -> nx.DiGraph:
         """Get a subgraph filtered by node/edge types and importance"""
+        await self._ensure_loaded()
         
         # Filter nodes
         filtered_nodes = []
@@ -458,6 +556,7 @@ class KnowledgeGraph:
     async def calculate_centrality(self,
                                  centrality_type: str = 'betweenness') -> Dict[str, float]:
         """Calculate node centrality to find important nodes"""
+        await self._ensure_loaded()
         
         if centrality_type == 'betweenness':
             centrality = nx.betweenness_centrality(self.graph)
@@ -485,6 +584,7 @@ class KnowledgeGraph:
     
     async def find_communities(self) -> List[Set[str]]:
         """Find communities/clusters in the graph"""
+        await self._ensure_loaded()
         
         # Convert to undirected for community detection
         undirected = self.graph.to_undirected()
@@ -16,6 +16,9 @@ import hashlib
 import numpy as np
 from collections import defaultdict
 
+from ..database.lazy_loading import PartitionLoader
+from ..database.memory_columns import ColumnarMemoryStore, tokenize
+
 @dataclass
 class Memory:
     """A single memory unit"""
@@ -79,14 +82,33 @@ class MemorySystem:
     """
     Manages long-term memory for all personas with persistence,
     association, and retrieval capabilities.
+    
+    With lazy=True no memories are read at startup. A persona's memories
+    are loaded on its first store or recall, and the rest are loaded by a
+    background warm-up, most recently active personas first.
     """
     
-    def __init__(self, db_path: str = "optimus_memory.db"):
+    _COLUMNS = '''
+        id, persona_id, content, context, timestamp, importance, emotional_valence,
+        tags, associations, access_count, last_accessed, decay_rate
+    '''
+    
+    def __init__(self, db_path: str = "optimus_memory.db", lazy: bool = False):
         self.db_path = db_path
         self.memories: Dict[str, List[Memory]] = defaultdict(list)
         self.memory_index: Dict[str, Memory] = {}
+        # Per-persona columns for vectorized recall scoring
+        self._stores: Dict[str, ColumnarMemoryStore] = defaultdict(ColumnarMemoryStore)
+        self._partitions: Optional[PartitionLoader] = None
         self._init_database()
-        self._load_memories()
+        if lazy:
+            self._partitions = PartitionLoader(
+                f"memory_system:{Path(db_path).name}",
+                load=self._load_personas,
+                list_partitions=self._list_personas
+            )
+        else:
+            self._load_memories()
         
     def _init_database(self):
         """Initialize SQLite database for persistent storage"""
@@ -142,10 +164,16 @@ class MemorySystem:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        cursor.execute('SELECT * FROM memories')
-        rows = cursor.fetchall()
+        cursor.execute(f'SELECT {self._COLUMNS} FROM memories')
+        self._add_rows(cursor.fetchall())
         
+        conn.close()
+    
+    def _add_rows(self, rows: List[Tuple]):
+        """Turn memory rows into Memory objects and index them"""
         for row in rows:
+            if row[0] in self.memory_index:
+                continue
             memory = Memory(
                 id=row[0],
                 persona_id=row[1],
@@ -163,8 +191,47 @@ class MemorySystem:
             
             self.memories[memory.persona_id].append(memory)
             self.memory_index[memory.id] = memory
-        
-        conn.close()
+            self._stores[memory.persona_id].add(memory)
+    
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+    
+    async def _list_personas(self) -> List[str]:
+        """Personas with stored memories, most recently active first"""
+        rows = await asyncio.to_thread(
+            self._query,
+            'SELECT persona_id FROM memories GROUP BY persona_id ORDER BY MAX(timestamp) DESC'
+        )
+        return [row[0] for row in rows]
+    
+    async def _load_personas(self, persona_ids: List[str]):
+        """Page in the memory sets of several personas"""
+        placeholders = ','.join('?' * len(persona_ids))
+        rows = await asyncio.to_thread(
+            self._query,
+            f'SELECT {self._COLUMNS} FROM memories WHERE persona_id IN ({placeholders}) ORDER BY rowid',
+            tuple(persona_ids)
+        )
+        self._add_rows(rows)
+    
+    async def _ensure_loaded(self, persona_id: Optional[str] = None):
+        """In lazy mode, load one persona's memories (or every persona's)"""
+        if self._partitions is None:
+            return
+        if persona_id is None:
+            await self._partitions.ensure_all()
+        else:
+            await self._partitions.ensure([persona_id])
+    
+    def get_loading_status(self) -> Dict[str, Any]:
+        """Lazy loading progress (always ready when loaded eagerly)"""
+        if self._partitions is None:
+            return {'state': 'ready', 'lazy': False}
+        return {**self._partitions.get_stats(), 'lazy': True}
     
     async def store_memory(self, 
                           persona_id: str,
@@ -174,6 +241,7 @@ class MemorySystem:
                           emotional_valence: float = 0.0,
                           tags: Optional[Set[str]] = None) -> Memory:
         """Store a new memory for a persona"""
+        await self._ensure_loaded(persona_id)
         
         # Generate memory ID
         memory_id = hashlib.md5(
@@ -200,6 +268,7 @@ class MemorySystem:
         # Store in memory
         self.memories[persona_id].append(memory)
         self.memory_index[memory_id] = memory
+        self._stores[persona_id].add(memory)
         
         # Persist to database
         await self._persist_memory(memory)
@@ -216,22 +285,20 @@ class MemorySystem:
                     context: Dict[str, Any],
                     limit: int = 10) -> List[Memory]:
         """Recall relevant memories for a persona"""
+        await self._ensure_loaded(persona_id)
         
-        persona_memories = self.memories.get(persona_id, [])
-        if not persona_memories:
+        store = self._stores.get(persona_id)
+        if not store:
             return []
         
-        # Calculate relevance for each memory
-        scored_memories = []
-        for memory in persona_memories:
-            relevance = memory.calculate_relevance(query, context)
-            scored_memories.append((relevance, memory))
-        
-        # Sort by relevance and take top memories
-        scored_memories.sort(key=lambda x: x[0], reverse=True)
-        relevant_memories = [m for _, m in scored_memories[:limit]]
+        # Score every memory at once (same formula as Memory.calculate_relevance)
+        relevance = self._score_memories(store, query, context)
+        relevant_memories = [
+            self.memory_index[memory_id] for memory_id, _ in store.top_k(relevance, limit)
+        ]
         
         # Update access counts
+        store.record_access([memory.id for memory in relevant_memories])
         for memory in relevant_memories:
             memory.access_count += 1
             memory.last_accessed = datetime.now()
@@ -239,11 +306,37 @@ class MemorySystem:
         
         return relevant_memories
     
+    def _score_memories(self,
+                        store: ColumnarMemoryStore,
+                        query: str,
+                        context: Dict[str, Any]) -> np.ndarray:
+        """Relevance of every memory in a store to a query"""
+        query_words = tokenize(query)
+        
+        # Text similarity
+        overlap = store.term_overlap(query_words) / max(len(query_words), 1)
+        relevance = store.column('importance') + overlap * 0.3
+        
+        # Recency bonus
+        recency_factor = np.maximum(0, 1 - store.age_days() * store.column('decay_rate'))
+        relevance = relevance * recency_factor
+        
+        # Access frequency bonus
+        relevance += np.minimum(store.column('access_count') * 0.01, 0.2)
+        
+        # Context similarity
+        if context:
+            shared_keys, _ = store.context_overlap(context)
+            relevance += shared_keys * 0.05
+        
+        return np.minimum(1.0, relevance)
+    
     async def consolidate_memories(self, persona_id: str):
         """
         Consolidate similar memories to prevent memory bloat.
         Simulates how humans compress and generalize experiences.
         """
+        await self._ensure_loaded(persona_id)
         persona_memories = self.memories.get(persona_id, [])
         if len(persona_memories) < 50:  # Don't consolidate until enough memories
             return
@@ -278,6 +371,7 @@ class MemorySystem:
             # Mark original memories for gradual decay
             for memory in cluster:
                 memory.decay_rate *= 2  # Faster decay for consolidated memories
+                self._stores[persona_id].update(memory.id, decay_rate=memory.decay_rate)
     
     async def _find_associations(self, 
                                 memory: Memory,
@@ -431,6 +525,7 @@ class MemorySystem:
     
     async def forget_gradually(self):
         """Simulate gradual forgetting of less important memories"""
+        await self._ensure_loaded()
         for persona_id, memories in self.memories.items():
             for memory in memories:
                 # Reduce importance based on decay rate
@@ -442,11 +537,13 @@ class MemorySystem:
                     decay_factor *= 2
                 
                 memory.importance = max(0, memory.importance - decay_factor)
+                self._stores[persona_id].update(memory.id, importance=memory.importance)
                 
                 # Remove memories that have become completely irrelevant
                 if memory.importance < 0.01:
                     self.memories[persona_id].remove(memory)
                     del self.memory_index[memory.id]
+                    self._stores[persona_id].remove(memory.id)
                     await self._delete_memory(memory.id)
     
     async def _delete_memory(self, memory_id: str):
@@ -0,0 +1,307 @@
+"""
+Memory Embeddings - Local Vector Recall for the Persona Memory System
+
+Provides an offline text embedding model and an approximate nearest-neighbour
+index over NumPy arrays, so memories can be recalled by meaning without a
+network service or a vector database.
+
+The embedder uses signed feature hashing of word unigrams and bigrams, which
+needs no training and gives stable vectors across processes. The index is an
+inverted-file (IVF) index: vectors are clustered with spherical k-means and a
+query only scores the vectors in its closest clusters.
+"""
+
+import hashlib
+import logging
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+@lru_cache(maxsize=65536)
+def _feature_slot(feature: str, dim: int) -> Tuple[int, float]:
+    """Stable bucket and sign for a hashed feature"""
+    digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+    value = int.from_bytes(digest, 'little')
+    return value % dim, 1.0 if (value >> 63) & 1 else -1.0
+
+
+class HashingEmbedder:
+    """
+    Offline text embedder based on signed feature hashing
+
+    Word unigrams and bigrams are hashed into a fixed number of dimensions
+    with sublinear term-frequency weighting, and vectors are L2-normalized
+    so that a dot product is the cosine similarity.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def tokenize(self, text: str) -> List[str]:
+        return _TOKEN_PATTERN.findall(text.lower())
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a single text into a unit-length float32 vector"""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        tokens = self.tokenize(text)
+
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for first, second in zip(tokens, tokens[1:]):
+            bigram = f"{first} {second}"
+            counts[bigram] = counts.get(bigram, 0) + 1
+
+        for feature, count in counts.items():
+            slot, sign = _feature_slot(feature, self.dim)
+            vector[slot] += sign * (1.0 + np.log(count))
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def embed_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed several texts into a (len(texts), dim) matrix"""
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack([self.embed(text) for text in texts])
+
+
+class VectorIndex:
+    """
+    Approximate nearest-neighbour index over unit vectors
+
+    Small indexes are searched exhaustively. Once ``train_threshold`` vectors
+    are stored the index clusters them and searches only the ``nprobe``
+    nearest clusters. Vectors added after training are assigned to their
+    nearest centroid, and the clustering is retrained when the index has
+    doubled in size since it was last trained.
+    """
+
+    def __init__(self,
+                 dim: int = 256,
+                 nprobe: int = 8,
+                 train_threshold: int = 4096,
+                 kmeans_iterations: int = 10):
+        self.dim = dim
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.kmeans_iterations = kmeans_iterations
+
+        self._vectors = np.zeros((1024, dim), dtype=np.float32)
+        self._alive = np.zeros(1024, dtype=bool)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}  # id -> row
+
+        # IVF structures, set once trained
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(1024, dtype=np.int32)
+        self._lists: List[List[int]] = []
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._rows
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, item_id: str, vector: np.ndarray):
+        """Add or replace a single vector"""
+        self.add_batch([item_id], vector.reshape(1, -1))
+
+    def add_batch(self, item_ids: Sequence[str], vectors: np.ndarray):
+        """Add or replace several vectors"""
+        if len(item_ids) == 0:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(item_ids), self.dim)
+
+        for item_id in item_ids:
+            if item_id in self._rows:
+                self.remove(item_id)
+
+        start = len(self._ids)
+        self._ensure_capacity(start + len(item_ids))
+        end = start + len(item_ids)
+
+        self._vectors[start:end] = vectors
+        self._alive[start:end] = True
+        for offset, item_id in enumerate(item_ids):
+            self._ids.append(item_id)
+            self._rows[item_id] = start + offset
+
+        if self.is_trained:
+            assignments = np.argmax(vectors @ self._centroids.T, axis=1)
+            self._assignments[start:end] = assignments
+            for row, cluster in zip(range(start, end), assignments):
+                self._lists[cluster].append(row)
+
+        if len(self) >= self.train_threshold and len(self) >= 2 * self._trained_size:
+            self.train()
+
+    def remove(self, item_id: str) -> bool:
+        """Remove a vector; its row is skipped until the next compaction"""
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        return True
+
+    def train(self):
+        """Cluster the stored vectors and rebuild the inverted lists"""
+        self._compact()
+        count = len(self._ids)
+        if count == 0:
+            return
+
+        nlist = max(1, min(count, int(4 * np.sqrt(count))))
+        vectors = self._vectors[:count]
+        rng = np.random.default_rng(0)
+        sample_size = min(count, nlist * 64)
+        sample = vectors[rng.choice(count, size=sample_size, replace=False)]
+
+        centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+        for _ in range(self.kmeans_iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            sums[empty] = centroids[empty]
+            norms[empty] = 1.0
+            centroids = sums / norms
+
+        self._centroids = centroids.astype(np.float32)
+        self._assign_all()
+        self._trained_size = count
+        logger.debug(f"Trained vector index with {nlist} clusters over {count} vectors")
+
+    def search(self, vector: np.ndarray, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Find the stored vectors most similar to a query vector
+
+        Returns:
+            (id, cosine similarity) pairs, most similar first
+        """
+        if not self._rows or k <= 0:
+            return []
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+
+        if self.is_trained:
+            nprobe = min(self.nprobe, len(self._lists))
+            closest = np.argpartition(-(self._centroids @ vector), nprobe - 1)[:nprobe]
+            rows = np.fromiter(
+                (row for cluster in closest for row in self._lists[cluster]),
+                dtype=np.int64
+            )
+        else:
+            rows = np.arange(len(self._ids))
+
+        rows = rows[self._alive[rows]]
+        if rows.size == 0:
+            return []
+
+        scores = self._vectors[rows] @ vector
+        if rows.size > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(rows.size)
+        top = top[np.argsort(-scores[top])]
+        return [(self._ids[rows[i]], float(scores[i])) for i in top]
+
+    def get_vector(self, item_id: str) -> Optional[np.ndarray]:
+        row = self._rows.get(item_id)
+        return None if row is None else self._vectors[row]
+
+    def save(self, path: str):
+        """Write the index to a NumPy archive"""
+        self._compact()
+        count = len(self._ids)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            'vectors': self._vectors[:count],
+            'ids': np.array(self._ids, dtype=object),
+            'trained_size': np.array(self._trained_size),
+        }
+        if self.is_trained:
+            arrays['centroids'] = self._centroids
+            arrays['assignments'] = self._assignments[:count]
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'VectorIndex':
+        """Read an index written by ``save``"""
+        with np.load(path, allow_pickle=True) as data:
+            vectors = data['vectors']
+            index = cls(dim=vectors.shape[1], **kwargs)
+            ids = [str(item_id) for item_id in data['ids']]
+            count = len(ids)
+
+            index._ensure_capacity(count)
+            index._vectors[:count] = vectors
+            index._alive[:count] = True
+            index._ids = ids
+            index._rows = {item_id: row for row, item_id in enumerate(ids)}
+            index._trained_size = int(data['trained_size'])
+
+            if 'centroids' in data:
+                index._centroids = data['centroids'].astype(np.float32)
+                index._assignments[:count] = data['assignments']
+                index._lists = [[] for _ in range(len(index._centroids))]
+                for row, cluster in enumerate(index._assignments[:count]):
+                    index._lists[cluster].append(row)
+        return index
+
+    def _ensure_capacity(self, size: int):
+        capacity = self._vectors.shape[0]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        vectors[:len(self._ids)] = self._vectors[:len(self._ids)]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(self._ids)] = self._alive[:len(self._ids)]
+        assignments = np.zeros(capacity, dtype=np.int32)
+        assignments[:len(self._ids)] = self._assignments[:len(self._ids)]
+        self._vectors, self._alive, self._assignments = vectors, alive, assignments
+
+    def _compact(self):
+        """Drop removed rows so row numbers are dense again"""
+        if len(self._rows) == len(self._ids):
+            return
+        keep = np.flatnonzero(self._alive[:len(self._ids)])
+        count = keep.size
+        self._vectors[:count] = self._vectors[keep]
+        self._assignments[:count] = self._assignments[keep]
+        self._alive[:] = False
+        self._alive[:count] = True
+        self._ids = [self._ids[row] for row in keep]
+        self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+        if self.is_trained:
+            self._assign_all()
+
+    def _assign_all(self):
+        count = len(self._ids)
+        assignments = np.zeros(count, dtype=np.int32)
+        for start in range(0, count, 65536):
+            block = self._vectors[start:min(count, start + 65536)]
+            assignments[start:start + len(block)] = np.argmax(block @ self._centroids.T, axis=1)
+        self._assignments[:count] = assignments
+        self._lists = [[] for _ in range(len(self._centroids))]
+        for row, cluster in enumerate(assignments):
+            self._lists[cluster].append(row)
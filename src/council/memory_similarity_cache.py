@@ -0,0 +1,310 @@
+"""
+Memory Similarity Cache - Bounded Pairwise Similarity for the Memory System
+
+Caches the similarity score between two deliberation memories so association
+discovery does not rescore the same pairs. Keys are symmetric, so (a, b) and
+(b, a) share one entry.
+
+The cache is bounded by entry count and approximate byte size, evicts in LRU
+order, expires entries after a TTL, and drops every pair involving a memory
+whose tags or context change. Misses can be scored in one vectorized pass
+with batch_memory_similarity.
+"""
+
+import hashlib
+import json
+import logging
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Weights of the similarity components
+QUERY_WEIGHT = 0.4
+TAG_WEIGHT = 0.3
+CONTEXT_WEIGHT = 0.2
+TEMPORAL_WEIGHT = 0.1
+
+PairKey = Tuple[str, str]
+
+
+def pair_key(id1: Any, id2: Any) -> PairKey:
+    """Order-independent key for a pair of memory ids"""
+    a, b = str(id1), str(id2)
+    return (a, b) if a <= b else (b, a)
+
+
+def memory_signature(memory: Any) -> str:
+    """
+    Hash of the memory fields that feed tag and context similarity
+
+    A cached score is only valid while both memories keep the signature it
+    was computed with.
+    """
+    payload = json.dumps(
+        [sorted(memory.tags or []), sorted((memory.context or {}).keys())],
+        default=str
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+@dataclass
+class _CacheEntry:
+    """A cached similarity score"""
+    score: float
+    expires_at: float
+    signatures: Tuple[str, str]
+
+
+class MemorySimilarityCache:
+    """
+    LRU/TTL cache of pairwise memory similarity scores
+
+    Features:
+    - Symmetric pair keys
+    - Entry-count and byte limits with LRU eviction
+    - TTL expiry
+    - Invalidation of every pair touching a memory, explicit or on signature change
+    - Hit/miss statistics
+    """
+
+    # Approximate footprint of one entry: key tuple, two id strings, entry
+    # object, dict slot and reverse-index set slots
+    _ENTRY_OVERHEAD = 360
+
+    def __init__(self,
+                 max_entries: int = 100_000,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 ttl: float = 24 * 3600):
+        """
+        Args:
+            max_entries: Maximum cached pairs
+            max_bytes: Approximate memory budget for cached pairs
+            ttl: Seconds a cached score stays valid
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[PairKey, _CacheEntry]" = OrderedDict()
+        # memory id -> pair keys it takes part in, for invalidation
+        self._by_memory: Dict[str, Set[PairKey]] = defaultdict(set)
+        # memory id -> last seen signature
+        self._signatures: Dict[str, str] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, memory1: Any, memory2: Any) -> Optional[float]:
+        """
+        Cached similarity of two memories, or None on a miss
+
+        A memory whose signature differs from the one last seen has all of
+        its pairs invalidated first.
+        """
+        sig1 = self._observe(memory1)
+        sig2 = self._observe(memory2)
+        key = pair_key(memory1.id, memory2.id)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        if sorted((sig1, sig2)) != list(entry.signatures):
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.score
+
+    def put(self, memory1: Any, memory2: Any, score: float):
+        """Cache the similarity of two memories"""
+        sig1 = self._observe(memory1)
+        sig2 = self._observe(memory2)
+        key = pair_key(memory1.id, memory2.id)
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = _CacheEntry(
+            score=float(score),
+            expires_at=time.monotonic() + self.ttl,
+            signatures=tuple(sorted((sig1, sig2)))
+        )
+        self._by_memory[key[0]].add(key)
+        self._by_memory[key[1]].add(key)
+        self._bytes += self._entry_size(key)
+        self._evict()
+
+    def invalidate_memory(self, memory_id: Any) -> int:
+        """
+        Drop every cached pair involving a memory
+
+        Returns:
+            Number of pairs removed
+        """
+        memory_id = str(memory_id)
+        keys = list(self._by_memory.get(memory_id, ()))
+        for key in keys:
+            self._remove(key)
+        self._signatures.pop(memory_id, None)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self):
+        """Remove every cached pair"""
+        self._entries.clear()
+        self._by_memory.clear()
+        self._signatures.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss and size statistics for health reporting"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'approx_bytes': self._bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total > 0 else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'ttl': self.ttl
+        }
+
+    def _observe(self, memory: Any) -> str:
+        """Record a memory's signature, invalidating its pairs if it changed"""
+        memory_id = str(memory.id)
+        signature = memory_signature(memory)
+        previous = self._signatures.get(memory_id)
+        if previous is not None and previous != signature:
+            self.invalidate_memory(memory_id)
+        self._signatures[memory_id] = signature
+        return signature
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: PairKey):
+        if self._entries.pop(key, None) is None:
+            return
+        self._bytes -= self._entry_size(key)
+        for memory_id in key:
+            keys = self._by_memory.get(memory_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_memory[memory_id]
+                    # Forget signatures of memories with no cached pairs left
+                    self._signatures.pop(memory_id, None)
+
+    def _entry_size(self, key: PairKey) -> int:
+        return self._ENTRY_OVERHEAD + sys.getsizeof(key[0]) + sys.getsizeof(key[1])
+
+
+def _jaccard_row(items: Set[Any], others: Sequence[Set[Any]]) -> np.ndarray:
+    """Jaccard similarity of one set against many (0 where either side is empty)"""
+    scores = np.zeros(len(others), dtype=np.float32)
+    if not items:
+        return scores
+    for i, other in enumerate(others):
+        if other:
+            scores[i] = len(items & other) / len(items | other)
+    return scores
+
+
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def batch_memory_similarity(memory: Any, candidates: Sequence[Any]) -> np.ndarray:
+    """
+    Similarity of one memory to many candidates in a single pass
+
+    Query similarity is the cosine of stored embeddings, computed as one
+    matrix-vector product; candidates without an embedding fall back to word
+    overlap. Tag, context and temporal components match the scalar scoring
+    in PersonaMemorySystem.
+
+    Returns:
+        float32 array of scores, aligned with candidates
+    """
+    count = len(candidates)
+    if count == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    # Query component
+    query_scores = np.zeros(count, dtype=np.float32)
+    embedded: List[int] = []
+    if memory.embedding:
+        dim = len(memory.embedding)
+        embedded = [
+            i for i, c in enumerate(candidates)
+            if c.embedding and len(c.embedding) == dim
+        ]
+    if embedded:
+        matrix = np.asarray([candidates[i].embedding for i in embedded], dtype=np.float32)
+        cosines = matrix @ np.asarray(memory.embedding, dtype=np.float32)
+        query_scores[embedded] = np.maximum(cosines, 0.0)
+    embedded_set = set(embedded)
+    fallback = [i for i in range(count) if i not in embedded_set]
+    if fallback:
+        words = set(memory.query.lower().split())
+        query_scores[fallback] = _jaccard_row(
+            words, [set(candidates[i].query.lower().split()) for i in fallback]
+        )
+
+    # Tag and context components
+    tag_scores = _jaccard_row(
+        set(memory.tags or []), [set(c.tags or []) for c in candidates]
+    )
+    context_scores = _jaccard_row(
+        set((memory.context or {}).keys()),
+        [set((c.context or {}).keys()) for c in candidates]
+    )
+
+    # Temporal proximity, decaying over a year
+    created = _to_naive_utc(memory.created_at)
+    day_diffs = np.asarray([
+        abs((created - _to_naive_utc(c.created_at)).days)
+        if created is not None and c.created_at is not None else 365
+        for c in candidates
+    ], dtype=np.float32)
+    temporal_scores = np.maximum(0.0, 1.0 - day_diffs / 365.0)
+
+    return (QUERY_WEIGHT * query_scores +
+            TAG_WEIGHT * tag_scores +
+            CONTEXT_WEIGHT * context_scores +
+            TEMPORAL_WEIGHT * temporal_scores).astype(np.float32)
@@ -10,7 +10,9 @@ import asyncio
 import hashlib
 import logging
 import json
-from datetime import datetime, timedelta
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass
 import numpy as np
@@ -33,6 +35,8 @@ from ..models.memory import (
     MemoryMetrics
 )
 from .persona import PersonaResponse
+from .memory_embeddings import HashingEmbedder, VectorIndex
+from .memory_similarity_cache import MemorySimilarityCache, batch_memory_similarity
 
 # Forward declarations to avoid circular imports
 from typing import TYPE_CHECKING
@@ -72,17 +76,84 @@ class PersonaMemorySystem:
     Provides persistent storage, intelligent retrieval, and adaptive learning.
     """
 
-    def __init__(self):
+    def __init__(self,
+                 vector_index_path: str = "data/memory/deliberation_vectors.npz",
+                 embedding_dim: int = 256,
+                 persist_every: int = 100,
+                 similarity_cache: Optional[MemorySimilarityCache] = None):
+        """
+        Args:
+            vector_index_path: Where the recall vector index is persisted
+            embedding_dim: Dimensions of query embeddings
+            persist_every: Save the vector index after this many new memories
+            similarity_cache: Cache of pairwise memory similarity (default: a
+                bounded MemorySimilarityCache)
+        """
         self._db_manager = get_database_manager()
-        self._similarity_cache: Dict[str, float] = {}
+        self._similarity_cache = similarity_cache or MemorySimilarityCache()
         self._performance_metrics: Dict[str, Any] = defaultdict(list)
+        
+        # Vector recall
+        self._embedder = HashingEmbedder(dim=embedding_dim)
+        self._vector_index = VectorIndex(dim=embedding_dim)
+        self._vector_index_path = vector_index_path
+        self._persist_every = persist_every
+        self._unsaved_vectors = 0
 
     async def initialize(self):
         """Initialize the memory system"""
         await self._db_manager.initialize()
         await self._create_search_indexes()
+        await self._load_vector_index()
         logger.info("PersonaMemorySystem initialized successfully")
 
+    async def _load_vector_index(self):
+        """
+        Load the persisted vector index and catch up with newer memories
+        
+        Memories stored after the snapshot was written (or every memory, when
+        there is no snapshot) are embedded and added from the database.
+        """
+        snapshot_time = None
+        if os.path.exists(self._vector_index_path):
+            try:
+                self._vector_index = await asyncio.to_thread(
+                    VectorIndex.load, self._vector_index_path
+                )
+                # Allow for clock skew between this host and the database
+                snapshot_time = datetime.fromtimestamp(
+                    os.path.getmtime(self._vector_index_path), tz=timezone.utc
+                ) - timedelta(minutes=5)
+            except Exception as e:
+                logger.warning(f"Failed to load vector index, rebuilding: {e}")
+                self._vector_index = VectorIndex(dim=self._embedder.dim)
+        
+        async with self._db_manager.get_postgres_session() as session:
+            catch_up_query = select(
+                DeliberationMemory.id, DeliberationMemory.query, DeliberationMemory.embedding
+            )
+            if snapshot_time is not None:
+                catch_up_query = catch_up_query.where(DeliberationMemory.created_at >= snapshot_time)
+            result = await session.execute(catch_up_query)
+            rows = [row for row in result.all() if str(row.id) not in self._vector_index]
+        
+        if rows:
+            vectors = np.vstack([
+                np.asarray(row.embedding, dtype=np.float32)
+                if row.embedding and len(row.embedding) == self._embedder.dim
+                else self._embedder.embed(row.query)
+                for row in rows
+            ])
+            self._vector_index.add_batch([str(row.id) for row in rows], vectors)
+            await self.save_vector_index()
+        
+        logger.info(f"Vector index ready with {len(self._vector_index)} memories")
+
+    async def save_vector_index(self):
+        """Persist the vector index to disk"""
+        await asyncio.to_thread(self._vector_index.save, self._vector_index_path)
+        self._unsaved_vectors = 0
+
     async def _create_search_indexes(self):
         """Create advanced search indexes for better performance"""
         async with self._db_manager.get_postgres_session() as session:
@@ -115,64 +186,108 @@ class PersonaMemorySystem:
         Returns:
             DeliberationMemory: Stored deliberation record
         """
+        return (await self.store_deliberation_batch([(request, result)]))[0]
+
+    async def store_deliberation_batch(self,
+                                      deliberations: List[Tuple["DeliberationRequest", "DeliberationResult"]]
+                                      ) -> List[DeliberationMemory]:
+        """
+        Store several deliberation sessions in one transaction.
+        
+        Args:
+            deliberations: (request, result) pairs to store
+            
+        Returns:
+            Stored deliberation records, in input order
+        """
+        if not deliberations:
+            return []
+        
         start_time = datetime.now()
         
         async with self._db_manager.get_postgres_session() as session:
             try:
-                # Calculate query hash for similarity matching
-                query_hash = hashlib.sha256(request.query.encode()).hexdigest()
-                
-                # Determine importance score based on consensus and time
-                importance = await self._calculate_importance(result)
-                
-                # Extract tags from query and context
-                tags = await self._extract_tags(request.query, request.context)
-                
-                # Create deliberation memory
-                deliberation = DeliberationMemory(
-                    query=request.query,
-                    topic=request.topic or "general",
-                    context=request.context,
-                    consensus_result=result.consensus.to_dict(),
-                    consensus_confidence=result.consensus.confidence,
-                    consensus_method=result.consensus.method.value,
-                    deliberation_time=result.deliberation_time,
-                    persona_count=len(result.persona_responses),
-                    query_hash=query_hash,
-                    tags=tags,
-                    importance_score=importance
-                )
-                
-                session.add(deliberation)
-                await session.flush()  # Get the ID
-                
-                # Store persona responses
-                persona_responses = []
-                for response in result.persona_responses:
-                    response_memory = await self._store_persona_response(
-                        session, deliberation.id, response, result
-                    )
-                    persona_responses.append(response_memory)
-                
-                # Create associations with similar deliberations
-                await self._create_memory_associations(session, deliberation)
-                
-                # Update learning patterns for personas
-                await self._update_learning_patterns(session, deliberation, persona_responses)
+                stored = []
+                for request, result in deliberations:
+                    stored.append(await self._add_deliberation(session, request, result))
                 
                 await session.commit()
                 
-                # Record performance metrics
-                storage_time = (datetime.now() - start_time).total_seconds()
-                await self._record_metric("storage_latency", storage_time, {"deliberation_id": str(deliberation.id)})
-                
-                logger.info(f"Stored deliberation memory: {deliberation.id} in {storage_time:.3f}s")
-                return deliberation
-                
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Failed to store deliberation memory: {e}")
                 raise
+        
+        # Make the new memories recallable
+        self._vector_index.add_batch(
+            [str(deliberation.id) for deliberation, _ in stored],
+            np.vstack([embedding for _, embedding in stored])
+        )
+        self._unsaved_vectors += len(stored)
+        if self._unsaved_vectors >= self._persist_every:
+            await self.save_vector_index()
+        
+        # Record performance metrics
+        storage_time = (datetime.now() - start_time).total_seconds()
+        await self._record_metric("storage_latency", storage_time, {
+            "deliberation_ids": [str(deliberation.id) for deliberation, _ in stored]
+        })
+        
+        logger.info(f"Stored {len(stored)} deliberation memories in {storage_time:.3f}s")
+        return [deliberation for deliberation, _ in stored]
+
+    async def _add_deliberation(self,
+                                session: AsyncSession,
+                                request: "DeliberationRequest",
+                                result: "DeliberationResult") -> Tuple[DeliberationMemory, np.ndarray]:
+        """Add a deliberation and its persona responses to a session"""
+        
+        # Calculate query hash for similarity matching
+        query_hash = hashlib.sha256(request.query.encode()).hexdigest()
+        
+        # Determine importance score based on consensus and time
+        importance = await self._calculate_importance(result)
+        
+        # Extract tags from query and context
+        tags = await self._extract_tags(request.query, request.context)
+        
+        # Embed the query for vector recall
+        embedding = self._embedder.embed(request.query)
+        
+        # Create deliberation memory
+        deliberation = DeliberationMemory(
+            query=request.query,
+            topic=request.topic or "general",
+            context=request.context,
+            consensus_result=result.consensus.to_dict(),
+            consensus_confidence=result.consensus.confidence,
+            consensus_method=result.consensus.method.value,
+            deliberation_time=result.deliberation_time,
+            persona_count=len(result.persona_responses),
+            query_hash=query_hash,
+            tags=tags,
+            importance_score=importance,
+            embedding=embedding.tolist()
+        )
+        
+        session.add(deliberation)
+        await session.flush()  # Get the ID
+        
+        # Store persona responses
+        persona_responses = []
+        for response in result.persona_responses:
+            response_memory = await self._store_persona_response(
+                session, deliberation.id, response, result
+            )
+            persona_responses.append(response_memory)
+        
+        # Create associations with similar deliberations
+        await self._create_memory_associations(session, deliberation)
+        
+        # Update learning patterns for personas
+        await self._update_learning_patterns(session, deliberation, persona_responses)
+        
+        return deliberation, embedding
 
     async def _store_persona_response(self,
                                      session: AsyncSession,
@@ -225,90 +340,164 @@ class PersonaMemorySystem:
         Returns:
             MemoryRecall: Retrieved memories with relevance scores
         """
+        recalls = await self.recall_memories_batch([query])
+        return recalls[0]
+
+    async def recall_memories_batch(self, queries: List[MemoryQuery]) -> List[MemoryRecall]:
+        """
+        Recall memories for several queries in a single pass.
+        
+        All queries share one database session, access counts are updated
+        with a single statement and the session is committed once.
+        
+        Args:
+            queries: Memory query parameters, one per deliberation
+            
+        Returns:
+            List of MemoryRecall results in the same order as ``queries``
+        """
+        if not queries:
+            return []
+        
         start_time = datetime.now()
+        recalls = []
+        accessed_ids = set()
         
         async with self._db_manager.get_postgres_session() as session:
-            # Build the base query
-            base_query = select(DeliberationMemory)
+            for query in queries:
+                query_start = datetime.now()
+                recall = await self._recall_in_session(session, query)
+                recall.query_time = (datetime.now() - query_start).total_seconds()
+                accessed_ids.update(m.id for m in recall.memories)
+                recalls.append(recall)
             
-            # Add filters
-            filters = []
-            
-            # Time range filter
-            if query.time_range:
-                filters.append(DeliberationMemory.created_at.between(*query.time_range))
-            
-            # Topic filter
-            if query.topic:
-                filters.append(DeliberationMemory.topic == query.topic)
-            
-            # Minimum importance filter
-            filters.append(DeliberationMemory.importance_score >= query.min_relevance)
-            
-            if filters:
-                base_query = base_query.where(and_(*filters))
+            # Update access counts for accessed memories
+            if accessed_ids:
+                await self._update_memory_access_counts(session, list(accessed_ids))
             
-            # Execute text search query
+            await session.commit()
+        
+        # Record performance metrics
+        query_time = (datetime.now() - start_time).total_seconds()
+        await self._record_metric("recall_latency", query_time, {
+            "memories_found": sum(len(r.memories) for r in recalls),
+            "queries": len(queries),
+            "persona": queries[0].persona_name if len(queries) == 1 else None
+        })
+        
+        return recalls
+
+    async def _recall_in_session(self, session: AsyncSession, query: MemoryQuery) -> MemoryRecall:
+        """Run a single memory query inside an existing session"""
+        # Build the base query
+        base_query = select(DeliberationMemory)
+        
+        # Add filters
+        filters = []
+        
+        # Time range filter
+        if query.time_range:
+            filters.append(DeliberationMemory.created_at.between(*query.time_range))
+        
+        # Topic filter
+        if query.topic:
+            filters.append(DeliberationMemory.topic == query.topic)
+        
+        # Minimum importance filter
+        filters.append(DeliberationMemory.importance_score >= query.min_relevance)
+        
+        if filters:
+            base_query = base_query.where(and_(*filters))
+        
+        # Nearest neighbours from the vector index, full-text search as fallback
+        similarities: Dict[str, float] = {}
+        if len(self._vector_index):
+            search_results, similarities = await self._execute_vector_search(
+                session, query.query_text, base_query, query.limit * 2,
+                oversample=4 if len(filters) > 1 else 1
+            )
+        else:
             search_results = await self._execute_similarity_search(
                 session, query.query_text, base_query, query.limit * 2
             )
-            
-            # Calculate relevance scores
-            memories_with_scores = []
-            for memory in search_results:
-                relevance = await self._calculate_relevance_score(
-                    memory, query.query_text, query.context
-                )
-                if relevance >= query.min_relevance:
-                    memories_with_scores.append((memory, relevance))
-            
-            # Sort by relevance and limit
-            memories_with_scores.sort(key=lambda x: x[1], reverse=True)
-            memories_with_scores = memories_with_scores[:query.limit]
-            
-            memories = [m[0] for m in memories_with_scores]
-            relevance_scores = [m[1] for m in memories_with_scores]
-            
-            # Get context memories if requested
-            context_memories = []
-            if query.include_context and memories:
-                memory_ids = [m.id for m in memories]
-                context_query = select(ContextMemory).join(PersonaResponseMemory).where(
-                    PersonaResponseMemory.deliberation_id.in_(memory_ids)
-                )
-                context_result = await session.execute(context_query)
-                context_memories = context_result.scalars().all()
-            
-            # Get relevant learning patterns for persona
-            learning_patterns = []
-            if query.persona_name:
-                pattern_query = select(PersonaLearningPattern).where(
-                    PersonaLearningPattern.persona_name == query.persona_name
-                ).order_by(desc(PersonaLearningPattern.strength)).limit(5)
-                pattern_result = await session.execute(pattern_query)
-                learning_patterns = pattern_result.scalars().all()
-            
-            # Update access counts for accessed memories
-            if memories:
-                await self._update_memory_access_counts(session, [m.id for m in memories])
-            
-            await session.commit()
-            
-            # Record performance metrics
-            query_time = (datetime.now() - start_time).total_seconds()
-            await self._record_metric("recall_latency", query_time, {
-                "memories_found": len(memories),
-                "persona": query.persona_name
-            })
-            
-            return MemoryRecall(
-                memories=memories,
-                relevance_scores=relevance_scores,
-                context_memories=context_memories,
-                learning_patterns=learning_patterns,
-                total_found=len(search_results),
-                query_time=query_time
+        
+        # Calculate relevance scores
+        memories_with_scores = []
+        for memory in search_results:
+            relevance = await self._calculate_relevance_score(
+                memory, query.query_text, query.context,
+                similarity=similarities.get(str(memory.id))
+            )
+            if relevance >= query.min_relevance:
+                memories_with_scores.append((memory, relevance))
+        
+        # Sort by relevance and limit
+        memories_with_scores.sort(key=lambda x: x[1], reverse=True)
+        memories_with_scores = memories_with_scores[:query.limit]
+        
+        memories = [m[0] for m in memories_with_scores]
+        relevance_scores = [m[1] for m in memories_with_scores]
+        
+        # Get context memories if requested
+        context_memories = []
+        if query.include_context and memories:
+            memory_ids = [m.id for m in memories]
+            context_query = select(ContextMemory).join(PersonaResponseMemory).where(
+                PersonaResponseMemory.deliberation_id.in_(memory_ids)
             )
+            context_result = await session.execute(context_query)
+            context_memories = context_result.scalars().all()
+        
+        # Get relevant learning patterns for persona
+        learning_patterns = []
+        if query.persona_name:
+            pattern_query = select(PersonaLearningPattern).where(
+                PersonaLearningPattern.persona_name == query.persona_name
+            ).order_by(desc(PersonaLearningPattern.strength)).limit(5)
+            pattern_result = await session.execute(pattern_query)
+            learning_patterns = pattern_result.scalars().all()
+        
+        return MemoryRecall(
+            memories=memories,
+            relevance_scores=relevance_scores,
+            context_memories=context_memories,
+            learning_patterns=learning_patterns,
+            total_found=len(search_results),
+            query_time=0.0
+        )
+
+    async def _execute_vector_search(self,
+                                     session: AsyncSession,
+                                     query_text: str,
+                                     base_query,
+                                     limit: int,
+                                     oversample: int = 1) -> Tuple[List[DeliberationMemory], Dict[str, float]]:
+        """
+        Find the memories whose query embeddings are nearest to the query text
+        
+        The ANN candidates are loaded through ``base_query`` so its filters
+        still apply; ``oversample`` widens the candidate set for selective filters.
+        
+        Returns:
+            Memories ordered by similarity, and a map of memory id to cosine similarity
+        """
+        neighbours = self._vector_index.search(
+            self._embedder.embed(query_text), k=limit * oversample
+        )
+        neighbours = [(memory_id, score) for memory_id, score in neighbours if score > 0]
+        if not neighbours:
+            return [], {}
+        
+        similarities = dict(neighbours)
+        result = await session.execute(
+            base_query.where(DeliberationMemory.id.in_([uuid.UUID(m) for m in similarities]))
+        )
+        memories = sorted(
+            result.scalars().all(),
+            key=lambda m: similarities[str(m.id)],
+            reverse=True
+        )
+        return memories[:limit], similarities
 
     async def _execute_similarity_search(self,
                                         session: AsyncSession,
@@ -337,17 +526,26 @@ class PersonaMemorySystem:
     async def _calculate_relevance_score(self,
                                        memory: DeliberationMemory,
                                        query_text: str,
-                                       context: Dict[str, Any]) -> float:
-        """Calculate relevance score for a memory given current query and context"""
+                                       context: Dict[str, Any],
+                                       similarity: Optional[float] = None) -> float:
+        """
+        Calculate relevance score for a memory given current query and context
+        
+        ``similarity`` is the embedding cosine similarity when the memory came
+        from the vector index; word overlap is used otherwise.
+        """
         
         relevance = memory.importance_score * 0.4  # Base importance
         
-        # Text similarity (simple word overlap for now)
-        query_words = set(query_text.lower().split())
-        memory_words = set(memory.query.lower().split())
-        if query_words and memory_words:
-            overlap = len(query_words & memory_words) / len(query_words | memory_words)
-            relevance += overlap * 0.3
+        # Text similarity
+        if similarity is not None:
+            relevance += max(0.0, similarity) * 0.3
+        else:
+            query_words = set(query_text.lower().split())
+            memory_words = set(memory.query.lower().split())
+            if query_words and memory_words:
+                overlap = len(query_words & memory_words) / len(query_words | memory_words)
+                relevance += overlap * 0.3
         
         # Context similarity
         if memory.context and context:
@@ -451,23 +649,28 @@ class PersonaMemorySystem:
         """Create associations between the new memory and existing similar ones"""
         
         # Find similar existing memories
-        similar_query = select(DeliberationMemory).where(
+        base_query = select(DeliberationMemory).where(
             and_(
                 DeliberationMemory.id != new_memory.id,
-                DeliberationMemory.query_hash != new_memory.query_hash,
+                DeliberationMemory.query_hash != new_memory.query_hash
+            )
+        )
+        if len(self._vector_index):
+            similar_memories, _ = await self._execute_vector_search(
+                session, new_memory.query, base_query, 5, oversample=2
+            )
+        else:
+            similar_query = base_query.where(
                 func.to_tsvector('english', DeliberationMemory.query).op('@@')(
                     func.plainto_tsquery('english', new_memory.query)
                 )
-            )
-        ).limit(5)
-        
-        result = await session.execute(similar_query)
-        similar_memories = result.scalars().all()
+            ).limit(5)
+            result = await session.execute(similar_query)
+            similar_memories = result.scalars().all()
         
         # Create associations
-        for similar in similar_memories:
-            similarity = await self._calculate_memory_similarity(new_memory, similar)
-            
+        similarities = await self._calculate_memory_similarities(new_memory, similar_memories)
+        for similar, similarity in zip(similar_memories, similarities):
             if similarity > 0.3:  # Threshold for creating association
                 association = MemoryAssociation(
                     source_memory_id=new_memory.id,
@@ -483,44 +686,41 @@ class PersonaMemorySystem:
                                          memory1: DeliberationMemory,
                                          memory2: DeliberationMemory) -> float:
         """Calculate similarity between two memories"""
+        return (await self._calculate_memory_similarities(memory1, [memory2]))[0]
+
+    async def _calculate_memory_similarities(self,
+                                           memory: DeliberationMemory,
+                                           candidates: List[DeliberationMemory]) -> List[float]:
+        """
+        Calculate similarity between a memory and several candidates
         
-        # Cache key for this comparison
-        cache_key = f"{memory1.id}:{memory2.id}"
-        if cache_key in self._similarity_cache:
-            return self._similarity_cache[cache_key]
+        Cached pairs are served from the similarity cache; the misses are
+        scored together in one vectorized pass and cached.
+        """
+        similarities: List[Optional[float]] = [
+            self._similarity_cache.get(memory, candidate) for candidate in candidates
+        ]
+        missing = [i for i, score in enumerate(similarities) if score is None]
         
-        similarity = 0.0
+        if missing:
+            scores = batch_memory_similarity(memory, [candidates[i] for i in missing])
+            for i, score in zip(missing, scores):
+                similarities[i] = float(score)
+                self._similarity_cache.put(memory, candidates[i], similarities[i])
         
-        # Query similarity
-        words1 = set(memory1.query.lower().split())
-        words2 = set(memory2.query.lower().split())
-        if words1 and words2:
-            query_sim = len(words1 & words2) / len(words1 | words2)
-            similarity += query_sim * 0.4
+        return similarities
+
+    def invalidate_memory_similarity(self, memory_id: Any) -> int:
+        """
+        Drop cached similarity scores involving a memory
         
-        # Tag similarity
-        if memory1.tags and memory2.tags:
-            tags1 = set(memory1.tags)
-            tags2 = set(memory2.tags)
-            tag_sim = len(tags1 & tags2) / len(tags1 | tags2)
-            similarity += tag_sim * 0.3
+        Call after editing a memory's tags or context in place. Edits made
+        through objects passed to the cache are also detected on next lookup.
         
-        # Context similarity
-        if memory1.context and memory2.context:
-            ctx1_keys = set(memory1.context.keys())
-            ctx2_keys = set(memory2.context.keys())
-            if ctx1_keys and ctx2_keys:
-                ctx_sim = len(ctx1_keys & ctx2_keys) / len(ctx1_keys | ctx2_keys)
-                similarity += ctx_sim * 0.2
-        
-        # Temporal proximity
-        time_diff = abs((memory1.created_at - memory2.created_at).days)
-        temporal_sim = max(0, 1 - time_diff / 365)  # Decay over a year
-        similarity += temporal_sim * 0.1
-        
-        # Cache the result
-        self._similarity_cache[cache_key] = similarity
-        return similarity
+        Returns:
+            Number of cached pairs removed
+        """
+        return self._similarity_cache.invalidate_memory(memory_id)
 
     async def _update_learning_patterns(self,
                                       session: AsyncSession,
@@ -718,7 +918,13 @@ class PersonaMemorySystem:
                 "total_deliberations": memory_count,
                 "total_responses": response_count,
                 "latest_memory": latest_memory.isoformat() if latest_memory else None,
-                "cache_size": len(self._similarity_cache)
+                "cache_size": len(self._similarity_cache),
+                "similarity_cache": self._similarity_cache.get_stats(),
+                "vector_index": {
+                    "size": len(self._vector_index),
+                    "trained": self._vector_index.is_trained,
+                    "unsaved": self._unsaved_vectors
+                }
             }
 
 
@@ -8,11 +8,13 @@ and produces final decisions through consensus.
 import asyncio
 import logging
 import time
+import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Set, Type
+from typing import Dict, List, Optional, Any, Set, Type, AsyncIterator, Tuple, Union
 from dataclasses import dataclass, field
 
 from .blackboard import Blackboard, BlackboardEntry, EntryType
+from .blackboard_archive import BlackboardArchive
 from .persona import Persona, PersonaResponse
 from .consensus import ConsensusEngine, ConsensusResult, ConsensusMethod
 from .personas import CORE_PERSONAS
@@ -21,9 +23,21 @@ from .tool_integration import PersonaToolIntegration, ToolCapability
 # from .memory_integration import get_optimized_memory_system
 # from .knowledge_graph_integration import get_optimized_knowledge_graph
 from .knowledge_graph import NodeType, EdgeType
+from .deliberation_cache import DeliberationCache
+from .write_behind import WriteBehindJournal, WriteBehindPipeline
 
 logger = logging.getLogger(__name__)
 
+# Blackboard retention: every deliberation opens a new topic, so finished
+# topics are archived to disk once these limits are reached
+BLACKBOARD_MAX_TOPICS = 256
+BLACKBOARD_MAX_ENTRIES = 50000
+BLACKBOARD_MAX_ENTRIES_PER_TOPIC = 1000
+BLACKBOARD_ARCHIVE_PATH = "data/blackboard/blackboard_archive.db"
+
+# Deliberation results waiting to be written to memory and the knowledge graph
+PERSISTENCE_QUEUE_PATH = "data/council/persistence_queue.db"
+
 
 @dataclass
 class DeliberationRequest:
@@ -63,6 +77,18 @@ class DeliberationResult:
         }
 
 
+@dataclass
+class DeliberationUpdate:
+    """Incremental update emitted while a deliberation is streaming"""
+    event: str                                        # 'persona_response' or 'complete'
+    personas_completed: List[str]                     # Personas that have answered
+    personas_pending: List[str]                       # Personas still deliberating
+    response: Optional[PersonaResponse] = None        # Response that triggered the update
+    provisional_consensus: Optional[ConsensusResult] = None  # Consensus over answers so far
+    decided: bool = False                             # Leader can no longer be overturned
+    result: Optional[DeliberationResult] = None       # Final result on 'complete'
+
+
 class Orchestrator:
     """
     Central orchestrator for the Council of Minds
@@ -77,15 +103,25 @@ class Orchestrator:
     
     def __init__(self, 
                  use_all_personas: bool = False,
-                 custom_personas: Optional[List[Type[Persona]]] = None):
+                 custom_personas: Optional[List[Type[Persona]]] = None,
+                 result_cache: Optional[DeliberationCache] = None,
+                 persistence_journal: Optional[WriteBehindJournal] = None):
         """
         Initialize the orchestrator
         
         Args:
             use_all_personas: Whether to use all available personas (vs just core)
             custom_personas: Additional custom personas to include
+            result_cache: Optional cache of deliberation results for repeated queries
+            persistence_journal: Journal for results awaiting persistence
+                (default: SQLite file at PERSISTENCE_QUEUE_PATH)
         """
-        self.blackboard = Blackboard()
+        self.blackboard = Blackboard(
+            max_topics=BLACKBOARD_MAX_TOPICS,
+            max_entries=BLACKBOARD_MAX_ENTRIES,
+            max_entries_per_topic=BLACKBOARD_MAX_ENTRIES_PER_TOPIC,
+            archive=BlackboardArchive(BLACKBOARD_ARCHIVE_PATH)
+        )
         self.consensus_engine = ConsensusEngine(self.blackboard)
         self.personas: Dict[str, Persona] = {}
         self.deliberation_history: List[DeliberationResult] = []
@@ -102,6 +138,19 @@ class Orchestrator:
         self.memory_system = None  # Will be initialized in initialize()
         self.knowledge_graph = None  # Will be connected when integration is fixed
         
+        # Deliberation result cache
+        self.result_cache = result_cache
+        
+        # Write-behind persistence of results to memory and the knowledge graph
+        self.persistence = WriteBehindPipeline(
+            stages=[
+                ('memory', self._store_deliberation_memories),
+                ('knowledge_graph', self._update_knowledge_graph),
+                ('result_cache', self._invalidate_cached_results)
+            ],
+            journal=persistence_journal or WriteBehindJournal(PERSISTENCE_QUEUE_PATH)
+        )
+        
     async def initialize(self):
         """Initialize the council with personas"""
         if self.is_initialized:
@@ -166,6 +215,15 @@ class Orchestrator:
         self.is_initialized = True
         logger.info(f"Council initialized with {len(self.personas)} personas")
     
+    async def shutdown(self, timeout: float = 10.0):
+        """
+        Persist queued deliberation results before the process exits
+        
+        Results not persisted within the timeout stay in the journal and are
+        written after the next start.
+        """
+        await self.persistence.stop(timeout)
+    
     async def deliberate(self, request: DeliberationRequest) -> DeliberationResult:
         """
         Process a deliberation request through the council
@@ -179,6 +237,13 @@ class Orchestrator:
         if not self.is_initialized:
             await self.initialize()
         
+        # Serve repeated questions from the result cache
+        if self.result_cache:
+            cached = await self.result_cache.get(request)
+            if cached is not None:
+                logger.info(f"Deliberation served from cache: {cached.consensus.decision}")
+                return cached
+        
         start_time = time.time()
         
         # Determine topic for blackboard
@@ -190,6 +255,96 @@ class Orchestrator:
         # Recall relevant memories for context enhancement
         enhanced_context = await self._enhance_context_with_memories(request, selected_personas)
         
+        result = await self._run_deliberation(
+            request, topic, selected_personas, enhanced_context, start_time
+        )
+        
+        if self.result_cache:
+            await self.result_cache.set(request, result)
+        
+        return result
+    
+    async def deliberate_batch(self,
+                               requests: List[DeliberationRequest],
+                               max_concurrency: int = 8,
+                               return_exceptions: bool = False
+                               ) -> AsyncIterator[Tuple[int, Union[DeliberationResult, BaseException]]]:
+        """
+        Process many deliberation requests, yielding results as they finish
+        
+        Persona selection runs once per distinct roster, memories for the
+        whole batch are recalled in a single pass, and persona analysis is
+        fanned out across all requests behind one concurrency limit.
+        
+        Args:
+            requests: The deliberation requests to process
+            max_concurrency: Maximum number of persona deliberations in flight
+            return_exceptions: Yield failures as exception instances instead
+                of raising the first one
+            
+        Yields:
+            Tuples of (index into ``requests``, DeliberationResult or exception)
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        if not requests:
+            return
+        
+        start_time = time.time()
+        batch_id = uuid.uuid4().hex[:8]
+        
+        # Group requests by persona roster so selection is shared
+        rosters: Dict[Tuple[str, ...], List[Persona]] = {}
+        selections: List[List[Persona]] = []
+        for request in requests:
+            selected = self._select_personas(request)
+            key = tuple(p.persona_id for p in selected)
+            selections.append(rosters.setdefault(key, selected))
+        
+        logger.info(f"Batch {batch_id}: {len(requests)} requests across "
+                    f"{len(rosters)} persona groups")
+        
+        # Recall memories for the whole batch at once
+        contexts = await self._enhance_contexts_with_memories(requests, selections)
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run(index: int):
+            request = requests[index]
+            topic = request.topic or f"deliberation_batch_{batch_id}_{index}"
+            try:
+                result = await self._run_deliberation(
+                    request, topic, selections[index], contexts[index], start_time,
+                    semaphore=semaphore
+                )
+                return index, result
+            except Exception as e:
+                logger.error(f"Batch {batch_id} request {index} failed: {e}")
+                return index, e
+        
+        tasks = [asyncio.create_task(run(i)) for i in range(len(requests))]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, outcome = await next_done
+                if isinstance(outcome, BaseException) and not return_exceptions:
+                    raise outcome
+                yield index, outcome
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _run_deliberation(self,
+                                request: DeliberationRequest,
+                                topic: str,
+                                selected_personas: List[Persona],
+                                enhanced_context: Dict[str, Any],
+                                start_time: float,
+                                semaphore: Optional[asyncio.Semaphore] = None) -> DeliberationResult:
+        """
+        Run a deliberation once personas and context have been prepared
+        """
         # Post initial query to blackboard
         query_entry = BlackboardEntry(
             persona_id="orchestrator",
@@ -204,9 +359,144 @@ class Orchestrator:
         persona_responses = await self._gather_persona_responses(
             selected_personas,
             topic,
-            request
+            request,
+            semaphore=semaphore
+        )
+        
+        return await self._finalize_deliberation(
+            request, topic, selected_personas, persona_responses, start_time
+        )
+    
+    async def deliberate_stream(self,
+                                request: DeliberationRequest,
+                                stop_early: bool = True) -> AsyncIterator[DeliberationUpdate]:
+        """
+        Process a deliberation request, yielding updates as personas finish
+        
+        Each persona response is yielded together with a provisional
+        consensus over the responses received so far. With ``stop_early``,
+        the remaining personas are cancelled once the leading recommendation
+        can no longer be overturned by them.
+        
+        Args:
+            request: The deliberation request
+            stop_early: Stop waiting once the decision is settled
+            
+        Yields:
+            DeliberationUpdate per persona response, then a final 'complete'
+            update carrying the DeliberationResult
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        start_time = time.time()
+        topic = request.topic or f"deliberation_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        selected_personas = self._select_personas(request)
+        enhanced_context = await self._enhance_context_with_memories(request, selected_personas)
+        
+        query_entry = BlackboardEntry(
+            persona_id="orchestrator",
+            entry_type=EntryType.QUESTION,
+            content=request.query,
+            metadata=enhanced_context,
+            tags={'query', 'deliberation'}
         )
+        await self.blackboard.post(topic, query_entry)
+        
+        # Upper bound on each persona's expertise weight, used to decide
+        # whether pending personas could still change the outcome
+        expertise_bounds = {
+            persona.persona_id: min(1.0, persona.get_expertise_weight(request.query, request.context)
+                                    * 1.1 * 1.05)
+            for persona in selected_personas
+        }
         
+        pending = {
+            asyncio.create_task(
+                persona.deliberate(topic, request.query, request.context)
+            ): persona.persona_id
+            for persona in selected_personas
+        }
+        persona_responses: List[PersonaResponse] = []
+        deadline = start_time + request.timeout
+        decided = False
+        
+        try:
+            while pending:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    logger.warning(f"Deliberation timeout after {request.timeout}s")
+                    break
+                
+                done, _ = await asyncio.wait(
+                    pending.keys(), timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    continue
+                
+                for task in done:
+                    persona_id = pending.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        logger.warning(f"Persona {persona_id} failed during deliberation: {e}")
+                        continue
+                    
+                    persona_responses.append(response)
+                    weights = self._calculate_expertise_weights(
+                        persona_responses, request.query, request.context
+                    )
+                    provisional = await self.consensus_engine.provisional_consensus(
+                        persona_responses, weights, request.consensus_method
+                    )
+                    decided = self.consensus_engine.is_decided(
+                        persona_responses,
+                        weights,
+                        [expertise_bounds[pid] for pid in pending.values()],
+                        request.consensus_method
+                    )
+                    
+                    yield DeliberationUpdate(
+                        event='persona_response',
+                        personas_completed=[r.persona_id for r in persona_responses],
+                        personas_pending=list(pending.values()),
+                        response=response,
+                        provisional_consensus=provisional,
+                        decided=decided
+                    )
+                
+                if stop_early and pending and decided:
+                    logger.info(f"Stopping deliberation early; {len(pending)} personas "
+                                f"cannot overturn the leading recommendation")
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        result = await self._finalize_deliberation(
+            request, topic, selected_personas, persona_responses, start_time,
+            skipped_personas=list(pending.values())
+        )
+        
+        yield DeliberationUpdate(
+            event='complete',
+            personas_completed=[r.persona_id for r in persona_responses],
+            personas_pending=[],
+            provisional_consensus=result.consensus,
+            decided=True,
+            result=result
+        )
+    
+    async def _finalize_deliberation(self,
+                                     request: DeliberationRequest,
+                                     topic: str,
+                                     selected_personas: List[Persona],
+                                     persona_responses: List[PersonaResponse],
+                                     start_time: float,
+                                     skipped_personas: Optional[List[str]] = None) -> DeliberationResult:
+        """
+        Reach consensus over gathered responses and record the result
+        """
         # Calculate expertise weights
         weights = self._calculate_expertise_weights(
             persona_responses,
@@ -237,6 +527,8 @@ class Orchestrator:
             consensus,
             deliberation_time
         )
+        if skipped_personas is not None:
+            statistics['personas_skipped'] = skipped_personas
         
         # Create result
         result = DeliberationResult(
@@ -251,7 +543,7 @@ class Orchestrator:
         # Store in history
         self.deliberation_history.append(result)
         
-        # Post-deliberation hooks: store memories and update knowledge graph
+        # Post-deliberation hooks: queue memory and knowledge graph writes
         await self._post_deliberation_hooks(result)
         
         logger.info(f"Deliberation complete: {consensus.decision} "
@@ -295,16 +587,26 @@ class Orchestrator:
     async def _gather_persona_responses(self,
                                        personas: List[Persona],
                                        topic: str,
-                                       request: DeliberationRequest) -> List[PersonaResponse]:
+                                       request: DeliberationRequest,
+                                       semaphore: Optional[asyncio.Semaphore] = None
+                                       ) -> List[PersonaResponse]:
         """
         Gather responses from all selected personas
+        
+        When a semaphore is given, persona deliberations share it with
+        other in-flight requests to bound overall concurrency.
         """
+        async def limited(persona: Persona) -> PersonaResponse:
+            async with semaphore:
+                return await persona.deliberate(topic, request.query, request.context)
+        
         tasks = []
         for persona in personas:
-            task = asyncio.create_task(
-                persona.deliberate(topic, request.query, request.context)
-            )
-            tasks.append(task)
+            if semaphore is not None:
+                coro = limited(persona)
+            else:
+                coro = persona.deliberate(topic, request.query, request.context)
+            tasks.append(asyncio.create_task(coro))
         
         # Wait for all responses with timeout
         try:
@@ -552,29 +854,47 @@ class Orchestrator:
         """
         Enhance request context with relevant memories from personas
         """
-        enhanced_context = request.context.copy()
-        enhanced_context['remembered_experiences'] = []
+        contexts = await self._enhance_contexts_with_memories([request], [personas])
+        return contexts[0]
+    
+    async def _enhance_contexts_with_memories(self,
+                                            requests: List[DeliberationRequest],
+                                            personas: List[List[Persona]]) -> List[Dict[str, Any]]:
+        """
+        Enhance the context of several requests with one batched memory recall
+        """
+        contexts = []
+        for request in requests:
+            enhanced_context = request.context.copy()
+            enhanced_context['remembered_experiences'] = []
+            contexts.append(enhanced_context)
         
         if not self.memory_system:
-            return enhanced_context
+            return contexts
         
         try:
             # Import the memory query class
             from .memory_system import MemoryQuery
             
             # Recall memories using the new system
-            memory_query = MemoryQuery(
-                query_text=request.query,
-                context=request.context,
-                topic=request.topic,
-                limit=5,
-                min_relevance=0.3,
-                include_context=True
-            )
+            memory_queries = [
+                MemoryQuery(
+                    query_text=request.query,
+                    context=request.context,
+                    topic=request.topic,
+                    limit=5,
+                    min_relevance=0.3,
+                    include_context=True
+                )
+                for request in requests
+            ]
             
-            recall_result = await self.memory_system.recall_memories(memory_query)
+            recall_results = await self.memory_system.recall_memories_batch(memory_queries)
             
-            if recall_result.memories:
+            for enhanced_context, recall_result in zip(contexts, recall_results):
+                if not recall_result.memories:
+                    continue
+                
                 # Group memories by topic/similarity for context
                 memories_context = []
                 for memory, relevance in zip(recall_result.memories, recall_result.relevance_scores):
@@ -595,67 +915,96 @@ class Orchestrator:
                 
         except Exception as e:
             logger.warning(f"Failed to recall memories for context enhancement: {e}")
-            enhanced_context['memory_context_available'] = False
+            for enhanced_context in contexts:
+                enhanced_context['memory_context_available'] = False
         
-        return enhanced_context
+        return contexts
     
     async def _post_deliberation_hooks(self, result: DeliberationResult):
         """
-        Post-deliberation processing: store memories and update knowledge graph
+        Post-deliberation processing: queue the result for persistence
+        
+        Memory storage, knowledge graph updates and cache invalidation run
+        in the background write-behind pipeline, so the caller does not wait
+        on them.
         """
+        if not self.memory_system and not self.knowledge_graph:
+            return
+        
         try:
-            # Store memories for each persona
-            await self._store_deliberation_memories(result)
-            
-            # Update knowledge graph
-            await self._update_knowledge_graph(result)
-            
-            logger.debug(f"Post-deliberation hooks completed for topic: {result.blackboard_topic}")
+            await self.persistence.submit(result)
+            logger.debug(f"Queued persistence for topic: {result.blackboard_topic}")
             
         except Exception as e:
             logger.error(f"Error in post-deliberation hooks: {e}", exc_info=True)
     
-    async def _store_deliberation_memories(self, result: DeliberationResult):
+    async def _invalidate_cached_results(self, results: List[DeliberationResult]):
+        """
+        Invalidate cached deliberations affected by these deliberations' writes
+        """
+        if not self.result_cache:
+            return
+        
+        for result in results:
+            if self.memory_system:
+                await self.result_cache.invalidate_topic(result.request.topic)
+            if self.knowledge_graph:
+                concepts = await self._extract_concepts(result.request.query)
+                await self.result_cache.invalidate_terms(concepts)
+    
+    async def _store_deliberation_memories(self, results: List[DeliberationResult]):
         """
         Store deliberation results as memories using the new memory system
         """
         if not self.memory_system:
-            logger.warning("Memory system not available - skipping memory storage")
             return
-            
-        try:
-            # Store the complete deliberation in the memory system
-            await self.memory_system.store_deliberation(result.request, result)
-            logger.debug(f"Stored deliberation memory for topic: {result.blackboard_topic}")
-            
-        except Exception as e:
-            logger.error(f"Failed to store deliberation memories: {e}", exc_info=True)
+        
+        if hasattr(self.memory_system, 'store_deliberation_batch'):
+            await self.memory_system.store_deliberation_batch(
+                [(result.request, result) for result in results]
+            )
+        else:
+            for result in results:
+                await self.memory_system.store_deliberation(result.request, result)
+        logger.debug(f"Stored {len(results)} deliberation memories")
     
-    async def _update_knowledge_graph(self, result: DeliberationResult):
+    async def _update_knowledge_graph(self, results: List[DeliberationResult]):
         """
-        Update knowledge graph with concepts and relationships from deliberation
+        Update knowledge graph with concepts and relationships from deliberations
+        
+        Nodes and edges for the whole batch are collected first and upserted
+        with one batch call each when the graph supports it.
         """
-        try:
-            # Extract key concepts from the query
-            query_concepts = await self._extract_concepts(result.request.query)
-            
-            # Create or update nodes for key concepts
-            concept_nodes = []
-            for concept in query_concepts:
-                node = await self.knowledge_graph.add_node(
-                    name=concept,
-                    node_type=NodeType.CONCEPT,
-                    importance=0.7,  # Concepts from deliberations are fairly important
-                    attributes={'source': 'deliberation', 'topic': result.blackboard_topic}
-                )
-                concept_nodes.append(node)
+        if not self.knowledge_graph:
+            return
+        
+        # (name, type) -> (name, type, attributes, importance); first mention wins,
+        # matching add_node, which keeps an existing node unchanged
+        node_specs: Dict[Tuple[str, NodeType], Tuple[str, NodeType, Optional[Dict[str, Any]], float]] = {}
+        edge_specs: List[Tuple[Tuple[str, NodeType], Tuple[str, NodeType], EdgeType,
+                               float, float, Optional[Dict[str, Any]]]] = []
+        
+        def node(name: str, node_type: NodeType, importance: float,
+                 attributes: Optional[Dict[str, Any]] = None) -> Tuple[str, NodeType]:
+            key = (name, node_type)
+            node_specs.setdefault(key, (name, node_type, attributes, importance))
+            return key
+        
+        concept_count = 0
+        for result in results:
+            # Concepts from deliberations are fairly important
+            concept_keys = [
+                node(concept, NodeType.CONCEPT, 0.7,
+                     {'source': 'deliberation', 'topic': result.blackboard_topic})
+                for concept in await self._extract_concepts(result.request.query)
+            ]
+            concept_count += len(concept_keys)
             
-            # Create decision node
-            decision_node = await self.knowledge_graph.add_node(
-                name=f"Decision: {result.consensus.decision[:50]}",
-                node_type=NodeType.DECISION,
-                importance=min(1.0, result.consensus.confidence * 1.1),
-                attributes={
+            decision_key = node(
+                f"Decision: {result.consensus.decision[:50]}",
+                NodeType.DECISION,
+                min(1.0, result.consensus.confidence * 1.1),
+                {
                     'decision': result.consensus.decision,
                     'confidence': result.consensus.confidence,
                     'agreement_level': result.consensus.agreement_level,
@@ -664,61 +1013,74 @@ class Orchestrator:
             )
             
             # Link concepts to decision
-            for concept_node in concept_nodes:
-                await self.knowledge_graph.add_edge(
-                    source_id=concept_node.id,
-                    target_id=decision_node.id,
-                    edge_type=EdgeType.LEADS_TO,
-                    weight=result.consensus.confidence,
-                    confidence=0.8
-                )
+            for concept_key in concept_keys:
+                edge_specs.append((concept_key, decision_key, EdgeType.LEADS_TO,
+                                   result.consensus.confidence, 0.8, None))
             
             # Create persona expertise connections
             for response in result.persona_responses:
-                # Find or create persona node
-                persona_node = await self.knowledge_graph.add_node(
-                    name=f"Persona: {response.persona_id}",
-                    node_type=NodeType.PERSON,
-                    importance=0.8,
-                    attributes={'persona_type': 'ai_assistant'}
-                )
+                persona_key = node(f"Persona: {response.persona_id}", NodeType.PERSON, 0.8,
+                                   {'persona_type': 'ai_assistant'})
                 
                 # Link persona to decision with confidence as weight
-                await self.knowledge_graph.add_edge(
-                    source_id=persona_node.id,
-                    target_id=decision_node.id,
-                    edge_type=EdgeType.INFLUENCES,
-                    weight=response.confidence,
-                    confidence=response.confidence,
-                    attributes={
-                        'recommendation': response.recommendation,
-                        'concerns': response.concerns[:3],  # Top 3 concerns
-                        'opportunities': response.opportunities[:3]  # Top 3 opportunities
-                    }
-                )
+                edge_specs.append((persona_key, decision_key, EdgeType.INFLUENCES,
+                                   response.confidence, response.confidence, {
+                                       'recommendation': response.recommendation,
+                                       'concerns': response.concerns[:3],  # Top 3 concerns
+                                       'opportunities': response.opportunities[:3]  # Top 3 opportunities
+                                   }))
                 
                 # Link persona to concepts they have expertise in
                 persona = self.personas.get(response.persona_id)
                 if persona:
                     for domain in persona.expertise_domains[:3]:  # Top 3 domains
-                        domain_node = await self.knowledge_graph.add_node(
-                            name=domain,
-                            node_type=NodeType.SKILL,
-                            importance=0.6
-                        )
-                        
-                        await self.knowledge_graph.add_edge(
-                            source_id=persona_node.id,
-                            target_id=domain_node.id,
-                            edge_type=EdgeType.BELONGS_TO,
-                            weight=0.8,
-                            confidence=0.9
-                        )
-            
-            logger.debug(f"Updated knowledge graph with {len(concept_nodes)} concepts and 1 decision")
-            
-        except Exception as e:
-            logger.error(f"Failed to update knowledge graph: {e}", exc_info=True)
+                        domain_key = node(domain, NodeType.SKILL, 0.6)
+                        edge_specs.append((persona_key, domain_key, EdgeType.BELONGS_TO, 0.8, 0.9, None))
+        
+        node_ids = await self._upsert_graph_nodes(node_specs)
+        await self._upsert_graph_edges([
+            (node_ids[source], node_ids[target], edge_type, weight, confidence, attributes)
+            for source, target, edge_type, weight, confidence, attributes in edge_specs
+        ])
+        
+        logger.debug(f"Updated knowledge graph with {concept_count} concepts and "
+                     f"{len(results)} decisions")
+    
+    async def _upsert_graph_nodes(self,
+                                  node_specs: Dict[Tuple[str, NodeType], Tuple[str, NodeType, Optional[Dict[str, Any]], float]]
+                                  ) -> Dict[Tuple[str, NodeType], str]:
+        """Add nodes to the knowledge graph, returning their ids by (name, type)"""
+        keys = list(node_specs.keys())
+        specs = list(node_specs.values())
+        
+        if hasattr(self.knowledge_graph, 'add_node_batch'):
+            nodes = await self.knowledge_graph.add_node_batch(specs)
+        else:
+            nodes = [
+                await self.knowledge_graph.add_node(
+                    name=name, node_type=node_type, attributes=attributes, importance=importance
+                )
+                for name, node_type, attributes, importance in specs
+            ]
+        
+        return {key: graph_node.id for key, graph_node in zip(keys, nodes)}
+    
+    async def _upsert_graph_edges(self,
+                                  edge_specs: List[Tuple[str, str, EdgeType, float, float, Optional[Dict[str, Any]]]]):
+        """Add or reinforce edges in the knowledge graph"""
+        if hasattr(self.knowledge_graph, 'add_edge_batch'):
+            await self.knowledge_graph.add_edge_batch(edge_specs)
+            return
+        
+        for source_id, target_id, edge_type, weight, confidence, attributes in edge_specs:
+            await self.knowledge_graph.add_edge(
+                source_id=source_id,
+                target_id=target_id,
+                edge_type=edge_type,
+                weight=weight,
+                confidence=confidence,
+                attributes=attributes
+            )
     
     async def _extract_concepts(self, text: str) -> List[str]:
         """
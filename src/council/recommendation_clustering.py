@@ -0,0 +1,171 @@
+"""
+Recommendation Clustering - Grouping Equivalent Persona Recommendations
+
+Personas phrase the same advice differently, so grouping votes by the exact
+recommendation string leaves almost every recommendation in its own group.
+Recommendations are normalized, embedded locally with feature hashing of
+word tokens and character shingles, and clustered by cosine similarity in
+one matrix pass, so the cost stays small as the council grows.
+
+Word overlap cannot tell "Option 1" from "Option 2" or "migrate" from "do
+not migrate", so recommendations that cite disjoint numbers or differ in
+negation never share a cluster, however similar they look.
+"""
+
+import re
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Words that carry no meaning for whether two recommendations agree
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in',
+    'into', 'is', 'it', 'its', 'of', 'on', 'or', 'our', 'so', 'that', 'the',
+    'then', 'this', 'to', 'we', 'with', 'you', 'your'
+})
+
+# Words that flip a recommendation into its opposite
+NEGATIONS = frozenset({
+    'no', 'not', 'never', 'avoid', 'against', 'without', 'cannot', 'dont', 'don',
+    'shouldn', 'won'
+})
+
+_NON_WORD = re.compile(r"[^a-z0-9%.+#]+")
+_NUMBER = re.compile(r"^\d+(?:\.\d+)?%?$")
+
+
+def normalize_recommendation(text: str) -> List[str]:
+    """Lowercase word tokens of a recommendation without punctuation or stop words"""
+    tokens = (token.strip('.') for token in _NON_WORD.split(text.lower()))
+    return [token for token in tokens if token and token not in STOP_WORDS]
+
+
+class RecommendationClusterer:
+    """
+    Clusters persona recommendations by meaning rather than exact wording
+
+    Features:
+    - Feature-hashed vectors of word tokens and character shingles
+      (no model or vocabulary to fit)
+    - Cosine similarity of all recommendations in one matrix product
+    - Recommendations with disjoint numbers or opposite negation never join
+    - Greedy leader clustering: the most confident recommendation anchors
+      a cluster and absorbs everything similar enough to it
+    - Bounded cache of vectors for recommendations seen before
+    """
+
+    def __init__(self,
+                 threshold: float = 0.5,
+                 shingle_size: int = 3,
+                 dimensions: int = 4096,
+                 cache_size: int = 2048):
+        """
+        Args:
+            threshold: Minimum cosine similarity to join a cluster
+            shingle_size: Characters per shingle
+            dimensions: Size of the hashed feature space
+            cache_size: Recommendation vectors kept between calls
+        """
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.dimensions = dimensions
+        self.cache_size = cache_size
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def _features(self, text: str) -> Dict[int, float]:
+        """Hashed feature counts: each word once, plus its character shingles"""
+        features: Dict[int, float] = {}
+        n = self.shingle_size
+        for token in normalize_recommendation(text):
+            bucket = zlib.crc32(b'w:' + token.encode()) % self.dimensions
+            features[bucket] = features.get(bucket, 0.0) + 1.0
+
+            padded = f" {token} "
+            for i in range(max(1, len(padded) - n + 1)):
+                bucket = zlib.crc32(padded[i:i + n].encode()) % self.dimensions
+                features[bucket] = features.get(bucket, 0.0) + 0.5
+        return features
+
+    def vectorize(self, recommendations: Sequence[str]) -> np.ndarray:
+        """Unit-length hashed vectors, one row per recommendation"""
+        matrix = np.zeros((len(recommendations), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(recommendations):
+            vector = self._vectors.get(text)
+            if vector is None:
+                vector = np.zeros(self.dimensions, dtype=np.float32)
+                features = self._features(text)
+                if features:
+                    vector[list(features)] = list(features.values())
+                    vector /= np.linalg.norm(vector)
+                self._vectors[text] = vector
+                if len(self._vectors) > self.cache_size:
+                    self._vectors.popitem(last=False)
+            else:
+                self._vectors.move_to_end(text)
+            matrix[row] = vector
+        return matrix
+
+    def _conflicts(self, recommendations: Sequence[str]) -> np.ndarray:
+        """Pairs that cannot agree: disjoint cited numbers, or negation on one side only"""
+        tokens = [normalize_recommendation(text) for text in recommendations]
+        numbers = [frozenset(t for t in words if _NUMBER.match(t)) for words in tokens]
+        negated = np.array([any(t in NEGATIONS for t in words) for words in tokens])
+
+        vocabulary = {number: column for column, number in enumerate(set().union(*numbers))}
+        cited = np.zeros((len(numbers), len(vocabulary)), dtype=np.float32)
+        for row, cited_numbers in enumerate(numbers):
+            cited[row, [vocabulary[number] for number in cited_numbers]] = 1.0
+        has_numbers = cited.any(axis=1)
+        disjoint = (has_numbers[:, None] & has_numbers[None, :]) & ((cited @ cited.T) == 0)
+
+        return disjoint | (negated[:, None] != negated[None, :])
+
+    def similarity(self, recommendations: Sequence[str]) -> np.ndarray:
+        """Pairwise cosine similarity of the recommendations"""
+        vectors = self.vectorize(recommendations)
+        return vectors @ vectors.T
+
+    def cluster(self,
+                recommendations: Sequence[str],
+                priorities: Optional[Sequence[float]] = None) -> List[int]:
+        """
+        Cluster recommendations
+
+        Args:
+            recommendations: Recommendation texts
+            priorities: Order in which recommendations become cluster leaders
+                (e.g. confidence); ties keep input order
+
+        Returns:
+            For each recommendation, the index of its cluster's leader
+        """
+        count = len(recommendations)
+        if count == 0:
+            return []
+
+        similarity = self.similarity(recommendations)
+        # Identical texts always agree, even when they have no features
+        texts = np.array(recommendations, dtype=object)
+        joins = (similarity >= self.threshold) & ~self._conflicts(recommendations)
+        joins |= texts[:, None] == texts[None, :]
+
+        if priorities is None:
+            order = np.arange(count)
+        else:
+            order = np.argsort(-np.asarray(priorities, dtype=np.float64), kind='stable')
+
+        leaders = np.full(count, -1, dtype=np.int64)
+        for leader in order:
+            if leaders[leader] >= 0:
+                continue
+            members = joins[leader] & (leaders < 0)
+            leaders[members] = leader
+        return leaders.tolist()
+
+    def canonical(self,
+                  recommendations: Sequence[str],
+                  priorities: Optional[Sequence[float]] = None) -> List[str]:
+        """For each recommendation, the text of its cluster's leader"""
+        return [recommendations[leader] for leader in self.cluster(recommendations, priorities)]
@@ -0,0 +1,395 @@
+"""
+Write-Behind Persistence - Background Storage of Deliberation Results
+
+Deliberation results are appended to a durable SQLite journal and persisted
+by a background worker, so deliberate() returns without waiting on the
+memory system or the knowledge graph.
+
+The worker drains the journal in batches through an ordered list of stages
+(memory inserts, graph upserts, cache invalidation). Completed stages are
+recorded per job, so a retry after a partial failure does not repeat writes
+that already succeeded. Failed batches are retried with exponential backoff
+and jobs that keep failing are parked in the journal as dead letters. Jobs
+still pending at shutdown or after a crash are replayed on the next start.
+"""
+
+import asyncio
+import logging
+import pickle
+import sqlite3
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# A stage persists one kind of data for a batch of payloads and raises on failure
+StageHandler = Callable[[List[Any]], Awaitable[None]]
+
+
+class WriteBehindJournal:
+    """
+    SQLite journal of pending persistence jobs
+
+    The database file is only created on the first write. Pass db_path=None
+    for a journal that keeps nothing on disk.
+    """
+
+    def __init__(self, db_path: Optional[str] = "data/council/persistence_queue.db"):
+        self.db_path = db_path
+        self._initialized = False
+
+    @property
+    def durable(self) -> bool:
+        return self.db_path is not None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use"""
+        if not self._initialized:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS persistence_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at REAL NOT NULL,
+                    payload BLOB NOT NULL,
+                    done_stages TEXT NOT NULL DEFAULT '',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    last_error TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_persistence_jobs_status
+                ON persistence_jobs(status, id)
+            """)
+            conn.commit()
+            self._initialized = True
+
+        return conn
+
+    def _exists(self) -> bool:
+        return self.durable and (self._initialized or Path(self.db_path).exists())
+
+    def append(self, payload: bytes) -> Optional[int]:
+        """Journal a payload, returning its job id"""
+        if not self.durable:
+            return None
+
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "INSERT INTO persistence_jobs (created_at, payload) VALUES (?, ?)",
+                (time.time(), payload)
+            )
+            conn.commit()
+            return cursor.lastrowid
+        finally:
+            conn.close()
+
+    def load_pending(self) -> List[Tuple[int, bytes, Set[str], int]]:
+        """Pending jobs in journal order as (id, payload, done_stages, attempts)"""
+        if not self._exists():
+            return []
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT id, payload, done_stages, attempts FROM persistence_jobs "
+                "WHERE status = 'pending' ORDER BY id"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [
+            (job_id, payload, set(filter(None, done.split(','))), attempts)
+            for job_id, payload, done, attempts in rows
+        ]
+
+    def update(self, jobs: Sequence["_Job"], error: Optional[str] = None):
+        """Record stage progress and attempt counts for jobs"""
+        rows = [
+            (','.join(sorted(job.done_stages)), job.attempts, error, job.job_id)
+            for job in jobs if job.job_id is not None
+        ]
+        if not rows or not self._exists():
+            return
+
+        conn = self._connect()
+        try:
+            conn.executemany(
+                "UPDATE persistence_jobs SET done_stages = ?, attempts = ?, last_error = ? WHERE id = ?",
+                rows
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def complete(self, job_ids: Sequence[Optional[int]]):
+        """Remove finished jobs"""
+        self._execute_many("DELETE FROM persistence_jobs WHERE id = ?", job_ids)
+
+    def dead_letter(self, job_ids: Sequence[Optional[int]]):
+        """Park jobs that exhausted their retries"""
+        self._execute_many("UPDATE persistence_jobs SET status = 'failed' WHERE id = ?", job_ids)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pending and failed job counts"""
+        if not self._exists():
+            return {'journal_pending': 0, 'journal_failed': 0}
+
+        conn = self._connect()
+        try:
+            counts = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM persistence_jobs GROUP BY status"
+            ).fetchall())
+        finally:
+            conn.close()
+
+        return {'journal_pending': counts.get('pending', 0), 'journal_failed': counts.get('failed', 0)}
+
+    def _execute_many(self, sql: str, job_ids: Sequence[Optional[int]]):
+        rows = [(job_id,) for job_id in job_ids if job_id is not None]
+        if not rows or not self._exists():
+            return
+
+        conn = self._connect()
+        try:
+            conn.executemany(sql, rows)
+            conn.commit()
+        finally:
+            conn.close()
+
+
+@dataclass(eq=False)
+class _Job:
+    """A payload waiting to be persisted"""
+    job_id: Optional[int]
+    payload: Any
+    done_stages: Set[str] = field(default_factory=set)
+    attempts: int = 0
+
+
+class WriteBehindPipeline:
+    """
+    Durable, batching write-behind queue in front of slow persistence
+
+    Features:
+    - Journal-backed queue that survives restarts
+    - Batched stage handlers with per-job stage tracking
+    - Retry with exponential backoff and dead-lettering
+    - flush() and stop() for graceful shutdown
+    """
+
+    def __init__(self,
+                 stages: Sequence[Tuple[str, StageHandler]],
+                 journal: Optional[WriteBehindJournal] = None,
+                 batch_size: int = 32,
+                 batch_delay: float = 0.05,
+                 max_retries: int = 5,
+                 base_backoff: float = 0.5,
+                 max_backoff: float = 30.0):
+        """
+        Args:
+            stages: Ordered (name, handler) pairs run for every batch
+            journal: Durable journal (default: in-memory only)
+            batch_size: Maximum payloads handed to a stage at once
+            batch_delay: Seconds to wait for more payloads before a batch runs
+            max_retries: Failed attempts before a job is dead-lettered
+            base_backoff: Delay before the first retry, doubled per attempt
+            max_backoff: Upper bound on the retry delay
+        """
+        self.stages = list(stages)
+        self.journal = journal or WriteBehindJournal(db_path=None)
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._queue: Deque[_Job] = deque()
+        self._in_flight = 0
+        self._worker: Optional[asyncio.Task] = None
+        self._recovered = False
+        self._stopping = False
+
+        self.submitted = 0
+        self.persisted = 0
+        self.retries = 0
+        self.dead_letters = 0
+
+    async def submit(self, payload: Any):
+        """
+        Queue a payload for persistence and return immediately
+
+        The payload is journaled before this returns, so it is replayed if
+        the process dies before the worker persists it.
+        """
+        await self._recover()
+
+        job_id = None
+        if self.journal.durable:
+            try:
+                job_id = await asyncio.to_thread(self.journal.append, pickle.dumps(payload))
+            except Exception as e:
+                logger.warning(f"Could not journal persistence job, keeping it in memory only: {e}")
+
+        self._queue.append(_Job(job_id=job_id, payload=payload))
+        self.submitted += 1
+        self._ensure_worker()
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued payload has been persisted or dead-lettered
+
+        Returns:
+            False if the timeout expired first
+        """
+        await self._recover()
+        while self._worker is not None and not self._worker.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(self._worker), timeout)
+            except asyncio.TimeoutError:
+                return False
+            except Exception as e:
+                logger.error(f"Write-behind worker failed: {e}", exc_info=True)
+                break
+        return not self._queue
+
+    async def stop(self, timeout: float = 10.0):
+        """
+        Flush on shutdown, leaving anything unfinished in the journal
+
+        Jobs still queued when the timeout expires are replayed by the next
+        pipeline that opens the same journal.
+        """
+        if not await self.flush(timeout):
+            logger.warning(f"Stopping write-behind pipeline with "
+                           f"{len(self._queue) + self._in_flight} jobs unpersisted")
+        self._stopping = True
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and outcome counters"""
+        return {
+            'queued': len(self._queue) + self._in_flight,
+            'submitted': self.submitted,
+            'persisted': self.persisted,
+            'retries': self.retries,
+            'dead_letters': self.dead_letters,
+            'durable': self.journal.durable,
+            'worker_running': self._worker is not None and not self._worker.done()
+        }
+
+    async def _recover(self):
+        """Requeue jobs left in the journal by a previous process"""
+        if self._recovered:
+            return
+        self._recovered = True
+
+        try:
+            pending = await asyncio.to_thread(self.journal.load_pending)
+        except Exception as e:
+            logger.error(f"Failed to read persistence journal: {e}")
+            return
+
+        recovered = []
+        for job_id, payload, done_stages, attempts in pending:
+            try:
+                recovered.append(_Job(job_id, pickle.loads(payload), done_stages, attempts))
+            except Exception as e:
+                logger.error(f"Dropping unreadable persistence job {job_id}: {e}")
+                await asyncio.to_thread(self.journal.dead_letter, [job_id])
+
+        if recovered:
+            logger.info(f"Replaying {len(recovered)} persistence jobs from the journal")
+            self._queue.extendleft(reversed(recovered))
+            self._ensure_worker()
+
+    def _ensure_worker(self):
+        if self._stopping:
+            return
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+
+    async def _drain(self):
+        """Persist queued jobs batch by batch until the queue is empty"""
+        while self._queue:
+            if len(self._queue) < self.batch_size and self.batch_delay > 0:
+                # Let concurrent deliberations join the batch
+                await asyncio.sleep(self.batch_delay)
+
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            self._in_flight = len(batch)
+            try:
+                failed, error = await self._run_stages(batch)
+            finally:
+                self._in_flight = 0
+
+            finished = [job for job in batch if job not in failed]
+            if finished:
+                await asyncio.to_thread(self.journal.complete, [job.job_id for job in finished])
+                self.persisted += len(finished)
+
+            if not failed:
+                continue
+
+            retryable = []
+            exhausted = []
+            for job in failed:
+                job.attempts += 1
+                (exhausted if job.attempts >= self.max_retries else retryable).append(job)
+
+            await asyncio.to_thread(self.journal.update, failed, error)
+            if exhausted:
+                logger.error(f"Dead-lettering {len(exhausted)} persistence jobs after "
+                             f"{self.max_retries} attempts: {error}")
+                await asyncio.to_thread(self.journal.dead_letter, [job.job_id for job in exhausted])
+                self.dead_letters += len(exhausted)
+
+            if retryable:
+                self.retries += len(retryable)
+                self._queue.extendleft(reversed(retryable))
+                attempts = max(job.attempts for job in retryable)
+                delay = min(self.max_backoff, self.base_backoff * 2 ** (attempts - 1))
+                logger.warning(f"Persistence batch failed, retrying in {delay:.1f}s: {error}")
+                await asyncio.sleep(delay)
+
+    async def _run_stages(self, batch: List[_Job]) -> Tuple[List[_Job], Optional[str]]:
+        """
+        Run every stage a job still needs
+
+        Returns:
+            Jobs with an unfinished stage, and the last error message
+        """
+        failed: List[_Job] = []
+        error = None
+
+        for name, handler in self.stages:
+            # A job whose earlier stage failed must not run later stages
+            jobs = [job for job in batch if name not in job.done_stages and job not in failed]
+            if not jobs:
+                continue
+            try:
+                await handler([job.payload for job in jobs])
+            except Exception as e:
+                error = f"{name}: {e}"
+                failed.extend(jobs)
+                continue
+            for job in jobs:
+                job.done_stages.add(name)
+
+        return failed, error
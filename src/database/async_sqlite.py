@@ -0,0 +1,258 @@
+"""
+Async SQLite Access Layer
+
+Runs SQLite statements off the event loop. Writes go to a single writer
+thread that groups queued statements into one transaction per batch, so
+concurrent callers share a commit instead of contending for the database
+lock. Reads run on a small pool of reader threads, each with its own
+connection; in WAL mode they proceed while the writer is committing.
+
+Every call returns an awaitable that resolves once the statement has run
+(for writes, once the batch containing it has committed).
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Empty, Queue
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=10000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB
+)
+
+
+@dataclass
+class _WriteJob:
+    """A unit of work for the writer thread"""
+    work: Callable[[sqlite3.Connection], Any]
+    future: Future
+
+
+class AsyncSQLite:
+    """
+    Awaitable SQLite access with a batching writer thread and reader pool
+
+    Features:
+    - Single writer thread, one transaction per batch of queued writes
+    - Savepoint per write, so one failing statement does not fail its batch
+    - Reader thread pool with per-thread connections
+    - WAL mode on every connection
+    - Statement and batch statistics
+    """
+
+    def __init__(self,
+                 db_path: str,
+                 readers: int = 4,
+                 max_batch: int = 256,
+                 timeout: float = 30.0):
+        """
+        Args:
+            db_path: SQLite database file
+            readers: Reader threads (and connections)
+            max_batch: Most writes committed in one transaction
+            timeout: Seconds a connection waits on a locked database
+        """
+        self.db_path = db_path
+        self.max_batch = max_batch
+        self.timeout = timeout
+
+        self._write_queue: "Queue[Optional[_WriteJob]]" = Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="sqlite-reader")
+        self._reader_local = threading.local()
+        self._reader_connections: List[sqlite3.Connection] = []
+        self._closed = False
+
+        self.reads = 0
+        self.writes = 0
+        self.batches = 0
+        self.write_errors = 0
+        self.max_batch_seen = 0
+        self.commit_time = 0.0
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection with the layer's pragmas (for synchronous startup work)"""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            isolation_level=None,  # transactions are managed explicitly
+            check_same_thread=False
+        )
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    # Writes
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Run a write statement, returning the affected row count"""
+        return await self.write(lambda conn: conn.execute(sql, params).rowcount)
+
+    async def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Run a write statement for every row, returning the affected row count"""
+        rows = list(rows)
+        if not rows:
+            return 0
+        return await self.write(lambda conn: conn.executemany(sql, rows).rowcount)
+
+    async def write(self, work: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Run a function on the writer connection inside the current batch
+
+        The function must not commit; it is wrapped in a savepoint and the
+        batch commits after it.
+        """
+        if self._closed:
+            raise RuntimeError(f"SQLite access layer for {self.db_path} is closed")
+        future: Future = Future()
+        self._ensure_writer()
+        self._write_queue.put(_WriteJob(work, future))
+        return await asyncio.wrap_future(future)
+
+    # Reads
+
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """Run a query on a reader thread and return every row"""
+        return await self.read(lambda conn: conn.execute(sql, params).fetchall())
+
+    async def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        """Run a query on a reader thread and return the first row"""
+        return await self.read(lambda conn: conn.execute(sql, params).fetchone())
+
+    async def read(self, work: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a function with a reader connection on a reader thread"""
+        if self._closed:
+            raise RuntimeError(f"SQLite access layer for {self.db_path} is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, self._run_read, work)
+
+    def _run_read(self, work: Callable[[sqlite3.Connection], T]) -> T:
+        conn = getattr(self._reader_local, 'conn', None)
+        if conn is None:
+            conn = self.connect()
+            self._reader_local.conn = conn
+            self._reader_connections.append(conn)
+        self.reads += 1
+        return work(conn)
+
+    # Writer thread
+
+    def _ensure_writer(self):
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name=f"sqlite-writer:{Path(self.db_path).name}", daemon=True
+                )
+                self._writer.start()
+
+    def _writer_loop(self):
+        conn = self.connect()
+        try:
+            while True:
+                job = self._write_queue.get()
+                if job is None:
+                    return
+
+                # Group whatever else is already queued into the same transaction
+                batch = [job]
+                stop = False
+                while len(batch) < self.max_batch:
+                    try:
+                        job = self._write_queue.get_nowait()
+                    except Empty:
+                        break
+                    if job is None:
+                        stop = True
+                        break
+                    batch.append(job)
+
+                self._commit_batch(conn, batch)
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _commit_batch(self, conn: sqlite3.Connection, batch: List[_WriteJob]):
+        started = time.perf_counter()
+        results: List[Any] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for job in batch:
+                conn.execute("SAVEPOINT job")
+                try:
+                    results.append((True, job.work(conn)))
+                    conn.execute("RELEASE job")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO job")
+                    conn.execute("RELEASE job")
+                    results.append((False, e))
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"SQLite batch commit failed for {self.db_path}: {e}")
+            self.write_errors += len(batch)
+            for job in batch:
+                job.future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.writes += len(batch)
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        self.commit_time += time.perf_counter() - started
+
+        for job, (ok, value) in zip(batch, results):
+            if ok:
+                job.future.set_result(value)
+            else:
+                self.write_errors += 1
+                job.future.set_exception(value)
+
+    # Lifecycle
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statement counts and batching efficiency"""
+        return {
+            'reads': self.reads,
+            'writes': self.writes,
+            'write_batches': self.batches,
+            'avg_batch_size': self.writes / self.batches if self.batches else 0.0,
+            'max_batch_size': self.max_batch_seen,
+            'write_errors': self.write_errors,
+            'pending_writes': self._write_queue.qsize(),
+            'avg_commit_ms': (self.commit_time / self.batches * 1000) if self.batches else 0.0
+        }
+
+    def close(self, timeout: float = 10.0):
+        """Finish queued writes, then stop the writer and readers"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None and self._writer.is_alive():
+            self._write_queue.put(None)
+            self._writer.join(timeout)
+        self._readers.shutdown(wait=True)
+        for conn in self._reader_connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._reader_connections.clear()
@@ -17,6 +17,8 @@ import sqlite3
 import threading
 from queue import Queue, Empty
 
+from .async_sqlite import AsyncSQLite
+
 
 @dataclass
 class DatabaseConfig:
@@ -146,6 +148,8 @@ class DatabaseManager:
         self._redis_pool = None
         self._memory_pool = None
         self._knowledge_pool = None
+        self._memory_db: Optional[AsyncSQLite] = None
+        self._knowledge_db: Optional[AsyncSQLite] = None
         self._initialized = False
     
     async def initialize(self):
@@ -236,6 +240,24 @@ class DatabaseManager:
         """Return a Knowledge Graph SQLite connection"""
         self._knowledge_pool.return_connection(conn)
     
+    def get_memory_db(self) -> AsyncSQLite:
+        """Get the async Memory System SQLite access layer"""
+        if self._memory_db is None:
+            self._memory_db = AsyncSQLite(
+                self.config.memory_db_path,
+                timeout=self.config.sqlite_timeout
+            )
+        return self._memory_db
+    
+    def get_knowledge_db(self) -> AsyncSQLite:
+        """Get the async Knowledge Graph SQLite access layer"""
+        if self._knowledge_db is None:
+            self._knowledge_db = AsyncSQLite(
+                self.config.knowledge_db_path,
+                timeout=self.config.sqlite_timeout
+            )
+        return self._knowledge_db
+    
     async def close(self):
         """Close all database connections"""
         if self._postgres_engine:
@@ -250,6 +272,13 @@ class DatabaseManager:
         if self._knowledge_pool:
             self._knowledge_pool.close_all()
         
+        # Let queued writes commit without blocking the loop
+        for db in (self._memory_db, self._knowledge_db):
+            if db is not None:
+                await asyncio.to_thread(db.close)
+        self._memory_db = None
+        self._knowledge_db = None
+        
         self._initialized = False
     
     async def health_check(self) -> Dict[str, bool]:
@@ -280,20 +309,14 @@ class DatabaseManager:
         
         # Check Memory DB
         try:
-            conn = self.get_memory_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            self.return_memory_connection(conn)
+            await self.get_memory_db().fetchone("SELECT 1")
             health["memory_db"] = True
         except Exception:
             pass
         
         # Check Knowledge DB
         try:
-            conn = self.get_knowledge_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            self.return_knowledge_connection(conn)
+            await self.get_knowledge_db().fetchone("SELECT 1")
             health["knowledge_db"] = True
         except Exception:
             pass
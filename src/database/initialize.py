@@ -134,6 +134,7 @@ async def create_data_directories():
         "data",
         "data/memory",
         "data/knowledge",
+        "data/blackboard",
         "data/backups",
         "data/logs"
     ]
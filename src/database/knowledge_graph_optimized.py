@@ -24,6 +24,7 @@ import zlib
 import base64
 
 from .config import get_database_manager, DatabaseManager
+from .lazy_loading import PartitionLoader
 
 
 class NodeType(Enum):
@@ -199,15 +200,28 @@ class OptimizedKnowledgeGraph:
     High-performance knowledge graph with persistent storage and advanced features:
     - Persistent SQLite storage with graph optimizations
     - Connection pooling and transaction management
+    - Non-blocking queries through a batching writer thread and reader pool
     - Advanced caching layer for frequent operations
     - Batch operations for bulk inserts/updates
     - Graph algorithm optimizations
     - Subgraph caching and materialized views
     - Semantic similarity with embeddings
+    - Optional lazy startup: node neighbourhoods are paged in on first
+      access while a background warm-up loads the rest
     """
     
-    def __init__(self, db_manager: Optional[DatabaseManager] = None, cache_size: int = 10000):
+    _NODE_COLUMNS = '''id, name, node_type, attributes, created_at, updated_at, 
+                   importance, personas_relevance, access_count, last_accessed, 
+                   version, embedding_vector'''
+    _EDGE_COLUMNS = '''id, source_id, target_id, edge_type, weight, attributes, 
+                           created_at, confidence, last_reinforced, reinforcement_count, decay_rate'''
+    
+    def __init__(self,
+                 db_manager: Optional[DatabaseManager] = None,
+                 cache_size: int = 10000,
+                 lazy: bool = False):
         self.db_manager = db_manager or get_database_manager()
+        self.db = self.db_manager.get_knowledge_db()
         self.graph = nx.DiGraph()
         self.nodes: Dict[str, Node] = {}
         self.edges: Dict[str, Edge] = {}
@@ -225,8 +239,17 @@ class OptimizedKnowledgeGraph:
             'batch_operations': 0
         }
         
+        self._partitions: Optional[PartitionLoader] = None
+        
         self._init_database()
-        self._load_graph()
+        if lazy:
+            self._partitions = PartitionLoader(
+                "optimized_knowledge_graph",
+                load=self._load_neighbourhoods,
+                list_partitions=self._list_nodes
+            )
+        else:
+            self._load_graph()
     
     def _init_database(self):
         """Initialize optimized SQLite database with graph-specific optimizations"""
@@ -414,17 +437,41 @@ class OptimizedKnowledgeGraph:
         cursor = conn.cursor()
         
         # Load nodes in batches ordered by importance
-        cursor.execute('''
-            SELECT id, name, node_type, attributes, created_at, updated_at, 
-                   importance, personas_relevance, access_count, last_accessed, 
-                   version, embedding_vector
+        cursor.execute(f'''
+            SELECT {self._NODE_COLUMNS}
             FROM nodes 
             ORDER BY importance DESC, access_count DESC
             LIMIT ?
         ''', (limit,))
         
+        nodes_loaded = self._add_node_rows(cursor.fetchall())
+        
+        # Load edges for loaded nodes only
+        node_ids = list(self.nodes.keys())
+        if node_ids:
+            # Use batch loading for edges
+            batch_size = 1000
+            for i in range(0, len(node_ids), batch_size):
+                batch_ids = node_ids[i:i+batch_size]
+                placeholders = ','.join(['?' for _ in batch_ids])
+                
+                cursor.execute(f'''
+                    SELECT {self._EDGE_COLUMNS}
+                    FROM edges 
+                    WHERE source_id IN ({placeholders}) AND target_id IN ({placeholders})
+                    ORDER BY weight DESC, confidence DESC
+                ''', batch_ids + batch_ids)
+                self._add_edge_rows(cursor.fetchall())
+        
+        self.db_manager.return_knowledge_connection(conn)
+        print(f"Loaded {nodes_loaded} nodes and {len(self.edges)} edges into memory")
+    
+    def _add_node_rows(self, rows: List[Tuple]) -> int:
+        """Add node rows to the in-memory graph, returning how many were new"""
         nodes_loaded = 0
-        for row in cursor.fetchall():
+        for row in rows:
+            if row[0] in self.nodes:
+                continue
             try:
                 # Deserialize embedding if present
                 embedding_vector = None
@@ -455,51 +502,87 @@ class OptimizedKnowledgeGraph:
                 
             except Exception as e:
                 print(f"Error loading node {row[0]}: {e}")
-        
-        # Load edges for loaded nodes only
-        node_ids = list(self.nodes.keys())
-        if node_ids:
-            # Use batch loading for edges
-            batch_size = 1000
-            for i in range(0, len(node_ids), batch_size):
-                batch_ids = node_ids[i:i+batch_size]
-                placeholders = ','.join(['?' for _ in batch_ids])
-                
-                cursor.execute(f'''
-                    SELECT id, source_id, target_id, edge_type, weight, attributes, 
-                           created_at, confidence, last_reinforced, reinforcement_count, decay_rate
-                    FROM edges 
-                    WHERE source_id IN ({placeholders}) AND target_id IN ({placeholders})
-                    ORDER BY weight DESC, confidence DESC
-                ''', batch_ids + batch_ids)
+        return nodes_loaded
+    
+    def _add_edge_rows(self, rows: List[Tuple]):
+        """Add edge rows whose endpoints are both in memory"""
+        for row in rows:
+            if row[0] in self.edges:
+                continue
+            try:
+                edge = Edge(
+                    id=row[0],
+                    source_id=row[1],
+                    target_id=row[2],
+                    edge_type=EdgeType(row[3]),
+                    weight=row[4] if row[4] else 1.0,
+                    attributes=json.loads(row[5]) if row[5] else {},
+                    created_at=datetime.fromisoformat(row[6]) if row[6] else datetime.now(),
+                    confidence=row[7] if row[7] else 0.5,
+                    last_reinforced=datetime.fromisoformat(row[8]) if row[8] else None,
+                    reinforcement_count=row[9] if row[9] else 1,
+                    decay_rate=row[10] if row[10] else 0.01
+                )
                 
-                for row in cursor.fetchall():
-                    try:
-                        edge = Edge(
-                            id=row[0],
-                            source_id=row[1],
-                            target_id=row[2],
-                            edge_type=EdgeType(row[3]),
-                            weight=row[4] if row[4] else 1.0,
-                            attributes=json.loads(row[5]) if row[5] else {},
-                            created_at=datetime.fromisoformat(row[6]) if row[6] else datetime.now(),
-                            confidence=row[7] if row[7] else 0.5,
-                            last_reinforced=datetime.fromisoformat(row[8]) if row[8] else None,
-                            reinforcement_count=row[9] if row[9] else 1,
-                            decay_rate=row[10] if row[10] else 0.01
-                        )
-                        
-                        # Only add if both nodes exist
-                        if edge.source_id in self.nodes and edge.target_id in self.nodes:
-                            self.edges[edge.id] = edge
-                            self.graph.add_edge(edge.source_id, edge.target_id, 
-                                              edge_id=edge.id, edge=edge, weight=edge.weight)
-                    
-                    except Exception as e:
-                        print(f"Error loading edge {row[0]}: {e}")
-        
-        self.db_manager.return_knowledge_connection(conn)
-        print(f"Loaded {nodes_loaded} nodes and {len(self.edges)} edges into memory")
+                # Only add if both nodes exist
+                if edge.source_id in self.nodes and edge.target_id in self.nodes:
+                    self.edges[edge.id] = edge
+                    self.graph.add_edge(edge.source_id, edge.target_id, 
+                                      edge_id=edge.id, edge=edge, weight=edge.weight)
+            
+            except Exception as e:
+                print(f"Error loading edge {row[0]}: {e}")
+    
+    async def _load_neighbourhoods(self, node_ids: List[str]):
+        """Page in some nodes, the edges touching them and the other endpoints"""
+        def fetch(conn):
+            placeholders = ','.join(['?' for _ in node_ids])
+            edge_rows = conn.execute(f'''
+                SELECT {self._EDGE_COLUMNS}
+                FROM edges 
+                WHERE source_id IN ({placeholders}) OR target_id IN ({placeholders})
+            ''', node_ids + node_ids).fetchall()
+            
+            wanted = set(node_ids)
+            for row in edge_rows:
+                wanted.update((row[1], row[2]))
+            wanted = [nid for nid in wanted if nid not in self.nodes]
+            
+            node_rows = []
+            for i in range(0, len(wanted), 500):
+                batch_ids = wanted[i:i+500]
+                node_rows.extend(conn.execute(f'''
+                    SELECT {self._NODE_COLUMNS}
+                    FROM nodes WHERE id IN ({','.join(['?' for _ in batch_ids])})
+                ''', batch_ids).fetchall())
+            return node_rows, edge_rows
+        
+        node_rows, edge_rows = await self.db.read(fetch)
+        self._add_node_rows(node_rows)
+        self._add_edge_rows(edge_rows)
+        self.query_stats['db_queries'] += 1
+    
+    async def _list_nodes(self) -> List[str]:
+        """Every stored node id in load priority order"""
+        rows = await self.db.fetchall(
+            'SELECT id FROM nodes ORDER BY importance DESC, access_count DESC'
+        )
+        return [row[0] for row in rows]
+    
+    async def _ensure_loaded(self, node_ids: Optional[List[str]] = None):
+        """In lazy mode, load some node neighbourhoods (or the whole graph)"""
+        if self._partitions is None:
+            return
+        if node_ids is None:
+            await self._partitions.ensure_all()
+        else:
+            await self._partitions.ensure(node_ids)
+    
+    def get_loading_status(self) -> Dict[str, Any]:
+        """Lazy loading progress (always ready when loaded eagerly)"""
+        if self._partitions is None:
+            return {'state': 'ready', 'lazy': False}
+        return {**self._partitions.get_stats(), 'lazy': True}
     
     async def add_node_batch(self, nodes_data: List[Tuple[str, NodeType, Optional[Dict[str, Any]], float]]) -> List[Node]:
         """Add multiple nodes in a batch operation"""
@@ -509,10 +592,11 @@ class OptimizedKnowledgeGraph:
         nodes = []
         timestamp = datetime.now()
         
-        for name, node_type, attributes, importance in nodes_data:
-            # Generate node ID
-            node_id = hashlib.md5(f"{name}{node_type.value}".encode()).hexdigest()[:16]
-            
+        node_ids = [hashlib.md5(f"{name}{node_type.value}".encode()).hexdigest()[:16]
+                    for name, node_type, _, _ in nodes_data]
+        await self._ensure_loaded(node_ids)
+        
+        for node_id, (name, node_type, attributes, importance) in zip(node_ids, nodes_data):
             # Check if already exists
             if node_id in self.nodes:
                 nodes.append(self.nodes[node_id])
@@ -555,6 +639,8 @@ class OptimizedKnowledgeGraph:
         edges = []
         timestamp = datetime.now()
         
+        await self._ensure_loaded([nid for edge in edges_data for nid in edge[:2]])
+        
         for source_id, target_id, edge_type, weight, confidence, attributes in edges_data:
             # Verify nodes exist
             if source_id not in self.nodes or target_id not in self.nodes:
@@ -610,6 +696,7 @@ class OptimizedKnowledgeGraph:
         
         self.query_stats['cache_misses'] += 1
         
+        await self._ensure_loaded([node_id])
         if node_id not in self.nodes:
             return {'nodes': [], 'edges': []}
         
@@ -625,9 +712,6 @@ class OptimizedKnowledgeGraph:
     
     async def _find_related_database(self, node_id: str, max_depth: int, edge_types: Optional[List[EdgeType]], min_weight: float) -> Dict[str, Any]:
         """Database-assisted graph traversal for large graphs"""
-        conn = self.db_manager.get_knowledge_connection()
-        cursor = conn.cursor()
-        
         # Use recursive CTE for graph traversal
         edge_type_filter = ""
         params = [node_id, min_weight]
@@ -671,35 +755,29 @@ class OptimizedKnowledgeGraph:
             LIMIT 1000
         '''
         
-        cursor.execute(traversal_query, [node_id, node_id] + params)
-        related_nodes = []
-        
-        for row in cursor.fetchall():
-            if row[0] in self.nodes:
-                related_nodes.append(self.nodes[row[0]])
-        
-        # Get edges between found nodes
-        if related_nodes:
-            node_ids = [node_id] + [n.id for n in related_nodes]
-            placeholders = ','.join(['?' for _ in node_ids])
+        def traverse(conn):
+            node_rows = conn.execute(traversal_query, [node_id, node_id] + params).fetchall()
+            found_ids = [row[0] for row in node_rows]
+            if not found_ids:
+                return found_ids, []
             
-            cursor.execute(f'''
+            # Get edges between found nodes
+            node_ids = [node_id] + found_ids
+            placeholders = ','.join(['?' for _ in node_ids])
+            edge_rows = conn.execute(f'''
                 SELECT e.id, e.source_id, e.target_id, e.edge_type, e.weight, e.confidence
                 FROM edges e
                 WHERE e.source_id IN ({placeholders}) 
                   AND e.target_id IN ({placeholders})
                   AND e.weight >= ?
                 ORDER BY e.weight DESC
-            ''', node_ids + node_ids + [min_weight])
-            
-            related_edges = []
-            for row in cursor.fetchall():
-                if row[0] in self.edges:
-                    related_edges.append(self.edges[row[0]])
-        else:
-            related_edges = []
+            ''', node_ids + node_ids + [min_weight]).fetchall()
+            return found_ids, [row[0] for row in edge_rows]
         
-        self.db_manager.return_knowledge_connection(conn)
+        found_ids, edge_ids = await self.db.read(traverse)
+        await self._ensure_loaded(found_ids)
+        related_nodes = [self.nodes[nid] for nid in found_ids if nid in self.nodes]
+        related_edges = [self.edges[eid] for eid in edge_ids if eid in self.edges]
         self.query_stats['db_queries'] += 1
         
         return {'nodes': related_nodes, 'edges': related_edges}
@@ -718,6 +796,10 @@ class OptimizedKnowledgeGraph:
             
             visited.add(current_id)
             
+            # Page in the whole frontier at once
+            if self._partitions is not None and not self._partitions.is_loaded(current_id):
+                await self._partitions.ensure([current_id] + [queued for queued, _ in queue])
+            
             if depth > 0 and current_id in self.nodes:
                 related['nodes'].append(self.nodes[current_id])
                 # Update access count
@@ -752,6 +834,7 @@ class OptimizedKnowledgeGraph:
                                            decay: float = 0.5,
                                            min_activation: float = 0.1) -> Dict[str, float]:
         """Optimized spreading activation with early termination and batch updates"""
+        await self._ensure_loaded()
         
         # Check cache
         cache_key = f"activation_{sorted(seed_nodes)}_{iterations}_{decay}_{min_activation}"
@@ -814,6 +897,7 @@ class OptimizedKnowledgeGraph:
     
     async def calculate_centrality_optimized(self, centrality_type: str = 'betweenness') -> Dict[str, float]:
         """Optimized centrality calculation with caching and sampling"""
+        await self._ensure_loaded()
         
         cache_key = f"centrality_{centrality_type}_{len(self.graph.nodes())}"
         cached_result = self.cache.get(cache_key)
@@ -865,6 +949,7 @@ class OptimizedKnowledgeGraph:
                                    min_importance: float = 0.0,
                                    max_nodes: int = 1000) -> nx.DiGraph:
         """Get optimized subgraph with caching"""
+        await self._ensure_loaded()
         
         # Generate cache key
         cache_key = f"subgraph_{node_types}_{edge_types}_{min_importance}_{max_nodes}"
@@ -888,9 +973,6 @@ class OptimizedKnowledgeGraph:
     
     async def _get_subgraph_database(self, node_types, edge_types, min_importance, max_nodes) -> nx.DiGraph:
         """Database-assisted subgraph extraction"""
-        conn = self.db_manager.get_knowledge_connection()
-        cursor = conn.cursor()
-        
         # Build node filter
         node_filter = ""
         params = [min_importance]
@@ -903,7 +985,7 @@ class OptimizedKnowledgeGraph:
         params.append(max_nodes)
         
         # Get filtered nodes
-        cursor.execute(f'''
+        rows = await self.db.fetchall(f'''
             SELECT id, name, node_type, importance, attributes
             FROM nodes 
             WHERE importance >= ? {node_filter}
@@ -912,12 +994,11 @@ class OptimizedKnowledgeGraph:
         ''', params)
         
         filtered_nodes = {}
-        for row in cursor.fetchall():
+        for row in rows:
             if row[0] in self.nodes:
                 filtered_nodes[row[0]] = self.nodes[row[0]]
         
         if not filtered_nodes:
-            self.db_manager.return_knowledge_connection(conn)
             return nx.DiGraph()
         
         # Get edges between filtered nodes
@@ -932,7 +1013,7 @@ class OptimizedKnowledgeGraph:
             edge_filter = f"AND edge_type IN ({edge_type_placeholders})"
             edge_params.extend([et.value for et in edge_types])
         
-        cursor.execute(f'''
+        edge_rows = await self.db.fetchall(f'''
             SELECT id, source_id, target_id, edge_type, weight, confidence
             FROM edges
             WHERE source_id IN ({placeholders}) 
@@ -947,13 +1028,12 @@ class OptimizedKnowledgeGraph:
             subgraph.add_node(node_id, node=node)
         
         # Add edges
-        for row in cursor.fetchall():
+        for row in edge_rows:
             if row[0] in self.edges:
                 edge = self.edges[row[0]]
                 subgraph.add_edge(edge.source_id, edge.target_id, 
                                 edge_id=edge.id, edge=edge, weight=edge.weight)
         
-        self.db_manager.return_knowledge_connection(conn)
         self.query_stats['db_queries'] += 1
         
         return subgraph
@@ -991,9 +1071,6 @@ class OptimizedKnowledgeGraph:
         if not nodes:
             return
         
-        conn = self.db_manager.get_knowledge_connection()
-        cursor = conn.cursor()
-        
         batch_data = []
         for node in nodes:
             # Serialize embedding if present
@@ -1026,25 +1103,19 @@ class OptimizedKnowledgeGraph:
                         [str(v).lower() for v in node.attributes.values() if isinstance(v, (str, int, float))])
             ))
         
-        cursor.executemany('''
+        await self.db.executemany('''
             INSERT OR REPLACE INTO nodes 
             (id, name, node_type, attributes, created_at, updated_at, created_at_unix, updated_at_unix,
              importance, personas_relevance, access_count, last_accessed, last_accessed_unix, 
              version, embedding_vector, name_lower, search_terms)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', batch_data)
-        
-        conn.commit()
-        self.db_manager.return_knowledge_connection(conn)
     
     async def _persist_edges_batch(self, edges: List[Edge]):
         """Persist multiple edges in a single transaction"""
         if not edges:
             return
         
-        conn = self.db_manager.get_knowledge_connection()
-        cursor = conn.cursor()
-        
         batch_data = []
         for edge in edges:
             timestamp_unix = int(edge.created_at.timestamp())
@@ -1066,18 +1137,16 @@ class OptimizedKnowledgeGraph:
                 edge.decay_rate
             ))
         
-        cursor.executemany('''
+        await self.db.executemany('''
             INSERT OR REPLACE INTO edges 
             (id, source_id, target_id, edge_type, weight, attributes, created_at, created_at_unix,
              confidence, last_reinforced, last_reinforced_unix, reinforcement_count, decay_rate)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', batch_data)
-        
-        conn.commit()
-        self.db_manager.return_knowledge_connection(conn)
     
     async def get_graph_statistics(self) -> Dict[str, Any]:
         """Get comprehensive graph statistics with caching"""
+        await self._ensure_loaded()
         cache_key = "graph_stats"
         cached_result = self.cache.get(cache_key)
         if cached_result:
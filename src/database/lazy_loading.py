@@ -0,0 +1,184 @@
+"""
+Lazy Loading Support for In-Memory Stores
+
+Stores that mirror a database in memory (persona memories, knowledge
+graphs) can start with only hot metadata and page in partitions on first
+access: a persona's memory set, a node's neighbourhood. A background
+warm-up then loads the remaining partitions in small batches, yielding to
+the event loop between batches, and reports its progress for /health.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupProgress:
+    """Progress of one store's background warm-up"""
+    name: str
+    state: str = "pending"  # pending, warming, ready, failed
+    total: Optional[int] = None
+    loaded: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.time()) - self.started_at
+        return {
+            'state': self.state,
+            'loaded': self.loaded,
+            'total': self.total,
+            'percent': round(self.loaded / self.total * 100, 1) if self.total else (
+                100.0 if self.state == "ready" else 0.0
+            ),
+            'elapsed_seconds': round(elapsed, 3) if elapsed is not None else None,
+            'error': self.error
+        }
+
+
+# Every lazily loaded store, by name
+_warmups: Dict[str, WarmupProgress] = {}
+
+
+def register_warmup(name: str) -> WarmupProgress:
+    """Create (or replace) the progress record reported for a store"""
+    progress = WarmupProgress(name=name)
+    _warmups[name] = progress
+    return progress
+
+
+def get_warmup_status() -> Dict[str, Dict[str, Any]]:
+    """Warm-up progress of every lazily loaded store"""
+    return {name: progress.to_dict() for name, progress in _warmups.items()}
+
+
+class PartitionLoader:
+    """
+    Loads partitions of a store on first access
+
+    Features:
+    - Concurrent requests for the same partition load it once
+    - Background warm-up of every partition in batches
+    - ensure_all() for operations that need the complete store
+    - Progress reporting through get_warmup_status()
+    """
+
+    def __init__(self,
+                 name: str,
+                 load: Callable[[List[str]], Awaitable[None]],
+                 list_partitions: Callable[[], Awaitable[List[str]]],
+                 batch_size: int = 100,
+                 auto_warmup: bool = True):
+        """
+        Args:
+            name: Name reported in the warm-up status
+            load: Coroutine that loads a list of partitions into the store
+            list_partitions: Coroutine returning every partition, hottest first
+            batch_size: Partitions loaded per warm-up step
+            auto_warmup: Start the background warm-up on first access
+        """
+        self.load = load
+        self.list_partitions = list_partitions
+        self.batch_size = batch_size
+        self.auto_warmup = auto_warmup
+        self.progress = register_warmup(name)
+
+        self._loaded: Set[str] = set()
+        self._lock = asyncio.Lock()
+        self._warmup_task: Optional[asyncio.Task] = None
+        self.complete = False
+        self.on_demand_loads = 0
+
+    def is_loaded(self, key: str) -> bool:
+        return self.complete or key in self._loaded
+
+    def mark_loaded(self, keys: Iterable[str]):
+        """Record partitions created in process (nothing to load for them)"""
+        self._loaded.update(keys)
+
+    async def ensure(self, keys: Iterable[str]):
+        """Load any of the given partitions that are not loaded yet"""
+        if self.complete:
+            return
+        if self.auto_warmup:
+            self.start_warmup()
+
+        missing = [key for key in dict.fromkeys(keys) if key not in self._loaded]
+        if not missing:
+            return
+
+        async with self._lock:
+            missing = [key for key in missing if key not in self._loaded]
+            if missing:
+                await self.load(missing)
+                self._loaded.update(missing)
+                self.on_demand_loads += len(missing)
+
+    def start_warmup(self) -> Optional[asyncio.Task]:
+        """Schedule the background warm-up (once) on the running loop"""
+        if self.complete or self._warmup_task is not None:
+            return self._warmup_task
+        try:
+            self._warmup_task = asyncio.get_running_loop().create_task(self.warm_up())
+        except RuntimeError:
+            return None
+        return self._warmup_task
+
+    async def warm_up(self):
+        """Load every partition not loaded yet, one batch at a time"""
+        progress = self.progress
+        progress.state = "warming"
+        progress.started_at = time.time()
+        try:
+            keys = await self.list_partitions()
+            progress.total = len(keys)
+            for start in range(0, len(keys), self.batch_size):
+                batch = [key for key in keys[start:start + self.batch_size] if key not in self._loaded]
+                if batch:
+                    async with self._lock:
+                        batch = [key for key in batch if key not in self._loaded]
+                        if batch:
+                            await self.load(batch)
+                            self._loaded.update(batch)
+                progress.loaded = min(start + self.batch_size, len(keys))
+                # Let requests run between batches
+                await asyncio.sleep(0)
+        except Exception as e:
+            progress.state = "failed"
+            progress.error = str(e)
+            progress.finished_at = time.time()
+            logger.error(f"Warm-up of {progress.name} failed: {e}")
+            raise
+
+        self.complete = True
+        progress.state = "ready"
+        progress.finished_at = time.time()
+        logger.info(f"Warm-up of {progress.name} loaded {progress.total} partitions "
+                    f"in {progress.finished_at - progress.started_at:.2f}s")
+
+    async def ensure_all(self):
+        """Wait until every partition is loaded"""
+        if self.complete:
+            return
+        task = self.start_warmup()
+        if task is None or (task.done() and not self.complete):
+            # No loop to schedule on, or an earlier warm-up failed: load inline
+            self._warmup_task = None
+            await self.warm_up()
+            return
+        await asyncio.shield(task)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.progress.to_dict(),
+            'partitions_loaded': len(self._loaded),
+            'on_demand_loads': self.on_demand_loads
+        }
@@ -0,0 +1,278 @@
+"""
+Columnar Memory Store for Fast Recall Scoring
+
+Keeps the fields that memory relevance depends on (importance, timestamps,
+access counts, decay rates, emotional valence) in NumPy arrays, one store
+per persona, so a recall scores every memory in a single vectorized pass.
+
+Content words and context keys are tokenized once, when a memory is added,
+into integer term ids. They are held as a sparse memory x term matrix in
+column form: for every term, the sorted array of rows that contain it.
+Overlap between a query and all memories is then a bincount over the
+postings of the query's terms, touching only memories that share a word.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+
+def tokenize(text: str) -> Set[str]:
+    """Word set used for content overlap (lowercase, whitespace split)"""
+    return set(text.lower().split())
+
+
+def _context_value_feature(key: str, value: Any) -> str:
+    """Term for a context key holding a particular value"""
+    try:
+        encoded = json.dumps(value, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        encoded = repr(value)
+    return f"{key}\x00{encoded}"
+
+
+class _Postings:
+    """Term -> rows index over a growing row space"""
+
+    def __init__(self):
+        self.vocabulary: Dict[str, int] = {}
+        self._rows: List[List[int]] = []
+        self._arrays: List[Optional[np.ndarray]] = []
+
+    def term_id(self, term: str) -> int:
+        term_id = self.vocabulary.get(term)
+        if term_id is None:
+            term_id = len(self._rows)
+            self.vocabulary[term] = term_id
+            self._rows.append([])
+            self._arrays.append(None)
+        return term_id
+
+    def add(self, row: int, terms: Iterable[str]):
+        for term in terms:
+            term_id = self.term_id(term)
+            self._rows[term_id].append(row)
+            self._arrays[term_id] = None
+
+    def rows(self, term: str) -> Optional[np.ndarray]:
+        term_id = self.vocabulary.get(term)
+        if term_id is None:
+            return None
+        array = self._arrays[term_id]
+        if array is None:
+            array = np.asarray(self._rows[term_id], dtype=np.int64)
+            self._arrays[term_id] = array
+        return array
+
+    def counts(self, terms: Iterable[str], size: int) -> np.ndarray:
+        """Number of the given terms present in every row"""
+        postings = [p for p in (self.rows(term) for term in terms) if p is not None and len(p)]
+        if not postings:
+            return np.zeros(size, dtype=np.float32)
+        return np.bincount(np.concatenate(postings), minlength=size)[:size].astype(np.float32)
+
+
+class ColumnarMemoryStore:
+    """
+    Array-backed store of one persona's memories
+
+    Memories are added from any object with the Memory attributes (id,
+    content, context, timestamp, importance, emotional_valence, access_count,
+    decay_rate). Only ids are kept for the rows; callers resolve the top-k
+    ids back to Memory objects.
+    """
+
+    _FIELDS = (
+        ('importance', np.float32),
+        ('timestamp', np.float64),
+        ('access_count', np.float32),
+        ('decay_rate', np.float32),
+        ('emotional_valence', np.float32),
+        ('term_count', np.float32),
+        ('alive', np.bool_),
+    )
+
+    def __init__(self, capacity: int = 256):
+        self.ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in self._FIELDS
+        }
+        self._terms = _Postings()
+        self._context_keys = _Postings()
+        self._context_values = _Postings()
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._rows
+
+    def column(self, name: str) -> np.ndarray:
+        """View of a column over every row (including removed rows)"""
+        return self._columns[name][:len(self.ids)]
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self.column('alive')
+
+    def add(self, memory: Any):
+        """Add a memory, replacing an existing row with the same id"""
+        self.add_row(
+            memory.id, memory.content, memory.context, memory.timestamp.timestamp(),
+            memory.importance, memory.emotional_valence, memory.access_count, memory.decay_rate
+        )
+
+    def add_row(self,
+                memory_id: str,
+                content: str,
+                context: Optional[Dict[str, Any]],
+                timestamp: float,
+                importance: float,
+                emotional_valence: float = 0.0,
+                access_count: int = 0,
+                decay_rate: float = 0.01):
+        """Add a memory from raw field values (timestamp in Unix seconds)"""
+        if memory_id in self._rows:
+            self.remove(memory_id)
+
+        row = len(self.ids)
+        self._ensure_capacity(row + 1)
+        self.ids.append(memory_id)
+        self._rows[memory_id] = row
+
+        words = tokenize(content)
+        self._terms.add(row, words)
+        context = context or {}
+        self._context_keys.add(row, context.keys())
+        self._context_values.add(row, (_context_value_feature(k, v) for k, v in context.items()))
+
+        columns = self._columns
+        columns['importance'][row] = importance
+        columns['timestamp'][row] = timestamp
+        columns['access_count'][row] = access_count or 0
+        columns['decay_rate'][row] = decay_rate if decay_rate is not None else 0.01
+        columns['emotional_valence'][row] = emotional_valence or 0.0
+        columns['term_count'][row] = len(words)
+        columns['alive'][row] = True
+
+    def add_batch(self, memories: Iterable[Any]):
+        for memory in memories:
+            self.add(memory)
+
+    def remove(self, memory_id: str) -> bool:
+        """Drop a memory from scoring"""
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return False
+        self._columns['alive'][row] = False
+        self.ids[row] = None
+        self._dead += 1
+        if self._dead > 1024 and self._dead * 2 > len(self.ids):
+            self._compact()
+        return True
+
+    def update(self, memory_id: str, **fields: float):
+        """Update numeric columns of a memory (importance, access_count, ...)"""
+        row = self._rows.get(memory_id)
+        if row is None:
+            return
+        for name, value in fields.items():
+            if name == 'timestamp' and isinstance(value, datetime):
+                value = value.timestamp()
+            self._columns[name][row] = value
+
+    def record_access(self, memory_ids: Sequence[str], increment: int = 1):
+        """Add to the access counts of several memories"""
+        rows = [self._rows[m] for m in memory_ids if m in self._rows]
+        if rows:
+            np.add.at(self._columns['access_count'], np.asarray(rows), increment)
+
+    def term_overlap(self, terms: Set[str]) -> np.ndarray:
+        """Number of query terms contained in every memory"""
+        return self._terms.counts(terms, len(self.ids))
+
+    def context_overlap(self, context: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Context keys shared with every memory
+
+        Returns:
+            (shared key counts, counts of shared keys holding equal values)
+        """
+        size = len(self.ids)
+        if not context:
+            zeros = np.zeros(size, dtype=np.float32)
+            return zeros, zeros
+        shared = self._context_keys.counts(context.keys(), size)
+        equal = self._context_values.counts(
+            (_context_value_feature(k, v) for k, v in context.items()), size
+        )
+        return shared, equal
+
+    def age_days(self, now: Optional[datetime] = None) -> np.ndarray:
+        """Whole days since each memory was formed"""
+        now_ts = (now or datetime.now()).timestamp()
+        return np.floor((now_ts - self.column('timestamp')) / 86400.0).astype(np.float32)
+
+    def top_k(self, scores: np.ndarray, k: int, mask: Optional[np.ndarray] = None) -> List[Tuple[str, float]]:
+        """
+        Highest-scoring live memories
+
+        Args:
+            scores: One score per row
+            k: Number of results
+            mask: Extra rows to exclude where False
+
+        Returns:
+            (memory id, score) pairs, best first
+        """
+        eligible = self.alive if mask is None else self.alive & mask
+        candidates = np.flatnonzero(eligible)
+        if k <= 0 or len(candidates) == 0:
+            return []
+
+        candidate_scores = scores[candidates]
+        if len(candidates) > k:
+            best = np.argpartition(-candidate_scores, k - 1)[:k]
+        else:
+            best = np.arange(len(candidates))
+        # Stable on ties so earlier memories keep their order, as with list.sort
+        best = best[np.lexsort((candidates[best], -candidate_scores[best]))]
+        return [(self.ids[candidates[i]], float(candidate_scores[i])) for i in best]
+
+    def _ensure_capacity(self, size: int):
+        capacity = len(self._columns['importance'])
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2)
+        for name, column in self._columns.items():
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:capacity] = column
+            self._columns[name] = grown
+
+    def _compact(self):
+        """Rebuild without removed rows"""
+        keep = np.flatnonzero(self.alive)
+        ids = [self.ids[row] for row in keep]
+        old_columns = {name: self.column(name)[keep].copy() for name, _ in self._FIELDS}
+
+        # Postings are rebuilt by remapping rows; terms of removed rows are dropped
+        remap = np.full(len(self.ids), -1, dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
+        for postings in (self._terms, self._context_keys, self._context_values):
+            for term_id, rows in enumerate(postings._rows):
+                mapped = remap[np.asarray(rows, dtype=np.int64)] if rows else np.zeros(0, dtype=np.int64)
+                postings._rows[term_id] = mapped[mapped >= 0].tolist()
+                postings._arrays[term_id] = None
+
+        self.ids = ids
+        self._rows = {memory_id: row for row, memory_id in enumerate(ids)}
+        self._columns = {
+            name: np.zeros(max(len(ids), 256), dtype=dtype) for name, dtype in self._FIELDS
+        }
+        for name, values in old_columns.items():
+            self._columns[name][:len(ids)] = values
+        self._dead = 0
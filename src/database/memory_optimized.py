@@ -20,6 +20,13 @@ import threading
 from concurrent.futures import ThreadPoolExecutor
 
 from .config import get_database_manager, DatabaseManager
+from .memory_associations import BatchAssociationEngine
+from .memory_columns import ColumnarMemoryStore, tokenize
+from .recall_cache import RecallCache
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .redis_cache import CacheManager
 
 
 @dataclass
@@ -102,17 +109,27 @@ class OptimizedMemorySystem:
     """
     High-performance memory system with advanced optimization features:
     - Connection pooling for SQLite
+    - Non-blocking queries through a batching writer thread and reader pool
     - Batch operations for bulk inserts/updates
+    - Set-based association discovery for whole batches
     - Memory compression for old memories
     - Advanced indexing for fast queries
     - Memory partitioning by persona
     - Query optimization with prepared statements
+    - In-process recall cache with an optional Redis tier
     """
     
-    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+    def __init__(self,
+                 db_manager: Optional[DatabaseManager] = None,
+                 cache_manager: Optional['CacheManager'] = None):
         self.db_manager = db_manager or get_database_manager()
+        self.db = self.db_manager.get_memory_db()
         self.memories: Dict[str, List[Memory]] = defaultdict(list)
         self.memory_index: Dict[str, Memory] = {}
+        # Per-persona columns of every stored memory, for vectorized recall
+        self._stores: Dict[str, ColumnarMemoryStore] = defaultdict(ColumnarMemoryStore)
+        self.association_engine = BatchAssociationEngine()
+        self.recall_cache = RecallCache(cache_manager=cache_manager, flush_hits=self._flush_query_hits)
         self.executor = ThreadPoolExecutor(max_workers=4)
         self._batch_queue: List[Memory] = []
         self._batch_size = 50
@@ -217,7 +234,7 @@ class OptimizedMemorySystem:
             )
         ''')
         
-        # Query cache for frequent queries
+        # Hit statistics for cached recalls (results themselves live in RecallCache)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS query_cache (
                 query_hash TEXT PRIMARY KEY,
@@ -238,50 +255,86 @@ class OptimizedMemorySystem:
         conn.commit()
         self.db_manager.return_memory_connection(conn)
     
+    # Columns selected when a memory row is turned into a Memory object
+    _MEMORY_COLUMNS = '''
+        id, persona_id, content, content_compressed, context, timestamp, 
+        importance, emotional_valence, tags, associations, access_count, 
+        last_accessed, decay_rate, compressed, word_count
+    '''
+    
     def _load_memories(self):
         """Load memories with optimized query"""
         conn = self.db_manager.get_memory_connection()
         cursor = conn.cursor()
         
-        # Use optimized query with limit for initial load
+        # Scoring columns for every memory; content is the uncompressed text
         cursor.execute('''
-            SELECT id, persona_id, content, content_compressed, context, timestamp, 
-                   importance, emotional_valence, tags, associations, access_count, 
-                   last_accessed, decay_rate, compressed, word_count
+            SELECT id, persona_id, content, context, timestamp_unix, importance,
+                   emotional_valence, access_count, decay_rate
+            FROM memories
+            ORDER BY persona_id, timestamp_unix
+        ''')
+        for row in cursor.fetchall():
+            self._stores[row[1]].add_row(
+                row[0], row[2], json.loads(row[3]) if row[3] else {},
+                row[4], row[5], row[6], row[7], row[8]
+            )
+        
+        # Use optimized query with limit for initial load
+        cursor.execute(f'''
+            SELECT {self._MEMORY_COLUMNS}
             FROM memories 
             ORDER BY persona_id, importance DESC, timestamp_unix DESC
             LIMIT 10000
         ''')
         
         for row in cursor.fetchall():
-            content = row[2]
-            if row[13] and row[3]:  # compressed flag and compressed content
-                try:
-                    content = zlib.decompress(base64.b64decode(row[3])).decode('utf-8')
-                except:
-                    content = row[2]  # fallback to original
-            
-            memory = Memory(
-                id=row[0],
-                persona_id=row[1],
-                content=content,
-                context=json.loads(row[4]) if row[4] else {},
-                timestamp=datetime.fromisoformat(row[5]),
-                importance=row[6],
-                emotional_valence=row[7],
-                tags=set(json.loads(row[8])) if row[8] else set(),
-                associations=json.loads(row[9]) if row[9] else [],
-                access_count=row[10],
-                last_accessed=datetime.fromisoformat(row[11]) if row[11] else None,
-                decay_rate=row[12],
-                compressed=bool(row[13])
-            )
-            
+            memory = self._row_to_memory(row)
             self.memories[memory.persona_id].append(memory)
             self.memory_index[memory.id] = memory
         
         self.db_manager.return_memory_connection(conn)
     
+    def _row_to_memory(self, row: Tuple) -> Memory:
+        """Build a Memory from a row selected with _MEMORY_COLUMNS"""
+        content = row[2]
+        if row[13] and row[3]:  # compressed flag and compressed content
+            try:
+                content = zlib.decompress(base64.b64decode(row[3])).decode('utf-8')
+            except:
+                content = row[2]  # fallback to original
+        
+        return Memory(
+            id=row[0],
+            persona_id=row[1],
+            content=content,
+            context=json.loads(row[4]) if row[4] else {},
+            timestamp=datetime.fromisoformat(row[5]),
+            importance=row[6],
+            emotional_valence=row[7],
+            tags=set(json.loads(row[8])) if row[8] else set(),
+            associations=json.loads(row[9]) if row[9] else [],
+            access_count=row[10],
+            last_accessed=datetime.fromisoformat(row[11]) if row[11] else None,
+            decay_rate=row[12],
+            compressed=bool(row[13])
+        )
+    
+    async def _get_memories(self, memory_ids: List[str]) -> List[Memory]:
+        """Memory objects for ids, loading any not held in memory_index"""
+        missing = [memory_id for memory_id in memory_ids if memory_id not in self.memory_index]
+        if missing:
+            placeholders = ','.join('?' * len(missing))
+            rows = await self.db.fetchall(
+                f"SELECT {self._MEMORY_COLUMNS} FROM memories WHERE id IN ({placeholders})",
+                missing
+            )
+            for row in rows:
+                memory = self._row_to_memory(row)
+                self.memory_index[memory.id] = memory
+        
+        return [self.memory_index[m] for m in memory_ids if m in self.memory_index]
+    
     def _compress_content(self, content: str) -> str:
         """Compress content for storage optimization"""
         if len(content) > 200:  # Only compress longer content
@@ -329,21 +382,64 @@ class OptimizedMemorySystem:
             memory_objects.append(memory)
             self.memories[persona_id].append(memory)
             self.memory_index[memory_id] = memory
+            self._stores[persona_id].add(memory)
         
-        # Batch persist to database
-        await self._persist_memory_batch(memory_objects)
+        # Find associations for the whole batch, then persist memories and
+        # correlations together
+        correlations = await self._associate_batch(memory_objects)
+        await self._persist_memory_batch(memory_objects, correlations)
         
-        # Find associations for all memories
-        for memory in memory_objects:
-            associations = await self._find_associations_optimized(memory)
-            memory.associations = [m.id for m in associations[:5]]  # Limit associations
-            
-            # Create correlations in batch
-            for assoc_memory in associations:
-                await self._create_correlation_optimized(memory, assoc_memory)
+        # Recalls for these personas may now have different answers
+        for persona_id in {memory.persona_id for memory in memory_objects}:
+            await self.recall_cache.invalidate_persona(persona_id)
         
         return memory_objects
     
+    async def _associate_batch(self, memories: List[Memory]) -> List[Tuple]:
+        """
+        Set memory.associations for a batch of new memories
+        
+        Candidates are the persona's most important memories (including the
+        rest of the batch), selected once per persona and scored against
+        every new memory in one vectorized pass.
+        
+        Returns:
+            memory_correlations rows for the new associations
+        """
+        engine = self.association_engine
+        by_persona: Dict[str, List[Memory]] = defaultdict(list)
+        for memory in memories:
+            by_persona[memory.persona_id].append(memory)
+        
+        now = datetime.now()
+        correlations = []
+        for persona_id, persona_memories in by_persona.items():
+            # One extra candidate, since a memory is never its own association
+            candidates = await self._association_candidates(
+                persona_id, engine.threshold, engine.candidate_limit + 1
+            )
+            links = engine.associate(persona_memories, candidates)
+            for memory, memory_links in zip(persona_memories, links):
+                memory.associations = [candidates[index].id for index, _ in memory_links]
+                correlations.extend(
+                    (memory.id, candidates[index].id, strength, 'similarity',
+                     now.isoformat(), int(now.timestamp()), now.isoformat(), 1)
+                    for index, strength in memory_links
+                )
+        
+        return correlations
+    
+    async def _association_candidates(self, persona_id: str, min_importance: float, limit: int) -> List[Memory]:
+        """A persona's memories above an importance, most important and most recent first"""
+        store = self._stores.get(persona_id)
+        if not store:
+            return []
+        
+        importance = store.column('importance')
+        rows = np.flatnonzero(store.alive & (importance > min_importance))
+        order = np.lexsort((-store.column('timestamp')[rows], -importance[rows]))[:limit]
+        return await self._get_memories([store.ids[row] for row in rows[order]])
+    
     async def store_memory(self, 
                           persona_id: str,
                           content: str,
@@ -394,68 +490,23 @@ class OptimizedMemorySystem:
         if cached_result:
             return cached_result
         
-        # Use database query for better performance on large datasets
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
-        # Optimized query with importance threshold and recency bias
-        query_sql = '''
-            SELECT id, persona_id, content, content_compressed, context, timestamp, 
-                   importance, emotional_valence, tags, associations, access_count, 
-                   last_accessed, decay_rate, compressed, word_count,
-                   timestamp_unix, last_accessed_unix
-            FROM memories 
-            WHERE persona_id = ? 
-              AND importance > ?
-              AND timestamp_unix > ?  -- Only consider recent memories for performance
-            ORDER BY importance DESC, access_count DESC, timestamp_unix DESC
-            LIMIT ?
-        '''
-        
-        # Get memories from last 6 months for initial filtering
-        six_months_ago = int((datetime.now() - timedelta(days=180)).timestamp())
-        
-        cursor.execute(query_sql, (persona_id, importance_threshold, six_months_ago, limit * 3))
-        rows = cursor.fetchall()
-        self.db_manager.return_memory_connection(conn)
-        
-        # Process and score memories
-        scored_memories = []
-        query_words = set(query.lower().split())
+        store = self._stores.get(persona_id)
+        if not store:
+            return []
         
-        for row in rows:
-            # Reconstruct memory (optimized)
-            content = row[2]
-            if row[13] and row[3]:  # compressed
-                try:
-                    content = zlib.decompress(base64.b64decode(row[3])).decode('utf-8')
-                except:
-                    content = row[2]
-            
-            memory = Memory(
-                id=row[0],
-                persona_id=row[1],
-                content=content,
-                context=json.loads(row[4]) if row[4] else {},
-                timestamp=datetime.fromtimestamp(row[15]),
-                importance=row[6],
-                emotional_valence=row[7],
-                tags=set(json.loads(row[8])) if row[8] else set(),
-                associations=json.loads(row[9]) if row[9] else [],
-                access_count=row[10],
-                last_accessed=datetime.fromtimestamp(row[16]) if row[16] else None,
-                decay_rate=row[12],
-                compressed=bool(row[13])
-            )
-            
-            # Fast relevance calculation
-            relevance = memory.calculate_relevance(query, context)
-            if relevance > 0.1:  # Only keep relevant memories
-                scored_memories.append((relevance, memory))
+        # Score every memory of the persona in one pass; only memories from the
+        # last 6 months above the importance threshold are eligible
+        relevance = self._score_memories(store, query, context)
+        six_months_ago = (datetime.now() - timedelta(days=180)).timestamp()
+        eligible = (
+            (store.column('importance') > importance_threshold) &
+            (store.column('timestamp') > six_months_ago) &
+            (relevance > 0.1)  # Only keep relevant memories
+        )
         
-        # Sort by relevance and take top memories
-        scored_memories.sort(key=lambda x: x[0], reverse=True)
-        relevant_memories = [m for _, m in scored_memories[:limit]]
+        # Materialize Memory objects for the top results only
+        top = store.top_k(relevance, limit, mask=eligible)
+        relevant_memories = await self._get_memories([memory_id for memory_id, _ in top])
         
         # Update access counts in batch
         if relevant_memories:
@@ -466,42 +517,69 @@ class OptimizedMemorySystem:
         
         return relevant_memories
     
+    def _score_memories(self,
+                        store: ColumnarMemoryStore,
+                        query: str,
+                        context: Dict[str, Any]) -> np.ndarray:
+        """Relevance of every memory in a store (vectorized Memory.calculate_relevance)"""
+        relevance = store.column('importance').astype(np.float64)
+        
+        # Jaccard similarity of query and content words
+        query_words = tokenize(query)
+        if query_words:
+            overlap = store.term_overlap(query_words)
+            term_count = store.column('term_count')
+            union = len(query_words) + term_count - overlap
+            jaccard = np.divide(overlap, union, out=np.zeros_like(overlap), where=term_count > 0)
+            relevance += jaccard * 0.4
+        
+        # Recency with exponential decay
+        relevance *= np.exp(-store.age_days() * store.column('decay_rate'))
+        
+        # Access frequency bonus (popular memories are more relevant)
+        relevance += np.minimum(np.log(store.column('access_count') + 1) * 0.1, 0.3)
+        
+        # Context similarity
+        if context:
+            _, equal_values = store.context_overlap(context)
+            relevance += np.minimum(equal_values * 0.1, 0.2)
+        
+        # Emotional context bonus
+        if 'emotion' in context:
+            valence = store.column('emotional_valence')
+            emotional_match = 1 - np.abs(valence - context.get('emotion', 0)) / 2
+            relevance += np.where(np.abs(valence) > 0.1, emotional_match * 0.1, 0.0)
+        
+        return np.minimum(1.0, relevance)
+    
     async def _batch_update_access(self, memories: List[Memory]):
         """Update access counts for multiple memories in a single operation"""
         if not memories:
             return
         
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
         # Prepare batch update
         now = datetime.now()
         updates = []
         for memory in memories:
             memory.access_count += 1
             memory.last_accessed = now
+            self._stores[memory.persona_id].update(memory.id, access_count=memory.access_count)
             updates.append((memory.access_count, int(now.timestamp()), memory.last_accessed.isoformat(), memory.id))
         
         # Batch execute
-        cursor.executemany('''
+        await self.db.executemany('''
             UPDATE memories 
             SET access_count = ?, last_accessed_unix = ?, last_accessed = ?
             WHERE id = ?
         ''', updates)
-        
-        conn.commit()
-        self.db_manager.return_memory_connection(conn)
     
     async def compress_old_memories(self, age_days: int = 30):
         """Compress memories older than specified days"""
         cutoff_date = datetime.now() - timedelta(days=age_days)
         cutoff_unix = int(cutoff_date.timestamp())
         
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
         # Find uncompressed old memories
-        cursor.execute('''
+        memories_to_compress = await self.db.fetchall('''
             SELECT id, content FROM memories 
             WHERE compressed = 0 
               AND timestamp_unix < ? 
@@ -510,81 +588,55 @@ class OptimizedMemorySystem:
             LIMIT 1000
         ''', (cutoff_unix,))
         
-        memories_to_compress = cursor.fetchall()
-        
         # Batch compress
+        updates = []
         for memory_id, content in memories_to_compress:
             try:
-                compressed_content = self._compress_content(content)
-                cursor.execute('''
-                    UPDATE memories 
-                    SET content_compressed = ?, compressed = 1
-                    WHERE id = ?
-                ''', (compressed_content, memory_id))
+                updates.append((self._compress_content(content), memory_id))
             except Exception as e:
                 print(f"Failed to compress memory {memory_id}: {e}")
         
-        conn.commit()
-        self.db_manager.return_memory_connection(conn)
+        await self.db.executemany('''
+            UPDATE memories 
+            SET content_compressed = ?, compressed = 1
+            WHERE id = ?
+        ''', updates)
         
         print(f"Compressed {len(memories_to_compress)} memories older than {age_days} days")
     
     async def _get_cached_query(self, query_hash: str, persona_id: str) -> Optional[List[Memory]]:
         """Get cached query result if still valid"""
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT result_ids, cache_timestamp FROM query_cache 
-            WHERE query_hash = ? AND persona_id = ?
-        ''', (query_hash, persona_id))
-        
-        row = cursor.fetchone()
-        if row:
-            cache_time = datetime.fromisoformat(row[1])
-            if (datetime.now() - cache_time).seconds < 300:  # 5 minute cache
-                memory_ids = json.loads(row[0])
-                
-                # Update hit count
-                cursor.execute('''
-                    UPDATE query_cache SET hit_count = hit_count + 1 
-                    WHERE query_hash = ?
-                ''', (query_hash,))
-                conn.commit()
-                
-                # Return memories
-                memories = [self.memory_index.get(mid) for mid in memory_ids]
-                memories = [m for m in memories if m is not None]
-                
-                self.db_manager.return_memory_connection(conn)
-                return memories if memories else None
-        
-        self.db_manager.return_memory_connection(conn)
-        return None
+        memory_ids = await self.recall_cache.get(persona_id, query_hash)
+        if not memory_ids:
+            return None
+        
+        memories = [self.memory_index.get(mid) for mid in memory_ids]
+        if any(m is None for m in memories):
+            # A cached memory was cleaned up; recompute
+            self.recall_cache.discard(persona_id, query_hash)
+            return None
+        return memories
     
     async def _cache_query_result(self, query_hash: str, persona_id: str, memories: List[Memory]):
         """Cache query result for performance"""
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
-        memory_ids = [m.id for m in memories]
-        cursor.execute('''
-            INSERT OR REPLACE INTO query_cache 
-            (query_hash, result_ids, cache_timestamp, persona_id)
+        await self.recall_cache.put(persona_id, query_hash, [m.id for m in memories])
+    
+    async def _flush_query_hits(self, hits: Dict[Tuple[str, str], int]):
+        """Add aggregated recall cache hits to the query_cache statistics"""
+        now = datetime.now().isoformat()
+        await self.db.executemany('''
+            INSERT INTO query_cache (query_hash, persona_id, cache_timestamp, hit_count)
             VALUES (?, ?, ?, ?)
-        ''', (query_hash, json.dumps(memory_ids), datetime.now().isoformat(), persona_id))
-        
-        conn.commit()
-        self.db_manager.return_memory_connection(conn)
+            ON CONFLICT(query_hash) DO UPDATE SET
+                hit_count = hit_count + excluded.hit_count,
+                cache_timestamp = excluded.cache_timestamp
+        ''', [(query_hash, persona_id, now, count) for (persona_id, query_hash), count in hits.items()])
     
-    async def _persist_memory_batch(self, memories: List[Memory]):
-        """Persist multiple memories in a single transaction"""
+    async def _persist_memory_batch(self, memories: List[Memory], correlations: Optional[List[Tuple]] = None):
+        """Persist multiple memories and their correlations in a single transaction"""
         if not memories:
             return
         
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
         # Prepare batch insert data
         batch_data = []
         for memory in memories:
@@ -618,113 +670,29 @@ class OptimizedMemorySystem:
                 word_count
             ))
         
-        # Batch execute
-        cursor.executemany('''
-            INSERT OR REPLACE INTO memories 
-            (id, persona_id, content, content_compressed, context, timestamp, timestamp_unix,
-             importance, emotional_valence, tags, associations, access_count, 
-             last_accessed, last_accessed_unix, decay_rate, compressed, content_hash, word_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', batch_data)
-        
-        conn.commit()
-        self.db_manager.return_memory_connection(conn)
-    
-    async def _find_associations_optimized(self, memory: Memory, threshold: float = 0.3) -> List[Memory]:
-        """Find associations using optimized database queries"""
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
-        # Use database for association finding on large datasets
-        cursor.execute('''
-            SELECT id, content, tags, emotional_valence, timestamp_unix, importance
-            FROM memories 
-            WHERE persona_id = ? 
-              AND id != ?
-              AND importance > ?
-            ORDER BY importance DESC, timestamp_unix DESC
-            LIMIT 50
-        ''', (memory.persona_id, memory.id, threshold))
-        
-        associations = []
-        memory_words = set(memory.content.lower().split())
-        
-        for row in cursor.fetchall():
-            other_id, other_content, other_tags_str, other_valence, other_timestamp, other_importance = row
-            
-            # Quick similarity calculation
-            other_words = set(other_content.lower().split())
-            if memory_words and other_words:
-                overlap = len(memory_words & other_words) / len(memory_words | other_words)
-                
-                # Tag similarity
-                other_tags = set(json.loads(other_tags_str)) if other_tags_str else set()
-                tag_similarity = 0
-                if memory.tags and other_tags:
-                    tag_similarity = len(memory.tags & other_tags) / len(memory.tags | other_tags)
-                
-                # Combined similarity
-                similarity = overlap * 0.6 + tag_similarity * 0.4
-                
-                if similarity > threshold:
-                    # Get full memory object
-                    if other_id in self.memory_index:
-                        associations.append(self.memory_index[other_id])
-        
-        self.db_manager.return_memory_connection(conn)
-        return associations[:5]  # Limit associations
-    
-    async def _create_correlation_optimized(self, m1: Memory, m2: Memory):
-        """Create optimized memory correlation"""
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
-        strength = self._calculate_similarity_fast(m1, m2)
-        now = datetime.now()
+        def persist(conn):
+            conn.executemany('''
+                INSERT OR REPLACE INTO memories 
+                (id, persona_id, content, content_compressed, context, timestamp, timestamp_unix,
+                 importance, emotional_valence, tags, associations, access_count, 
+                 last_accessed, last_accessed_unix, decay_rate, compressed, content_hash, word_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', batch_data)
+            if correlations:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO memory_correlations
+                    (memory1_id, memory2_id, correlation_strength, correlation_type, 
+                     created_at, created_at_unix, last_reinforced, reinforcement_count)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', correlations)
         
-        cursor.execute('''
-            INSERT OR REPLACE INTO memory_correlations
-            (memory1_id, memory2_id, correlation_strength, correlation_type, 
-             created_at, created_at_unix, last_reinforced, reinforcement_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            m1.id, m2.id, strength, 'similarity',
-            now.isoformat(), int(now.timestamp()), now.isoformat(), 1
-        ))
-        
-        conn.commit()
-        self.db_manager.return_memory_connection(conn)
-    
-    def _calculate_similarity_fast(self, m1: Memory, m2: Memory) -> float:
-        """Fast similarity calculation"""
-        similarity = 0.0
-        
-        # Content overlap (simplified)
-        words1 = set(m1.content.lower().split()[:20])  # Limit for performance
-        words2 = set(m2.content.lower().split()[:20])
-        if words1 and words2:
-            overlap = len(words1 & words2) / len(words1 | words2)
-            similarity += overlap * 0.5
-        
-        # Tag overlap
-        if m1.tags and m2.tags:
-            tag_overlap = len(m1.tags & m2.tags) / len(m1.tags | m2.tags)
-            similarity += tag_overlap * 0.3
-        
-        # Importance similarity
-        importance_diff = abs(m1.importance - m2.importance)
-        importance_sim = 1 - importance_diff
-        similarity += importance_sim * 0.2
-        
-        return similarity
+        # Batch execute
+        await self.db.write(persist)
     
     async def get_memory_statistics(self, persona_id: str) -> Dict[str, Any]:
         """Get optimized memory statistics for a persona"""
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
         # Get comprehensive stats in a single query
-        cursor.execute('''
+        row = await self.db.fetchone('''
             SELECT 
                 COUNT(*) as total_memories,
                 AVG(importance) as avg_importance,
@@ -738,9 +706,6 @@ class OptimizedMemorySystem:
             WHERE persona_id = ?
         ''', (persona_id,))
         
-        row = cursor.fetchone()
-        self.db_manager.return_memory_connection(conn)
-        
         if row:
             return {
                 'total_memories': row[0],
@@ -762,33 +727,43 @@ class OptimizedMemorySystem:
         cutoff_date = datetime.now() - timedelta(days=90)
         cutoff_unix = int(cutoff_date.timestamp())
         
-        conn = self.db_manager.get_memory_connection()
-        cursor = conn.cursor()
-        
-        # Delete old, unimportant memories
-        cursor.execute('''
-            DELETE FROM memories 
-            WHERE importance < ? 
-              AND timestamp_unix < ?
-              AND access_count = 0
-        ''', (importance_threshold, cutoff_unix))
-        
-        deleted_count = cursor.rowcount
-        
-        # Clean up orphaned correlations
-        cursor.execute('''
-            DELETE FROM memory_correlations 
-            WHERE memory1_id NOT IN (SELECT id FROM memories)
-               OR memory2_id NOT IN (SELECT id FROM memories)
-        ''')
-        
-        # Clean up old cache entries
-        cursor.execute('''
-            DELETE FROM query_cache 
-            WHERE cache_timestamp < ?
-        ''', ((datetime.now() - timedelta(hours=24)).isoformat(),))
-        
-        conn.commit()
-        self.db_manager.return_memory_connection(conn)
+        def cleanup(conn) -> int:
+            # Delete old, unimportant memories
+            deleted = conn.execute('''
+                DELETE FROM memories 
+                WHERE importance < ? 
+                  AND timestamp_unix < ?
+                  AND access_count = 0
+            ''', (importance_threshold, cutoff_unix)).rowcount
+            
+            # Clean up orphaned correlations
+            conn.execute('''
+                DELETE FROM memory_correlations 
+                WHERE memory1_id NOT IN (SELECT id FROM memories)
+                   OR memory2_id NOT IN (SELECT id FROM memories)
+            ''')
+            
+            # Clean up old cache entries
+            conn.execute('''
+                DELETE FROM query_cache 
+                WHERE cache_timestamp < ?
+            ''', ((datetime.now() - timedelta(hours=24)).isoformat(),))
+            return deleted
+        
+        deleted_count = await self.db.write(cleanup)
+        if deleted_count:
+            await self.recall_cache.clear()
+        
+        # Drop the same memories from the recall stores
+        for store in self._stores.values():
+            doomed = np.flatnonzero(
+                store.alive &
+                (store.column('importance') < importance_threshold) &
+                (store.column('timestamp') < cutoff_unix) &
+                (store.column('access_count') == 0)
+            )
+            for memory_id in [store.ids[row] for row in doomed]:
+                store.remove(memory_id)
+                self.memory_index.pop(memory_id, None)
         
         return deleted_count
\ No newline at end of file
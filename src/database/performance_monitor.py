@@ -42,6 +42,7 @@ class MetricType(Enum):
     MEMORY_USAGE = "memory_usage"
     DISK_IO = "disk_io"
     NETWORK_IO = "network_io"
+    EVENT_LOOP_BLOCKING = "event_loop_blocking"
 
 
 @dataclass
@@ -102,10 +103,94 @@ class MonitorConfig:
                     'lock_wait_time_ms': 5000,    # 5 seconds
                     'file_size_mb': 5000,         # 5GB
                     'fragmentation_percent': 30   # 30%
+                },
+                'system': {
+                    'event_loop_lag_ms': 100      # 100ms
                 }
             }
 
 
+class EventLoopLagProbe:
+    """
+    Measures how long the event loop is blocked
+
+    A background task sleeps for a fixed interval and records how late it
+    wakes up. Any lateness is time the loop spent running something that
+    did not yield, such as synchronous database calls.
+    """
+    
+    def __init__(self, interval: float = 0.1, block_threshold: float = 0.01):
+        """
+        Args:
+            interval: Seconds between probes
+            block_threshold: Lag below which the loop is not counted as blocked
+        """
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.samples: deque = deque(maxlen=1000)
+        self._task: Optional[asyncio.Task] = None
+        self._window_max = 0.0
+        self._window_blocked = 0.0
+        self._window_started = time.perf_counter()
+        self.total_blocked = 0.0
+    
+    def start(self):
+        """Start probing on the running loop"""
+        if self._task is None or self._task.done():
+            self._window_started = time.perf_counter()
+            self._task = asyncio.create_task(self._probe())
+    
+    async def stop(self):
+        """Stop probing"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _probe(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.samples.append(lag)
+            self._window_max = max(self._window_max, lag)
+            if lag >= self.block_threshold:
+                self._window_blocked += lag
+                self.total_blocked += lag
+    
+    def collect(self) -> Dict[str, float]:
+        """Lag statistics since the previous collect, in milliseconds"""
+        now = time.perf_counter()
+        elapsed = max(now - self._window_started, 1e-9)
+        window = {
+            'max_lag_ms': self._window_max * 1000,
+            'blocked_ms': self._window_blocked * 1000,
+            'blocked_percent': min(100.0, self._window_blocked / elapsed * 100)
+        }
+        self._window_max = 0.0
+        self._window_blocked = 0.0
+        self._window_started = now
+        return window
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Lag distribution over recent probes"""
+        samples = sorted(self.samples)
+        if not samples:
+            return {'running': self._task is not None and not self._task.done(), 'samples': 0}
+        return {
+            'running': self._task is not None and not self._task.done(),
+            'samples': len(samples),
+            'mean_lag_ms': statistics.mean(samples) * 1000,
+            'p99_lag_ms': samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000,
+            'max_lag_ms': samples[-1] * 1000,
+            'total_blocked_ms': self.total_blocked * 1000
+        }
+
+
 class DatabaseMonitor:
     """Individual database monitor"""
     
@@ -262,17 +347,19 @@ class DatabaseMonitor:
         
         try:
             if self.database_name == "memory":
-                conn = self.db_manager.get_memory_connection()
+                db = self.db_manager.get_memory_db()
             else:  # knowledge
-                conn = self.db_manager.get_knowledge_connection()
+                db = self.db_manager.get_knowledge_db()
+            
+            def read_pragmas(conn):
+                return tuple(
+                    conn.execute(f"PRAGMA {name}").fetchone()[0]
+                    for name in ("page_count", "page_size", "freelist_count", "cache_size")
+                )
             
-            cursor = conn.cursor()
+            page_count, page_size, free_pages, cache_size = await db.read(read_pragmas)
             
             # Database size
-            cursor.execute("PRAGMA page_count")
-            page_count = cursor.fetchone()[0]
-            cursor.execute("PRAGMA page_size")
-            page_size = cursor.fetchone()[0]
             db_size = page_count * page_size
             
             metrics.append(PerformanceMetric(
@@ -285,8 +372,6 @@ class DatabaseMonitor:
             ))
             
             # Fragmentation
-            cursor.execute("PRAGMA freelist_count")
-            free_pages = cursor.fetchone()[0]
             fragmentation = (free_pages / max(page_count, 1)) * 100
             
             metrics.append(PerformanceMetric(
@@ -299,9 +384,6 @@ class DatabaseMonitor:
             ))
             
             # Cache statistics
-            cursor.execute("PRAGMA cache_size")
-            cache_size = cursor.fetchone()[0]
-            
             metrics.append(PerformanceMetric(
                 metric_type=MetricType.CACHE_HIT_RATIO,
                 value=abs(cache_size),  # SQLite returns negative values for KB
@@ -311,10 +393,16 @@ class DatabaseMonitor:
                 context={'type': 'cache_size'}
             ))
             
-            if self.database_name == "memory":
-                self.db_manager.return_memory_connection(conn)
-            else:
-                self.db_manager.return_knowledge_connection(conn)
+            # Write batching
+            db_stats = db.get_stats()
+            metrics.append(PerformanceMetric(
+                metric_type=MetricType.THROUGHPUT,
+                value=db_stats['avg_batch_size'],
+                unit="writes_per_commit",
+                timestamp=timestamp,
+                database=self.database_name,
+                context={'type': 'write_batching', **db_stats}
+            ))
                 
         except Exception as e:
             self.logger.error(f"Error collecting SQLite metrics for {self.database_name}: {e}")
@@ -408,6 +496,7 @@ class PerformanceMonitor:
         
         self.logger = logging.getLogger("performance_monitor")
         self.monitoring_task: Optional[asyncio.Task] = None
+        self.loop_probe = EventLoopLagProbe()
     
     async def start_monitoring(self):
         """Start continuous performance monitoring"""
@@ -416,6 +505,7 @@ class PerformanceMonitor:
             return
         
         self.logger.info("Starting performance monitoring")
+        self.loop_probe.start()
         self.monitoring_task = asyncio.create_task(self._monitoring_loop())
     
     async def stop_monitoring(self):
@@ -427,6 +517,7 @@ class PerformanceMonitor:
             except asyncio.CancelledError:
                 pass
             self.monitoring_task = None
+        await self.loop_probe.stop()
         
         self.logger.info("Performance monitoring stopped")
     
@@ -467,6 +558,7 @@ class PerformanceMonitor:
         
         # Collect system-level metrics
         system_metrics = await self._collect_system_metrics()
+        self.system_metrics.extend(system_metrics)
         all_metrics.extend(system_metrics)
         
         self.logger.debug(f"Collected {len(all_metrics)} metrics")
@@ -477,8 +569,36 @@ class PerformanceMonitor:
         timestamp = datetime.now()
         
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Event loop blocking since the last collection
+            lag = self.loop_probe.collect()
+            metrics.append(PerformanceMetric(
+                metric_type=MetricType.EVENT_LOOP_BLOCKING,
+                value=lag['max_lag_ms'],
+                unit="ms",
+                timestamp=timestamp,
+                database="system",
+                context={'type': 'max_lag', 'blocked_ms': lag['blocked_ms'],
+                         'blocked_percent': lag['blocked_percent']}
+            ))
+            
+            lag_threshold = self.config.alert_thresholds.get('system', {}).get('event_loop_lag_ms')
+            if lag_threshold and lag['max_lag_ms'] > lag_threshold:
+                alert = Alert(
+                    alert_id=f"threshold_system_{MetricType.EVENT_LOOP_BLOCKING.value}_{int(time.time())}",
+                    level=AlertLevel.WARNING,
+                    title="Event loop blocked",
+                    description=f"Event loop stalled for up to {lag['max_lag_ms']:.0f}ms "
+                                f"({lag['blocked_percent']:.1f}% of the last interval)",
+                    metric_type=MetricType.EVENT_LOOP_BLOCKING,
+                    current_value=lag['max_lag_ms'],
+                    threshold=lag_threshold,
+                    database="system",
+                    timestamp=timestamp
+                )
+                await self._handle_alert(alert)
+            
+            # CPU usage (sampled off the loop; the call sleeps for its interval)
+            cpu_percent = await asyncio.to_thread(psutil.cpu_percent, 1)
             metrics.append(PerformanceMetric(
                 metric_type=MetricType.RESOURCE_USAGE,
                 value=cpu_percent,
@@ -733,6 +853,7 @@ class PerformanceMonitor:
             },
             'alerts': [alert.__dict__ for alert in self.active_alerts.values()],
             'recommendations': self.recommendations,
+            'event_loop': self.loop_probe.get_stats(),
             'metrics': {}
         }
         
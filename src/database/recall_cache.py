@@ -0,0 +1,234 @@
+"""
+Recall Result Cache for the Optimized Memory System
+
+Two-tier cache of memory recall results. The first tier is an in-process
+LRU with a TTL, so a repeated recall is answered without any I/O. The
+optional second tier is the Redis CacheManager, which lets several
+processes share results. Entries are invalidated per persona whenever
+memories for that persona are stored.
+
+Hit counts are aggregated in memory and handed to a flush callback in the
+background at most once per flush interval, instead of costing a database
+write on every hit.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .redis_cache import CacheManager
+
+logger = logging.getLogger(__name__)
+
+
+# Receives {(persona_id, query_hash): hits since the last flush}
+HitFlusher = Callable[[Dict[Tuple[str, str], int]], Awaitable[None]]
+
+
+class RecallCache:
+    """
+    In-process LRU of recall results with an optional Redis tier
+
+    Results are stored as memory id lists; callers resolve them to Memory
+    objects.
+
+    Features:
+    - LRU eviction and TTL expiry
+    - Per-persona invalidation
+    - Redis tier via CacheManager.cache_memories / get_cached_memories
+    - Hit counts aggregated in memory and flushed periodically
+    """
+
+    def __init__(self,
+                 cache_manager: Optional['CacheManager'] = None,
+                 ttl: float = 300.0,
+                 max_entries: int = 4096,
+                 flush_hits: Optional[HitFlusher] = None,
+                 flush_interval: float = 60.0):
+        """
+        Args:
+            cache_manager: Redis-backed cache manager (None for in-process only)
+            ttl: Seconds a cached result stays valid
+            max_entries: Maximum results held in process
+            flush_hits: Coroutine that persists aggregated hit counts
+            flush_interval: Minimum seconds between hit count flushes
+        """
+        self.cache_manager = cache_manager
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.flush_hits = flush_hits
+        self.flush_interval = flush_interval
+
+        # (persona_id, query_hash) -> (memory ids, expiry time)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[List[str], float]]" = OrderedDict()
+        self._by_persona: Dict[str, Set[str]] = defaultdict(set)
+        self._redis_available: Optional[bool] = None if cache_manager is not None else False
+
+        self._pending_hits: Counter = Counter()
+        self._last_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    async def _redis(self) -> bool:
+        """Whether the Redis tier is usable, connecting on first use"""
+        if self._redis_available is None:
+            try:
+                await self.cache_manager.initialize()
+                self._redis_available = True
+            except Exception as e:
+                logger.warning(f"Redis unavailable for recall cache, using in-process LRU only: {e}")
+                self._redis_available = False
+        return self._redis_available
+
+    def _get_local(self, persona_id: str, query_hash: str) -> Optional[List[str]]:
+        """In-process lookup; never does I/O"""
+        key = (persona_id, query_hash)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        memory_ids, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._drop(key)
+            return None
+
+        self._entries.move_to_end(key)
+        self._record_hit(key)
+        return memory_ids
+
+    async def get(self, persona_id: str, query_hash: str) -> Optional[List[str]]:
+        """Cached memory ids for a recall, checking the local tier first"""
+        memory_ids = self._get_local(persona_id, query_hash)
+        if memory_ids is not None:
+            self.hits += 1
+            return memory_ids
+
+        if await self._redis():
+            try:
+                memory_ids = await self.cache_manager.get_cached_memories(persona_id, query_hash)
+            except Exception as e:
+                logger.debug(f"Redis recall lookup failed: {e}")
+                memory_ids = None
+            if memory_ids is not None:
+                self.redis_hits += 1
+                self._store_local(persona_id, query_hash, list(memory_ids))
+                self._record_hit((persona_id, query_hash))
+                return memory_ids
+
+        self.misses += 1
+        return None
+
+    async def put(self, persona_id: str, query_hash: str, memory_ids: List[str]):
+        """Cache the memory ids returned by a recall"""
+        self._store_local(persona_id, query_hash, memory_ids)
+        if await self._redis():
+            try:
+                await self.cache_manager.cache_memories(persona_id, query_hash, memory_ids)
+            except Exception as e:
+                logger.debug(f"Redis recall store failed: {e}")
+
+    def discard(self, persona_id: str, query_hash: str):
+        """Drop one local entry (e.g. when its memories no longer resolve)"""
+        self._drop((persona_id, query_hash))
+
+    async def invalidate_persona(self, persona_id: str):
+        """Drop every cached recall for a persona"""
+        for query_hash in list(self._by_persona.get(persona_id, ())):
+            self._entries.pop((persona_id, query_hash), None)
+        self._by_persona.pop(persona_id, None)
+        self.invalidations += 1
+
+        if await self._redis():
+            try:
+                await self.cache_manager.invalidate_persona_cache(persona_id)
+            except Exception as e:
+                logger.warning(f"Redis recall invalidation failed for {persona_id}: {e}")
+
+    async def clear(self):
+        """Drop every cached recall"""
+        personas = list(self._by_persona)
+        self._entries.clear()
+        self._by_persona.clear()
+        if personas and await self._redis():
+            for persona_id in personas:
+                try:
+                    await self.cache_manager.invalidate_persona_cache(persona_id)
+                except Exception as e:
+                    logger.warning(f"Redis recall invalidation failed for {persona_id}: {e}")
+
+    async def flush(self):
+        """Hand aggregated hit counts to the flush callback now"""
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        await self._flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and sizes"""
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'redis_hits': self.redis_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+            'invalidations': self.invalidations,
+            'evictions': self.evictions,
+            'pending_hit_counts': len(self._pending_hits),
+            'redis_available': bool(self._redis_available)
+        }
+
+    def _store_local(self, persona_id: str, query_hash: str, memory_ids: List[str]):
+        key = (persona_id, query_hash)
+        self._entries[key] = (memory_ids, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        self._by_persona[persona_id].add(query_hash)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, key: Tuple[str, str]):
+        if self._entries.pop(key, None) is None:
+            return
+        persona_id, query_hash = key
+        hashes = self._by_persona.get(persona_id)
+        if hashes is not None:
+            hashes.discard(query_hash)
+            if not hashes:
+                del self._by_persona[persona_id]
+
+    def _record_hit(self, key: Tuple[str, str]):
+        if self.flush_hits is None:
+            return
+        self._pending_hits[key] += 1
+
+        # Flushing is scheduled, never awaited, so a hit stays I/O-free
+        if (time.monotonic() - self._last_flush >= self.flush_interval and
+                (self._flush_task is None or self._flush_task.done())):
+            try:
+                self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+            except RuntimeError:
+                pass
+
+    async def _flush(self):
+        self._last_flush = time.monotonic()
+        if not self._pending_hits or self.flush_hits is None:
+            return
+
+        hits = dict(self._pending_hits)
+        self._pending_hits.clear()
+        try:
+            await self.flush_hits(hits)
+        except Exception as e:
+            logger.warning(f"Failed to flush recall hit counts: {e}")
+            self._pending_hits.update(hits)
@@ -583,6 +583,17 @@ class CacheManager:
             )
         )
         
+        # Council deliberation results
+        self.cache.register_cache_config(
+            "deliberation:",
+            CacheConfig(
+                ttl=900,  # 15 minutes
+                strategy=CacheStrategy.TTL,
+                serialization=SerializationType.COMPRESSED_PICKLE,
+                namespace="deliberation"
+            )
+        )
+        
         # Dashboard data caching (short TTL for real-time feel)
         self.cache.register_cache_config(
             "dashboard:",
@@ -653,6 +664,26 @@ class CacheManager:
         key = f"dashboard:{dashboard_type}"
         return await self.cache.get(key)
     
+    # Deliberation cache methods
+    async def cache_deliberation(self, cache_key: str, result: Any, ttl: Optional[int] = None) -> bool:
+        """Cache a council deliberation result"""
+        key = f"deliberation:result:{cache_key}"
+        return await self.cache.set(key, result, ttl=ttl)
+    
+    async def get_cached_deliberation(self, cache_key: str) -> Optional[Any]:
+        """Get a cached council deliberation result"""
+        key = f"deliberation:result:{cache_key}"
+        return await self.cache.get(key)
+    
+    async def invalidate_deliberation(self, cache_key: str) -> bool:
+        """Invalidate a single cached deliberation result"""
+        key = f"deliberation:result:{cache_key}"
+        return await self.cache.delete(key)
+    
+    async def invalidate_deliberation_topic(self, topic_hash: str) -> int:
+        """Invalidate all cached deliberation results for a topic"""
+        return await self.cache.invalidate_pattern(f"deliberation:result:{topic_hash}:*")
+    
     # Invalidation methods
     async def invalidate_project_cache(self, project_id: str):
         """Invalidate all cache entries for a project"""
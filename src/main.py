@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from .config import get_settings, db_manager, redis_manager, logger
 from .api import projects, runtime, metrics, council, memory, knowledge_graph, scanner, monitor, dashboard, websocket
 from .services import ProjectScanner, RuntimeMonitor
+from .database.lazy_loading import get_warmup_status
 
 
 # Background monitoring task
@@ -102,6 +103,9 @@ async def lifespan(app: FastAPI):
         #     except asyncio.CancelledError:
         #         pass
         
+        # Persist queued deliberation results before closing connections
+        await council.shutdown_orchestrator()
+        
         # Close connections
         await db_manager.close()
         await redis_manager.close()
@@ -189,7 +193,8 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "optimus-backend",
-        "version": settings.app_version
+        "version": settings.app_version,
+        "warmup": get_warmup_status()
     }
 
 
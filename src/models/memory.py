@@ -43,6 +43,7 @@ class DeliberationMemory(Base, TimestampMixin):
     query_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)  # For similarity matching
     tags: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False, default=list)
     importance_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.5)
+    embedding: Mapped[Optional[List[float]]] = mapped_column(ARRAY(Float), nullable=True)  # Query embedding for vector recall
     
     # Relationships
     persona_responses: Mapped[List["PersonaResponseMemory"]] = relationship(
@@ -0,0 +1,71 @@
+"""
+Unit tests for the async SQLite access layer
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from src.database.async_sqlite import AsyncSQLite
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = AsyncSQLite(str(tmp_path / "test.db"), readers=2)
+    conn = db.connect()
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)")
+    conn.close()
+    yield db
+    db.close()
+
+
+class TestAsyncSQLite:
+    """Test batched writes, isolation of failures and reads"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_commits(self, db):
+        """Writes queued together commit in fewer transactions"""
+        await asyncio.gather(*[
+            db.execute("INSERT INTO items (name) VALUES (?)", (f"item{i}",))
+            for i in range(200)
+        ])
+
+        assert await db.fetchone("SELECT COUNT(*) FROM items") == (200,)
+        stats = db.get_stats()
+        assert stats['writes'] == 200
+        assert stats['write_batches'] < 200
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_roll_back_batch(self, db):
+        """A constraint error fails only its own statement"""
+        await db.execute("INSERT INTO items (name) VALUES ('taken')")
+
+        results = await asyncio.gather(
+            db.execute("INSERT INTO items (name) VALUES ('a')"),
+            db.execute("INSERT INTO items (name) VALUES ('taken')"),
+            db.execute("INSERT INTO items (name) VALUES ('b')"),
+            return_exceptions=True
+        )
+
+        assert isinstance(results[1], sqlite3.IntegrityError)
+        rows = await db.fetchall("SELECT name FROM items ORDER BY name")
+        assert rows == [("a",), ("b",), ("taken",)]
+
+    @pytest.mark.asyncio
+    async def test_write_function_runs_in_transaction(self, db):
+        """Functions passed to write() see their own uncommitted changes"""
+        def insert_and_count(conn):
+            conn.executemany("INSERT INTO items (name) VALUES (?)", [("x",), ("y",)])
+            return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+        assert await db.write(insert_and_count) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_rejects_new_work(self, db):
+        """Queued writes finish on close and later calls fail"""
+        await db.executemany("INSERT INTO items (name) VALUES (?)", [("a",), ("b",)])
+        db.close()
+
+        with pytest.raises(RuntimeError):
+            await db.fetchall("SELECT * FROM items")
@@ -0,0 +1,280 @@
+"""
+Unit tests for Blackboard indexing, retention, search and subscriptions
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+
+from src.council.blackboard import Blackboard, BlackboardEntry, EntryType, SubscriptionPolicy
+
+
+def make_entry(persona_id: str, entry_type: EntryType, timestamp: datetime,
+               confidence: float = 0.5) -> BlackboardEntry:
+    """Entry with an explicit timestamp"""
+    return BlackboardEntry(
+        persona_id=persona_id,
+        entry_type=entry_type,
+        content=f"{persona_id} {entry_type.value}",
+        confidence=confidence,
+        timestamp=timestamp
+    )
+
+
+@pytest.fixture
+async def populated_blackboard():
+    """Blackboard with two topics and interleaved personas and entry types"""
+    blackboard = Blackboard()
+    base = datetime(2024, 1, 1)
+    for i in range(20):
+        persona_id = ["strategist", "guardian"][i % 2]
+        entry_type = [EntryType.INSIGHT, EntryType.CONCERN, EntryType.QUESTION][i % 3]
+        topic = "alpha" if i < 12 else "beta"
+        await blackboard.post(topic, make_entry(persona_id, entry_type, base + timedelta(minutes=i)))
+    return blackboard
+
+
+def brute_force(blackboard, topic=None, persona_id=None, entry_type=None, since=None, limit=100):
+    """Reference implementation scanning every entry"""
+    entries = [
+        e for t, topic_entries in blackboard.entries.items() if topic is None or t == topic
+        for e in topic_entries
+        if (persona_id is None or e.persona_id == persona_id)
+        and (entry_type is None or e.entry_type == entry_type)
+        and (since is None or e.timestamp > since)
+    ]
+    entries.sort(key=lambda e: e.timestamp, reverse=True)
+    return entries[:limit]
+
+
+class TestIndexedRead:
+    """Test indexed reads match a full scan"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"topic": "alpha"},
+        {"persona_id": "guardian"},
+        {"entry_type": EntryType.CONCERN},
+        {"topic": "alpha", "persona_id": "strategist", "entry_type": EntryType.INSIGHT},
+        {"since": datetime(2024, 1, 1, 0, 9)},
+        {"topic": "beta", "entry_type": EntryType.QUESTION, "limit": 1},
+        {"persona_id": "guardian", "limit": 3},
+    ])
+    async def test_read_matches_full_scan(self, populated_blackboard, filters):
+        """Every filter combination returns the same entries as a scan"""
+        result = await populated_blackboard.read(**filters)
+        assert [e.id for e in result] == [e.id for e in brute_force(populated_blackboard, **filters)]
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_post_keeps_time_order(self):
+        """Late-arriving entries are inserted at their timestamp"""
+        blackboard = Blackboard()
+        base = datetime(2024, 1, 1)
+        for minutes in (0, 10, 5):
+            await blackboard.post("topic", make_entry("p", EntryType.INSIGHT, base + timedelta(minutes=minutes)))
+
+        trail = await blackboard.get_consensus_trail("topic")
+        assert [e.timestamp for e in trail] == sorted(e.timestamp for e in trail)
+
+    @pytest.mark.asyncio
+    async def test_unknown_topic_and_persona(self, populated_blackboard):
+        """Missing index keys return no entries"""
+        assert await populated_blackboard.read(topic="missing") == []
+        assert await populated_blackboard.read(persona_id="nobody") == []
+
+
+class TestIncrementalStatistics:
+    """Test counters maintained on post"""
+
+    @pytest.mark.asyncio
+    async def test_statistics_follow_posts_and_clear(self):
+        """Counters reflect posted entries and reset when a topic is cleared"""
+        blackboard = Blackboard()
+        base = datetime(2024, 1, 1)
+        await blackboard.post("a", make_entry("p1", EntryType.INSIGHT, base, confidence=0.2))
+        await blackboard.post("a", make_entry("p2", EntryType.CONCERN, base + timedelta(minutes=1), confidence=0.6))
+        await blackboard.post("b", make_entry("p1", EntryType.INSIGHT, base + timedelta(minutes=2), confidence=1.0))
+
+        stats = await blackboard.get_statistics()
+        assert stats["total_entries"] == 3
+        assert stats["persona_activity"] == {"p1": 2, "p2": 1}
+        assert stats["entry_types"] == {"insight": 2, "concern": 1}
+        assert stats["average_confidence"] == pytest.approx(0.6)
+        assert stats["time_range"]["end"] == (base + timedelta(minutes=2)).isoformat()
+
+        await blackboard.clear_topic("b")
+        stats = await blackboard.get_statistics()
+        assert stats["total_entries"] == 2
+        assert (await blackboard.get_statistics("b"))["total_entries"] == 0
+        assert await blackboard.read(topic="b") == []
+
+
+class TestRetention:
+    """Test bounded retention and archival"""
+
+    @pytest.mark.asyncio
+    async def test_topic_eviction_archives_and_reloads(self, tmp_path):
+        """Evicted topics leave memory and their trail is reloaded from the archive"""
+        from src.council.blackboard_archive import BlackboardArchive
+
+        blackboard = Blackboard(max_topics=2, archive=BlackboardArchive(str(tmp_path / "archive.db")))
+        base = datetime(2024, 1, 1)
+        first_ids = []
+        for i in range(5):
+            for j in range(3):
+                entry = make_entry(f"p{j}", EntryType.INSIGHT, base + timedelta(minutes=i * 10 + j))
+                await blackboard.post(f"deliberation_{i}", entry)
+                if i == 0:
+                    first_ids.append(entry.id)
+
+        assert len(blackboard.topics) == 2
+        assert len(blackboard.all_entries) == 6
+        assert blackboard.get_retention_stats()["archived_topics"] == 3
+
+        trail = await blackboard.get_consensus_trail("deliberation_0")
+        assert [e.id for e in trail] == first_ids
+        assert (await blackboard.get_entry(first_ids[0])).persona_id == "p0"
+
+    @pytest.mark.asyncio
+    async def test_per_topic_cap_keeps_full_trail(self, tmp_path):
+        """An oversized topic sheds old entries but its trail stays complete"""
+        from src.council.blackboard_archive import BlackboardArchive
+
+        blackboard = Blackboard(max_entries_per_topic=10,
+                                archive=BlackboardArchive(str(tmp_path / "archive.db")))
+        base = datetime(2024, 1, 1)
+        for i in range(25):
+            await blackboard.post("long", make_entry("p", EntryType.INSIGHT, base + timedelta(seconds=i)))
+
+        assert len(blackboard.entries["long"]) <= 10
+        assert (await blackboard.get_statistics("long"))["total_entries"] == len(blackboard.entries["long"])
+        trail = await blackboard.get_consensus_trail("long")
+        assert len(trail) == 25
+        assert [e.timestamp for e in trail] == sorted(e.timestamp for e in trail)
+
+    @pytest.mark.asyncio
+    async def test_subscribed_topics_are_not_evicted(self):
+        """Topics with live subscribers stay resident"""
+        blackboard = Blackboard(max_topics=1)
+        await blackboard.subscribe("watched")
+        await blackboard.post("watched", make_entry("p", EntryType.INSIGHT, datetime(2024, 1, 1)))
+        await blackboard.post("other", make_entry("p", EntryType.INSIGHT, datetime(2024, 1, 2)))
+
+        assert "watched" in blackboard.topics
+        assert blackboard.evicted_topics == 0
+
+
+class TestSearch:
+    """Test the inverted-index search"""
+
+    @pytest.fixture
+    async def search_blackboard(self):
+        blackboard = Blackboard()
+        base = datetime(2024, 1, 1)
+        contents = [
+            ("Migrate the orders service to Postgres", {"database"}),
+            ("Postgres replication lag is a concern for Postgres reads", {"database", "risk"}),
+            ("Use a CDN for static assets", {"frontend"}),
+            ("Service mesh adds latency to the orders path", set()),
+        ]
+        for i, (content, tags) in enumerate(contents):
+            await blackboard.post("topic", BlackboardEntry(
+                persona_id="p", content=content, tags=tags, timestamp=base + timedelta(minutes=i)
+            ))
+        return blackboard
+
+    @pytest.mark.asyncio
+    async def test_ranks_by_term_frequency(self, search_blackboard):
+        """Entries mentioning a term more often rank higher"""
+        results = await search_blackboard.search("postgres")
+        assert [e.content for e in results] == [
+            "Postgres replication lag is a concern for Postgres reads",
+            "Migrate the orders service to Postgres",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_quoted_phrase_is_required(self, search_blackboard):
+        """Quoted phrases only match contiguous tokens"""
+        results = await search_blackboard.search('"orders service"')
+        assert [e.content for e in results] == ["Migrate the orders service to Postgres"]
+
+    @pytest.mark.asyncio
+    async def test_tag_filter(self, search_blackboard):
+        """Tag filters restrict results, with or without query terms"""
+        assert len(await search_blackboard.search("postgres", tags={"risk"})) == 1
+        assert len(await search_blackboard.search("", tags={"database"})) == 2
+
+    @pytest.mark.asyncio
+    async def test_index_follows_topic_trim(self):
+        """Trimmed entries drop out of the search index"""
+        blackboard = Blackboard(max_entries_per_topic=2)
+        base = datetime(2024, 1, 1)
+        for i, word in enumerate(["alpha", "beta", "gamma"]):
+            await blackboard.post("t", BlackboardEntry(content=word, timestamp=base + timedelta(minutes=i)))
+
+        assert await blackboard.search("alpha") == []
+        assert len(await blackboard.search("gamma")) == 1
+
+
+class TestSubscriptions:
+    """Test bounded, non-blocking subscriptions"""
+
+    @pytest.mark.asyncio
+    async def test_delivers_in_order(self):
+        """A keeping-up subscriber receives every entry in order"""
+        blackboard = Blackboard()
+        subscription = await blackboard.subscribe("t")
+        entries = [BlackboardEntry(content=str(i)) for i in range(3)]
+        for entry in entries:
+            await blackboard.post("t", entry)
+
+        assert [(await subscription.get()).id for _ in entries] == [e.id for e in entries]
+        assert subscription.empty()
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest(self):
+        """A lagging subscriber loses the oldest entries, not the poster's time"""
+        blackboard = Blackboard(subscriber_buffer_size=4)
+        subscription = await blackboard.subscribe("t")
+        for i in range(10):
+            await blackboard.post("t", BlackboardEntry(content=str(i)))
+
+        assert subscription.lag == 10
+        received = [subscription.get_nowait().content for _ in range(subscription.qsize())]
+        assert received == ["6", "7", "8", "9"]
+        stats = blackboard.get_subscription_stats("t")[0]
+        assert stats["dropped"] == 6
+        assert stats["lag"] == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_delivers_latest(self):
+        """Coalescing subscribers skip to the newest entry"""
+        blackboard = Blackboard()
+        subscription = await blackboard.subscribe("t", policy=SubscriptionPolicy.COALESCE)
+        for i in range(5):
+            await blackboard.post("t", BlackboardEntry(content=str(i)))
+
+        assert (await subscription.get()).content == "4"
+        assert subscription.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_waiting_consumer_wakes_and_stops_on_unsubscribe(self):
+        """Blocked consumers wake on post and finish iterating on unsubscribe"""
+        blackboard = Blackboard()
+        subscription = await blackboard.subscribe("t")
+        received = []
+
+        async def consume():
+            async for entry in subscription:
+                received.append(entry.content)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        await blackboard.post("t", BlackboardEntry(content="hello"))
+        await asyncio.sleep(0)
+        await blackboard.unsubscribe("t", subscription)
+        await asyncio.wait_for(consumer, timeout=1)
+
+        assert received == ["hello"]
+        assert blackboard.get_subscription_stats() == []
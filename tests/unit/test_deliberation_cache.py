@@ -0,0 +1,137 @@
+"""
+Unit tests for the deliberation result cache
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.council.deliberation_cache import (
+    DeliberationCache, normalize_query, context_fingerprint
+)
+from src.council.orchestrator import Orchestrator, DeliberationRequest, DeliberationResult
+
+
+def make_result(request: DeliberationRequest) -> DeliberationResult:
+    """Minimal deliberation result for cache tests"""
+    consensus = MagicMock()
+    consensus.decision = "Migrate to Postgres"
+    return DeliberationResult(
+        request=request,
+        consensus=consensus,
+        persona_responses=[],
+        deliberation_time=1.0,
+        blackboard_topic="test",
+        statistics={}
+    )
+
+
+class TestCacheKeys:
+    """Test query normalization and context fingerprinting"""
+
+    def test_near_identical_queries_normalize_equal(self):
+        """Case, punctuation and filler words do not change the key"""
+        assert normalize_query("Should we migrate X to Postgres?") == \
+            normalize_query("  migrate x to postgres ")
+
+    def test_fingerprint_ignores_key_order_and_volatile_keys(self):
+        """Fingerprint is stable across dict order and per-call keys"""
+        a = context_fingerprint({"project": "optimus", "env": "prod", "timestamp": 1})
+        b = context_fingerprint({"env": "prod", "project": "optimus", "timestamp": 2})
+        assert a == b
+        assert a != context_fingerprint({"project": "other", "env": "prod"})
+
+    def test_fingerprint_respects_context_keys(self):
+        """Only whitelisted keys are fingerprinted when given"""
+        a = context_fingerprint({"project": "optimus", "dashboard": "a"}, ["project"])
+        b = context_fingerprint({"project": "optimus", "dashboard": "b"}, ["project"])
+        assert a == b
+
+
+class TestDeliberationCache:
+    """Test in-process cache behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_hit_and_miss_counts(self):
+        """Repeated questions hit the cache"""
+        cache = DeliberationCache()
+        request = DeliberationRequest(query="Should we migrate X to Postgres?")
+
+        assert await cache.get(request) is None
+        await cache.set(request, make_result(request))
+        cached = await cache.get(DeliberationRequest(query="should we migrate x to postgres"))
+
+        assert cached is not None
+        assert cached.statistics["cache_hit"] is True
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["backend"] == "memory"
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        """Entries past their TTL are not served"""
+        cache = DeliberationCache(ttl=0)
+        request = DeliberationRequest(query="Adopt Kafka?")
+        await cache.set(request, make_result(request))
+
+        assert await cache.get(request) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_topic_and_terms(self):
+        """Topic and concept invalidation remove matching entries only"""
+        cache = DeliberationCache()
+        db = DeliberationRequest(query="Migrate to Postgres?", topic="database")
+        ui = DeliberationRequest(query="Switch to React?", topic="frontend")
+        for request in (db, ui):
+            await cache.set(request, make_result(request))
+
+        assert await cache.invalidate_topic("database") == 1
+        assert await cache.get(db) is None
+        assert await cache.get(ui) is not None
+
+        assert await cache.invalidate_terms(["React"]) == 1
+        assert await cache.get(ui) is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Least recently used entries are evicted beyond max_entries"""
+        cache = DeliberationCache(max_entries=2)
+        requests = [DeliberationRequest(query=f"Question {i}") for i in range(3)]
+        for request in requests:
+            await cache.set(request, make_result(request))
+
+        assert await cache.get(requests[0]) is None
+        assert await cache.get(requests[2]) is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_redis_unavailable(self):
+        """A failing cache manager falls back to the in-process LRU"""
+        cache_manager = AsyncMock()
+        cache_manager.initialize.side_effect = ConnectionError("no redis")
+        cache = DeliberationCache(cache_manager=cache_manager)
+        request = DeliberationRequest(query="Use Redis?")
+
+        await cache.set(request, make_result(request))
+
+        assert cache.backend == "memory"
+        assert await cache.get(request) is not None
+        cache_manager.cache_deliberation.assert_not_called()
+
+
+class TestOrchestratorCache:
+    """Test the cache in front of Orchestrator.deliberate"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache(self):
+        """The second identical deliberation does not re-run the council"""
+        orchestrator = Orchestrator(result_cache=DeliberationCache())
+        await orchestrator.initialize()
+        orchestrator.memory_system = None
+
+        first = await orchestrator.deliberate(DeliberationRequest(query="Add a CDN?"))
+        second = await orchestrator.deliberate(DeliberationRequest(query="add a cdn"))
+
+        assert second.consensus.decision == first.consensus.decision
+        assert second.statistics["cache_hit"] is True
+        assert len(orchestrator.deliberation_history) == 1
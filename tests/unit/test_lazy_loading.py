@@ -0,0 +1,102 @@
+"""
+Unit tests for lazy partition loading and warm-up progress
+"""
+
+import asyncio
+
+import pytest
+
+from src.database.lazy_loading import PartitionLoader, get_warmup_status
+
+
+class FakeStore:
+    """Records which partitions were loaded, in how many calls"""
+
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.calls = []
+
+    async def load(self, keys):
+        self.calls.append(list(keys))
+        await asyncio.sleep(0)
+
+    async def list_partitions(self):
+        return list(self.partitions)
+
+    @property
+    def loaded(self):
+        return [key for call in self.calls for key in call]
+
+
+class TestPartitionLoader:
+    """Test on-demand loads, warm-up and progress reporting"""
+
+    @pytest.mark.asyncio
+    async def test_ensure_loads_each_partition_once(self):
+        """Concurrent requests for the same partition load it once"""
+        store = FakeStore(["a", "b", "c"])
+        loader = PartitionLoader("test:ensure", store.load, store.list_partitions,
+                                 auto_warmup=False)
+
+        await asyncio.gather(loader.ensure(["a", "b"]), loader.ensure(["b", "a"]))
+        await loader.ensure(["a"])
+
+        assert sorted(store.loaded) == ["a", "b"]
+        assert loader.is_loaded("a") and not loader.is_loaded("c")
+        assert loader.get_stats()["on_demand_loads"] == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_up_skips_loaded_partitions(self):
+        """Warm-up loads the remaining partitions in batches"""
+        store = FakeStore([f"p{i}" for i in range(5)])
+        loader = PartitionLoader("test:warmup", store.load, store.list_partitions,
+                                 batch_size=2, auto_warmup=False)
+        await loader.ensure(["p1"])
+        loader.mark_loaded(["p4"])
+
+        await loader.ensure_all()
+
+        assert sorted(store.loaded) == ["p0", "p1", "p2", "p3"]
+        assert all(len(call) <= 2 for call in store.calls)
+        assert loader.is_loaded("anything")
+
+        status = get_warmup_status()["test:warmup"]
+        assert status["state"] == "ready"
+        assert status["loaded"] == status["total"] == 5
+        assert status["percent"] == 100.0
+
+    @pytest.mark.asyncio
+    async def test_first_access_starts_background_warm_up(self):
+        """ensure() returns after its own partitions while warm-up continues"""
+        store = FakeStore([f"p{i}" for i in range(10)])
+        loader = PartitionLoader("test:background", store.load, store.list_partitions,
+                                 batch_size=1)
+
+        await loader.ensure(["p9"])
+        assert store.calls[0] == ["p9"]
+        assert not loader.complete
+
+        await loader.ensure_all()
+        assert sorted(store.loaded) == sorted(store.partitions)
+
+    @pytest.mark.asyncio
+    async def test_failed_warm_up_is_reported_and_retried(self):
+        """A failed warm-up shows in the status and ensure_all() retries it"""
+        store = FakeStore(["a", "b"])
+        failures = [RuntimeError("database locked")]
+
+        async def load(keys):
+            if failures:
+                raise failures.pop()
+            await store.load(keys)
+
+        loader = PartitionLoader("test:failure", load, store.list_partitions,
+                                 auto_warmup=False)
+        with pytest.raises(RuntimeError):
+            await loader.warm_up()
+        assert get_warmup_status()["test:failure"]["state"] == "failed"
+        assert get_warmup_status()["test:failure"]["error"] == "database locked"
+
+        await loader.ensure_all()
+        assert get_warmup_status()["test:failure"]["state"] == "ready"
+        assert sorted(store.loaded) == ["a", "b"]
@@ -0,0 +1,82 @@
+"""
+Unit tests for batch association discovery
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.database.memory_associations import BatchAssociationEngine, jaccard_matrix
+
+
+def make_memory(memory_id, content, tags=(), importance=0.5):
+    return SimpleNamespace(id=memory_id, content=content, tags=set(tags), importance=importance)
+
+
+def scalar_jaccard(a, b):
+    return len(a & b) / len(a | b) if a | b else 0.0
+
+
+class TestJaccardMatrix:
+    """Test the matrix form of set similarity"""
+
+    def test_matches_pairwise_sets(self):
+        """Every cell equals the Jaccard similarity of the two sets"""
+        left = [{"a", "b"}, {"c"}, set(), {"a", "x", "y"}]
+        right = [{"a"}, {"b", "c"}, set()]
+
+        matrix = jaccard_matrix(left, right, chunk_size=3)
+
+        expected = [[scalar_jaccard(l, r) for r in right] for l in left]
+        assert matrix.tolist() == pytest.approx(expected)
+
+
+class TestBatchAssociationEngine:
+    """Test thresholds, limits and self-exclusion"""
+
+    def test_strengths_match_scalar_formula(self):
+        """Correlation strength combines words, tags and importance"""
+        memory = make_memory("m", "postgres migration plan", tags={"db"}, importance=0.9)
+        candidate = make_memory("c", "postgres index plan", tags={"db", "perf"}, importance=0.5)
+
+        strength = BatchAssociationEngine().strengths([memory], [candidate])[0, 0]
+
+        words = scalar_jaccard({"postgres", "migration", "plan"}, {"postgres", "index", "plan"})
+        expected = words * 0.5 + 0.5 * 0.3 + (1 - 0.4) * 0.2
+        assert strength == pytest.approx(expected)
+
+    def test_keeps_first_passing_candidates_in_order(self):
+        """Each memory keeps the first max_associations candidates above the threshold"""
+        engine = BatchAssociationEngine(threshold=0.3, max_associations=2)
+        memories = [make_memory("new", "kafka consumer lag")]
+        candidates = [
+            make_memory("c0", "frontend bundle size"),
+            make_memory("c1", "kafka consumer lag alert"),
+            make_memory("c2", "kafka consumer lag"),
+            make_memory("c3", "kafka consumer lag spike"),
+        ]
+
+        links = engine.associate(memories, candidates)
+
+        assert [index for index, _ in links[0]] == [1, 2]
+
+    def test_excludes_self_and_applies_candidate_limit(self):
+        """A memory is never its own association and sees candidate_limit others"""
+        engine = BatchAssociationEngine(threshold=0.3, candidate_limit=2)
+        shared = "redis cache eviction"
+        candidates = [make_memory(f"c{i}", shared) for i in range(4)]
+
+        links = engine.associate([candidates[0], candidates[3]], candidates)
+
+        assert [index for index, _ in links[0]] == [1, 2]
+        assert [index for index, _ in links[1]] == [0, 1]
+
+    def test_empty_content_never_associates(self):
+        """Pairs without content words fail even when tags match"""
+        engine = BatchAssociationEngine(threshold=0.3)
+        memory = make_memory("m", "", tags={"db"})
+        candidate = make_memory("c", "postgres", tags={"db"})
+
+        assert engine.associate([memory], [candidate]) == [[]]
+        assert np.all(engine.scores([memory], [candidate]) < 0)
@@ -0,0 +1,107 @@
+"""
+Unit tests for the columnar memory store and vectorized recall scoring
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.council.memory import Memory, MemorySystem
+from src.database.memory_columns import ColumnarMemoryStore
+
+
+def make_memory(memory_id, content, days_old=0, importance=0.5, access_count=0,
+                context=None, decay_rate=0.01):
+    return Memory(
+        id=memory_id,
+        persona_id="analyst",
+        content=content,
+        context=context or {},
+        timestamp=datetime.now() - timedelta(days=days_old),
+        importance=importance,
+        emotional_valence=0.0,
+        tags=set(),
+        associations=[],
+        access_count=access_count,
+        decay_rate=decay_rate
+    )
+
+
+class TestColumnarMemoryStore:
+    """Test term postings, masks and top-k selection"""
+
+    def test_term_and_context_overlap(self):
+        """Overlap counts come from the pre-tokenized postings"""
+        store = ColumnarMemoryStore()
+        store.add(make_memory("a", "Postgres migration plan", context={"env": "prod"}))
+        store.add(make_memory("b", "frontend bundle size", context={"env": "dev"}))
+
+        assert store.term_overlap({"postgres", "plan", "kafka"}).tolist() == [2, 0]
+        shared, equal = store.context_overlap({"env": "prod"})
+        assert shared.tolist() == [1, 1]
+        assert equal.tolist() == [1, 0]
+
+    def test_remove_and_replace(self):
+        """Removed rows are never returned and re-adding replaces a row"""
+        store = ColumnarMemoryStore(capacity=2)
+        for i in range(5):
+            store.add(make_memory(f"m{i}", f"memory {i}", importance=i / 10))
+        store.remove("m4")
+        store.add(make_memory("m0", "memory 0", importance=0.9))
+
+        top = store.top_k(store.column('importance'), 3)
+        assert [memory_id for memory_id, _ in top] == ["m0", "m3", "m2"]
+        assert len(store) == 4
+
+    def test_compaction_keeps_postings(self):
+        """Compacting away removed rows keeps term lookups correct"""
+        store = ColumnarMemoryStore()
+        for i in range(3000):
+            store.add(make_memory(f"m{i}", f"word{i % 7} shared"))
+        for i in range(0, 2500):
+            store.remove(f"m{i}")
+
+        assert len(store) == 500
+        assert len(store.ids) < 3000
+        overlap = store.term_overlap({"word3"})
+        hits = [store.ids[row] for row in np.flatnonzero((overlap > 0) & store.alive)]
+        assert hits == [f"m{i}" for i in range(2500, 3000) if i % 7 == 3]
+
+
+class TestVectorizedRecall:
+    """Test that vectorized scoring matches Memory.calculate_relevance"""
+
+    @pytest.fixture
+    def memory_system(self, tmp_path):
+        return MemorySystem(db_path=str(tmp_path / "memory.db"))
+
+    def test_scores_match_per_memory_relevance(self, memory_system):
+        """Every memory scores the same as the scalar formula"""
+        memories = [
+            make_memory("a", "migrate orders database to postgres", days_old=3, access_count=4,
+                        context={"project": "optimus"}),
+            make_memory("b", "frontend bundle size", days_old=40, importance=0.8),
+            make_memory("c", "postgres replication lag alert", days_old=200, decay_rate=0.002,
+                        context={"project": "optimus", "env": "prod"}),
+        ]
+        store = ColumnarMemoryStore()
+        store.add_batch(memories)
+
+        query, context = "should we migrate to postgres", {"project": "optimus"}
+        scores = memory_system._score_memories(store, query, context)
+        expected = [m.calculate_relevance(query, context) for m in memories]
+        assert scores.tolist() == pytest.approx(expected, abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_recall_returns_top_k(self, memory_system):
+        """Recall returns the best memories and bumps their access counts"""
+        await memory_system.store_memory("analyst", "postgres migration plan", {}, importance=0.6)
+        await memory_system.store_memory("analyst", "frontend bundle size", {}, importance=0.2)
+        await memory_system.store_memory("analyst", "postgres index tuning", {}, importance=0.5)
+
+        recalled = await memory_system.recall("analyst", "postgres", {}, limit=2)
+
+        assert [m.content for m in recalled] == ["postgres migration plan", "postgres index tuning"]
+        assert all(m.access_count == 1 for m in recalled)
+        assert await memory_system.recall("nobody", "postgres", {}) == []
@@ -0,0 +1,89 @@
+"""
+Unit tests for local memory embeddings and the vector index
+"""
+
+import numpy as np
+import pytest
+
+from src.council.memory_embeddings import HashingEmbedder, VectorIndex
+
+
+@pytest.fixture
+def embedder():
+    return HashingEmbedder(dim=128)
+
+
+class TestHashingEmbedder:
+    """Test the offline embedder"""
+
+    def test_vectors_are_unit_length_and_stable(self, embedder):
+        """Embeddings are normalized and identical across instances"""
+        vector = embedder.embed("Should we migrate to Postgres?")
+        assert np.linalg.norm(vector) == pytest.approx(1.0, abs=1e-5)
+        assert np.array_equal(vector, HashingEmbedder(dim=128).embed("should we migrate to postgres"))
+
+    def test_related_text_is_closer(self, embedder):
+        """Shared words and phrases raise cosine similarity"""
+        query = embedder.embed("migrate orders database to postgres")
+        related = embedder.embed("postgres migration plan for the orders database")
+        unrelated = embedder.embed("frontend bundle size and CDN caching")
+        assert query @ related > query @ unrelated
+
+    def test_empty_text(self, embedder):
+        """Empty text embeds to the zero vector"""
+        assert not embedder.embed("").any()
+
+
+class TestVectorIndex:
+    """Test exhaustive and IVF search"""
+
+    def _random_unit(self, count, dim, seed=0):
+        vectors = np.random.default_rng(seed).normal(size=(count, dim)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def test_exhaustive_search_finds_exact_match(self):
+        """Below the training threshold every vector is scored"""
+        index = VectorIndex(dim=32)
+        vectors = self._random_unit(100, 32)
+        index.add_batch([f"m{i}" for i in range(100)], vectors)
+
+        results = index.search(vectors[42], k=3)
+        assert results[0][0] == "m42"
+        assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+        assert not index.is_trained
+
+    def test_ivf_recall(self):
+        """The trained index finds the true nearest neighbour for most queries"""
+        index = VectorIndex(dim=32, train_threshold=2000, nprobe=8)
+        vectors = self._random_unit(3000, 32)
+        index.add_batch([f"m{i}" for i in range(3000)], vectors)
+        assert index.is_trained
+
+        queries = vectors[:100] + 0.05 * self._random_unit(100, 32, seed=1)
+        hits = sum(index.search(q, k=1)[0][0] == f"m{i}" for i, q in enumerate(queries))
+        assert hits >= 90
+
+    def test_incremental_add_and_remove(self):
+        """Vectors added after training are searchable; removed ones are not"""
+        index = VectorIndex(dim=32, train_threshold=500)
+        vectors = self._random_unit(601, 32)
+        index.add_batch([f"m{i}" for i in range(600)], vectors[:600])
+        index.add("late", vectors[600])
+
+        assert index.search(vectors[600], k=1)[0][0] == "late"
+        assert index.remove("late")
+        assert "late" not in [item for item, _ in index.search(vectors[600], k=5)]
+
+    def test_save_and_load(self, tmp_path):
+        """A reloaded index returns the same results"""
+        index = VectorIndex(dim=32, train_threshold=500)
+        vectors = self._random_unit(800, 32)
+        index.add_batch([f"m{i}" for i in range(800)], vectors)
+        index.remove("m0")
+        path = str(tmp_path / "vectors.npz")
+        index.save(path)
+
+        loaded = VectorIndex.load(path, train_threshold=500)
+        assert len(loaded) == 799
+        assert loaded.is_trained
+        assert loaded.search(vectors[7], k=5) == index.search(vectors[7], k=5)
@@ -0,0 +1,124 @@
+"""
+Unit tests for the bounded memory similarity cache
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.council.memory_similarity_cache import (
+    MemorySimilarityCache, batch_memory_similarity, pair_key
+)
+
+
+def make_memory(memory_id, query="migrate orders to postgres", tags=None,
+                context=None, embedding=None, created_at=None):
+    """Stand-in for a DeliberationMemory row"""
+    return SimpleNamespace(
+        id=memory_id,
+        query=query,
+        tags=tags if tags is not None else ["database"],
+        context=context if context is not None else {"project": "optimus"},
+        embedding=embedding,
+        created_at=created_at or datetime(2026, 1, 1)
+    )
+
+
+class TestMemorySimilarityCache:
+    """Test keys, limits, expiry and invalidation"""
+
+    def test_keys_are_symmetric(self):
+        """Both orderings of a pair share one entry"""
+        cache = MemorySimilarityCache()
+        a, b = make_memory("a"), make_memory("b")
+        cache.put(a, b, 0.7)
+
+        assert pair_key("b", "a") == pair_key("a", "b")
+        assert cache.get(b, a) == 0.7
+        assert len(cache) == 1
+
+    def test_lru_eviction_by_entries_and_bytes(self):
+        """The least recently used pair is evicted first"""
+        cache = MemorySimilarityCache(max_entries=2)
+        a, b, c, d = (make_memory(x) for x in "abcd")
+        cache.put(a, b, 0.1)
+        cache.put(a, c, 0.2)
+        cache.get(a, b)
+        cache.put(a, d, 0.3)
+
+        assert cache.get(a, c) is None
+        assert cache.get(a, b) == 0.1
+        assert cache.get_stats()["evictions"] == 1
+
+        small = MemorySimilarityCache(max_bytes=1000)
+        for i in range(10):
+            small.put(make_memory(f"x{i}"), make_memory(f"y{i}"), 0.5)
+        assert small.get_stats()["approx_bytes"] <= 1000
+        assert len(small) < 10
+
+    def test_ttl_expiry(self):
+        """Expired pairs are not served"""
+        cache = MemorySimilarityCache(ttl=0)
+        a, b = make_memory("a"), make_memory("b")
+        cache.put(a, b, 0.5)
+
+        assert cache.get(a, b) is None
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_tag_or_context_change_invalidates(self):
+        """Changing a memory's tags or context drops its cached pairs"""
+        cache = MemorySimilarityCache()
+        a, b, c = make_memory("a"), make_memory("b"), make_memory("c")
+        cache.put(a, b, 0.5)
+        cache.put(a, c, 0.6)
+
+        a.tags = ["database", "migration"]
+        assert cache.get(a, b) is None
+        assert cache.get(a, c) is None
+
+        cache.put(b, c, 0.4)
+        assert cache.invalidate_memory("c") == 1
+        assert cache.get(b, c) is None
+
+    def test_hit_ratio(self):
+        """Stats report hits and misses"""
+        cache = MemorySimilarityCache()
+        a, b = make_memory("a"), make_memory("b")
+        cache.get(a, b)
+        cache.put(a, b, 0.5)
+        cache.get(a, b)
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(0.5)
+
+
+class TestBatchMemorySimilarity:
+    """Test vectorized scoring"""
+
+    def test_identical_memories_score_one(self):
+        """Same query, tags, context and day score the full weight"""
+        embedding = [1.0, 0.0, 0.0]
+        memory = make_memory("a", embedding=embedding)
+        scores = batch_memory_similarity(memory, [make_memory("b", embedding=embedding)])
+        assert scores[0] == pytest.approx(1.0)
+
+    def test_mixed_embeddings_and_fallback(self):
+        """Candidates without embeddings fall back to word overlap"""
+        memory = make_memory("a", embedding=[1.0, 0.0])
+        candidates = [
+            make_memory("b", embedding=[0.0, 1.0]),
+            make_memory("c", embedding=None),
+            make_memory("d", query="frontend bundle size", tags=["ui"], context={},
+                        created_at=datetime(2026, 1, 1) - timedelta(days=400))
+        ]
+        scores = batch_memory_similarity(memory, candidates)
+
+        assert scores.shape == (3,)
+        assert scores[0] == pytest.approx(0.6)
+        assert scores[1] == pytest.approx(1.0)
+        assert scores[2] == pytest.approx(0.0)
+        assert batch_memory_similarity(memory, []).shape == (0,)
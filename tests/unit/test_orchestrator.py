@@ -0,0 +1,249 @@
+"""
+Unit tests for the Orchestrator deliberation flow
+"""
+
+import pytest
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.council.orchestrator import Orchestrator, DeliberationRequest, DeliberationResult
+from src.council.write_behind import WriteBehindJournal
+from src.council.consensus import ConsensusMethod
+from src.council.persona import Persona, PersonaResponse
+
+
+def make_stub_persona(persona_id: str, recommendation: str, delay: float):
+    """Build a persona class that answers after a fixed delay"""
+
+    class StubPersona(Persona):
+        def __init__(self):
+            super().__init__(
+                persona_id=persona_id,
+                name=persona_id.title(),
+                description="Stub persona for orchestrator tests",
+                expertise_domains=["database"],
+                personality_traits=[]
+            )
+
+        async def analyze(self, query, context, related_entries):
+            await asyncio.sleep(delay)
+            return PersonaResponse(
+                persona_id=self.persona_id,
+                persona_name=self.name,
+                recommendation=recommendation,
+                reasoning=f"{self.name} reasoning",
+                confidence=0.9
+            )
+
+        def calculate_confidence(self, query, context):
+            return 0.9
+
+    return StubPersona
+
+
+@pytest.fixture
+async def orchestrator():
+    """Initialized orchestrator with core personas and no external services"""
+    orch = Orchestrator(persistence_journal=WriteBehindJournal(db_path=None))
+    await orch.initialize()
+    orch.memory_system = None
+    return orch
+
+
+class TestDeliberateBatch:
+    """Test batch deliberation"""
+
+    @pytest.mark.asyncio
+    async def test_batch_yields_every_request(self, orchestrator):
+        """Every request in the batch yields exactly one result"""
+        requests = [
+            DeliberationRequest(query=f"Should we migrate service {i} to Postgres?")
+            for i in range(5)
+        ]
+
+        results = {}
+        async for index, result in orchestrator.deliberate_batch(requests, max_concurrency=2):
+            results[index] = result
+
+        assert sorted(results) == list(range(5))
+        for index, result in results.items():
+            assert isinstance(result, DeliberationResult)
+            assert result.request is requests[index]
+            assert result.persona_responses
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_distinct_topics(self, orchestrator):
+        """Requests without a topic do not share a blackboard topic"""
+        requests = [DeliberationRequest(query="Adopt GraphQL?") for _ in range(3)]
+
+        topics = [r.blackboard_topic async for _, r in orchestrator.deliberate_batch(requests)]
+
+        assert len(set(topics)) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_recalls_memories_once(self, orchestrator):
+        """Memory recall for the whole batch is a single call"""
+        memory_system = AsyncMock()
+        memory_system.recall_memories_batch.side_effect = lambda queries: [
+            AsyncMock(memories=[], relevance_scores=[]) for _ in queries
+        ]
+        orchestrator.memory_system = memory_system
+
+        requests = [DeliberationRequest(query=f"Question {i}") for i in range(4)]
+        async for _ in orchestrator.deliberate_batch(requests):
+            pass
+
+        memory_system.recall_memories_batch.assert_awaited_once()
+        assert len(memory_system.recall_memories_batch.await_args.args[0]) == 4
+
+    @pytest.mark.asyncio
+    async def test_batch_bounds_concurrency(self, orchestrator):
+        """No more than max_concurrency persona deliberations run at once"""
+        in_flight = 0
+        peak = 0
+
+        for persona in orchestrator.personas.values():
+            original = persona.deliberate
+
+            async def tracked(*args, _original=original, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                try:
+                    return await _original(*args, **kwargs)
+                finally:
+                    in_flight -= 1
+
+            persona.deliberate = tracked
+
+        requests = [DeliberationRequest(query=f"Scale plan {i}") for i in range(4)]
+        async for _ in orchestrator.deliberate_batch(requests, max_concurrency=3):
+            pass
+
+        assert 0 < peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_batch_return_exceptions(self, orchestrator):
+        """Failures are yielded in place when return_exceptions is set"""
+        requests = [
+            DeliberationRequest(query="Valid question"),
+            DeliberationRequest(query="No personas", required_personas=["missing"]),
+        ]
+
+        outcomes = {}
+        async for index, outcome in orchestrator.deliberate_batch(
+            requests, return_exceptions=True
+        ):
+            outcomes[index] = outcome
+
+        assert isinstance(outcomes[0], DeliberationResult)
+        assert isinstance(outcomes[1], ValueError)
+
+        with pytest.raises(ValueError):
+            async for _ in orchestrator.deliberate_batch(requests):
+                pass
+
+
+class TestDeliberateStream:
+    """Test streaming deliberation"""
+
+    @pytest.fixture
+    async def stub_orchestrator(self):
+        """Orchestrator with three fast agreeing personas and one slow dissenter"""
+        orch = Orchestrator(custom_personas=[
+            make_stub_persona("fast_a", "Use Postgres", 0.0),
+            make_stub_persona("fast_b", "Use Postgres", 0.01),
+            make_stub_persona("fast_c", "Use Postgres", 0.02),
+            make_stub_persona("slow", "Use MongoDB", 5.0),
+        ])
+        await orch.initialize()
+        orch.memory_system = None
+        return orch
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_responses_then_complete(self, orchestrator):
+        """Each persona response is streamed before the final result"""
+        request = DeliberationRequest(query="Should we add caching?")
+
+        updates = [u async for u in orchestrator.deliberate_stream(request, stop_early=False)]
+
+        assert updates[-1].event == "complete"
+        assert isinstance(updates[-1].result, DeliberationResult)
+        response_updates = updates[:-1]
+        assert len(response_updates) == len(updates[-1].result.persona_responses)
+        assert all(u.provisional_consensus is not None for u in response_updates)
+        assert response_updates[-1].personas_pending == []
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_early_when_decided(self, stub_orchestrator):
+        """Slow personas are skipped once they cannot overturn the leader"""
+        request = DeliberationRequest(
+            query="Which database?",
+            required_personas=["fast_a", "fast_b", "fast_c", "slow"],
+            consensus_method=ConsensusMethod.WEIGHTED_MAJORITY
+        )
+
+        updates = [u async for u in stub_orchestrator.deliberate_stream(request)]
+        result = updates[-1].result
+
+        assert result.consensus.decision == "Use Postgres"
+        assert result.statistics["personas_skipped"] == ["slow"]
+        assert result.deliberation_time < 5.0
+
+    @pytest.mark.asyncio
+    async def test_stream_never_stops_early_for_unanimous(self, stub_orchestrator):
+        """Unanimous consensus waits for every persona"""
+        request = DeliberationRequest(
+            query="Which database?",
+            required_personas=["fast_a", "fast_b", "slow"],
+            consensus_method=ConsensusMethod.UNANIMOUS,
+            timeout=0.5
+        )
+
+        updates = [u async for u in stub_orchestrator.deliberate_stream(request)]
+
+        assert not any(u.decided for u in updates[:-1])
+        assert updates[-1].result.statistics["personas_skipped"] == ["slow"]
+
+
+class TestWriteBehindPersistence:
+    """Test that persistence runs behind the deliberation response"""
+
+    @pytest.mark.asyncio
+    async def test_deliberate_does_not_wait_on_persistence(self, orchestrator):
+        """Memory and graph writes happen after deliberate returns, in batches"""
+        release = asyncio.Event()
+
+        async def slow_store(pairs):
+            await release.wait()
+
+        memory_system = AsyncMock()
+        memory_system.recall_memories_batch.side_effect = lambda queries: [
+            SimpleNamespace(memories=[], relevance_scores=[]) for _ in queries
+        ]
+        memory_system.store_deliberation_batch.side_effect = slow_store
+        orchestrator.memory_system = memory_system
+
+        knowledge_graph = AsyncMock()
+        knowledge_graph.add_node_batch.side_effect = lambda specs: [
+            SimpleNamespace(id=f"{name}:{node_type.value}") for name, node_type, _, _ in specs
+        ]
+        orchestrator.knowledge_graph = knowledge_graph
+
+        await asyncio.wait_for(
+            orchestrator.deliberate(DeliberationRequest(query="Should we adopt Kafka for events?")),
+            timeout=5
+        )
+        knowledge_graph.add_node_batch.assert_not_awaited()
+
+        release.set()
+        assert await orchestrator.persistence.flush(timeout=5)
+
+        memory_system.store_deliberation_batch.assert_awaited_once()
+        knowledge_graph.add_node_batch.assert_awaited_once()
+        knowledge_graph.add_edge_batch.assert_awaited_once()
+        knowledge_graph.add_node.assert_not_awaited()
+        edges = knowledge_graph.add_edge_batch.await_args.args[0]
+        assert any(source == "kafka:concept" for source, *_ in edges)
@@ -0,0 +1,98 @@
+"""
+Unit tests for the two-tier recall cache
+"""
+
+import asyncio
+
+import pytest
+
+from src.database.recall_cache import RecallCache
+
+
+class FakeCacheManager:
+    """Dict-backed stand-in for the Redis CacheManager memory helpers"""
+
+    def __init__(self):
+        self.store = {}
+        self.invalidated = []
+
+    async def initialize(self):
+        pass
+
+    async def cache_memories(self, persona_id, query_hash, memories):
+        self.store[(persona_id, query_hash)] = memories
+        return True
+
+    async def get_cached_memories(self, persona_id, query_hash):
+        return self.store.get((persona_id, query_hash))
+
+    async def invalidate_persona_cache(self, persona_id):
+        self.invalidated.append(persona_id)
+        for key in [k for k in self.store if k[0] == persona_id]:
+            del self.store[key]
+
+
+class TestRecallCache:
+    """Test local hits, invalidation, the Redis tier and hit flushing"""
+
+    @pytest.mark.asyncio
+    async def test_local_hit_and_persona_invalidation(self):
+        """Invalidating one persona leaves the others cached"""
+        cache = RecallCache()
+        await cache.put("analyst", "q1", ["m1", "m2"])
+        await cache.put("strategist", "q1", ["m3"])
+
+        assert await cache.get("analyst", "q1") == ["m1", "m2"]
+        await cache.invalidate_persona("analyst")
+
+        assert await cache.get("analyst", "q1") is None
+        assert await cache.get("strategist", "q1") == ["m3"]
+        assert cache.get_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_lru_eviction(self):
+        """Entries expire after the TTL and the least recently used is evicted"""
+        cache = RecallCache(ttl=0.05, max_entries=2)
+        await cache.put("analyst", "a", ["m1"])
+        await cache.put("analyst", "b", ["m2"])
+        await cache.get("analyst", "a")
+        await cache.put("analyst", "c", ["m3"])
+
+        assert await cache.get("analyst", "b") is None
+        assert await cache.get("analyst", "a") == ["m1"]
+
+        await asyncio.sleep(0.06)
+        assert await cache.get("analyst", "a") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_fills_local_cache(self):
+        """A Redis hit is copied into the local tier"""
+        manager = FakeCacheManager()
+        await RecallCache(cache_manager=manager).put("analyst", "q", ["m1"])
+
+        cache = RecallCache(cache_manager=manager)
+        assert await cache.get("analyst", "q") == ["m1"]
+        assert await cache.get("analyst", "q") == ["m1"]
+        assert cache.get_stats()["redis_hits"] == 1
+        assert cache.get_stats()["hits"] == 1
+
+        await cache.invalidate_persona("analyst")
+        assert manager.invalidated == ["analyst"]
+        assert await cache.get("analyst", "q") is None
+
+    @pytest.mark.asyncio
+    async def test_hit_counts_are_aggregated(self):
+        """Hits are handed to the flush callback in one batch"""
+        flushed = []
+
+        async def flush_hits(hits):
+            flushed.append(hits)
+
+        cache = RecallCache(flush_hits=flush_hits, flush_interval=3600)
+        await cache.put("analyst", "q", ["m1"])
+        for _ in range(3):
+            await cache.get("analyst", "q")
+        assert flushed == []
+
+        await cache.flush()
+        assert flushed == [{("analyst", "q"): 3}]
@@ -0,0 +1,129 @@
+"""
+Unit tests for recommendation clustering and clustered consensus voting
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.council.consensus import ConsensusEngine, ConsensusMethod
+from src.council.persona import PersonaResponse, PersonaPriority
+from src.council.recommendation_clustering import RecommendationClusterer, normalize_recommendation
+
+
+def make_response(persona_id, recommendation, confidence=0.8):
+    return PersonaResponse(
+        persona_id=persona_id,
+        persona_name=persona_id.title(),
+        recommendation=recommendation,
+        reasoning="",
+        confidence=confidence,
+        priority=PersonaPriority.MEDIUM
+    )
+
+
+class TestRecommendationClusterer:
+    """Test normalization, similarity and clustering rules"""
+
+    def test_normalization_drops_punctuation_and_stop_words(self):
+        """Tokens are lowercase words without filler"""
+        assert normalize_recommendation("Migrate to PostgreSQL, then re-index!") == [
+            "migrate", "postgresql", "re", "index"
+        ]
+
+    def test_paraphrases_share_a_cluster(self):
+        """Differently worded recommendations for the same action are grouped"""
+        clusterer = RecommendationClusterer()
+        recommendations = [
+            "Migrate to PostgreSQL",
+            "Proceed with the migration to PostgreSQL",
+            "Keep using MySQL",
+        ]
+
+        assert clusterer.cluster(recommendations) == [0, 0, 2]
+
+    def test_numbers_and_negation_keep_options_apart(self):
+        """Near-identical wording with different options or polarity never merges"""
+        clusterer = RecommendationClusterer()
+
+        assert clusterer.cluster(["Option 0", "Option 1", "Option 0"]) == [0, 1, 0]
+        assert clusterer.cluster(["Migrate to PostgreSQL", "Don't migrate to PostgreSQL"]) == [0, 1]
+
+    def test_most_confident_member_leads(self):
+        """The cluster takes the wording of its highest-priority member"""
+        clusterer = RecommendationClusterer()
+        recommendations = ["Implement OAuth 2.0", "Implement OAuth 2.0 with 2FA"]
+
+        assert clusterer.canonical(recommendations, [0.9, 0.95]) == [
+            "Implement OAuth 2.0 with 2FA", "Implement OAuth 2.0 with 2FA"
+        ]
+
+
+class TestClusteredConsensus:
+    """Test that the consensus engine votes per cluster"""
+
+    @pytest.fixture
+    def engine(self):
+        blackboard = MagicMock()
+        blackboard.post = AsyncMock()
+        return ConsensusEngine(blackboard)
+
+    @pytest.mark.asyncio
+    async def test_paraphrased_majority_wins(self, engine):
+        """Paraphrases pool their votes and keep their own wording as alternatives"""
+        responses = [
+            make_response("strategist", "Migrate to PostgreSQL", 0.9),
+            make_response("analyst", "Proceed with the migration to PostgreSQL", 0.7),
+            make_response("pragmatist", "Keep using MySQL", 0.85),
+        ]
+
+        result = await engine.provisional_consensus(
+            responses, method=ConsensusMethod.WEIGHTED_MAJORITY
+        )
+
+        assert result.decision == "Migrate to PostgreSQL"
+        assert result.supporting_personas == ["strategist", "analyst"]
+        assert result.alternative_views == {"pragmatist": "Keep using MySQL"}
+        assert result.agreement_level > 0.6
+
+    def test_later_responses_do_not_regroup_earlier_ones(self, engine):
+        """A more confident late response joins a group instead of re-seeding it"""
+        early = [
+            make_response("strategist", "Implement OAuth 2.0", 0.6),
+            make_response("pragmatist", "Use session-based authentication", 0.6),
+        ]
+        late = make_response("guardian", "Implement OAuth 2.0 with 2FA", 0.95)
+
+        before = engine._group_recommendations(early)
+        after = engine._group_recommendations(early + [late])
+
+        assert before[0] != before[1]
+        assert after[0] == after[2] == "Implement OAuth 2.0 with 2FA"
+        assert after[1] == before[1]
+
+    def test_early_stop_holds_with_clustering(self, engine):
+        """A decided outcome stays decided once the pending persona answers"""
+        responses = [
+            make_response("strategist", "Migrate to PostgreSQL", 0.9),
+            make_response("analyst", "Proceed with the migration to PostgreSQL", 0.9),
+            make_response("pragmatist", "Keep using MySQL", 0.5),
+        ]
+        weights = {r.persona_id: 1.0 for r in responses}
+
+        assert engine.is_decided(responses, weights, [0.3], ConsensusMethod.WEIGHTED_MAJORITY)
+        assert not engine.is_decided(responses, weights, [1.0, 1.0], ConsensusMethod.WEIGHTED_MAJORITY)
+
+    @pytest.mark.asyncio
+    async def test_clustering_can_be_disabled(self, engine):
+        """Without a threshold only identical texts are grouped"""
+        exact = ConsensusEngine(engine.blackboard, cluster_threshold=None)
+        responses = [
+            make_response("strategist", "Migrate to PostgreSQL"),
+            make_response("analyst", "Proceed with the migration to PostgreSQL"),
+        ]
+
+        clustered = await engine.provisional_consensus(responses, method=ConsensusMethod.HYBRID)
+        unclustered = await exact.provisional_consensus(responses, method=ConsensusMethod.HYBRID)
+
+        assert clustered.agreement_level == 1.0
+        assert unclustered.agreement_level < 1.0
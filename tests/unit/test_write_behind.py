@@ -0,0 +1,101 @@
+"""
+Unit tests for the write-behind persistence pipeline
+"""
+
+import asyncio
+
+import pytest
+
+from src.council.write_behind import WriteBehindJournal, WriteBehindPipeline
+
+
+class RecordingStage:
+    """Stage handler that records batches and can fail a number of times"""
+
+    def __init__(self, failures: int = 0):
+        self.batches = []
+        self.failures = failures
+
+    async def __call__(self, payloads):
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(payloads))
+
+
+def make_pipeline(stages, journal=None, **kwargs):
+    kwargs.setdefault("batch_delay", 0)
+    kwargs.setdefault("base_backoff", 0)
+    return WriteBehindPipeline(stages=stages, journal=journal, **kwargs)
+
+
+class TestWriteBehindPipeline:
+    """Test batching, retries and shutdown"""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_persistence(self):
+        """Payloads are persisted by the worker in batches"""
+        release = asyncio.Event()
+        persisted = []
+
+        async def slow_stage(payloads):
+            await release.wait()
+            persisted.extend(payloads)
+
+        pipeline = make_pipeline([("memory", slow_stage)], batch_delay=0.01)
+        for i in range(5):
+            await pipeline.submit(i)
+        assert persisted == []
+
+        release.set()
+        assert await pipeline.flush(timeout=1)
+        assert persisted == [0, 1, 2, 3, 4]
+        assert pipeline.get_stats()["persisted"] == 5
+
+    @pytest.mark.asyncio
+    async def test_retry_skips_completed_stages(self):
+        """A stage that already succeeded is not repeated on retry"""
+        memory = RecordingStage()
+        graph = RecordingStage(failures=2)
+        pipeline = make_pipeline([("memory", memory), ("graph", graph)])
+
+        await pipeline.submit("a")
+        assert await pipeline.flush(timeout=1)
+
+        assert memory.batches == [["a"]]
+        assert graph.batches == [["a"]]
+        assert pipeline.get_stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_dead_letter_after_max_retries(self, tmp_path):
+        """Jobs that keep failing are parked in the journal"""
+        journal = WriteBehindJournal(str(tmp_path / "queue.db"))
+        pipeline = make_pipeline([("memory", RecordingStage(failures=10))],
+                                 journal=journal, max_retries=3)
+
+        await pipeline.submit("a")
+        await pipeline.flush(timeout=1)
+
+        assert pipeline.get_stats()["dead_letters"] == 1
+        assert journal.get_stats() == {"journal_pending": 0, "journal_failed": 1}
+
+    @pytest.mark.asyncio
+    async def test_pending_jobs_replay_from_journal(self, tmp_path):
+        """Jobs left unpersisted at shutdown are written by the next pipeline"""
+        path = str(tmp_path / "queue.db")
+        blocked = asyncio.Event()
+
+        async def stuck_stage(payloads):
+            await blocked.wait()
+
+        pipeline = make_pipeline([("memory", stuck_stage)], journal=WriteBehindJournal(path))
+        await pipeline.submit({"query": "Adopt Kafka?"})
+        await pipeline.stop(timeout=0.05)
+        assert WriteBehindJournal(path).get_stats()["journal_pending"] == 1
+
+        memory = RecordingStage()
+        replay = make_pipeline([("memory", memory)], journal=WriteBehindJournal(path))
+        assert await replay.flush(timeout=1)
+
+        assert memory.batches == [[{"query": "Adopt Kafka?"}]]
+        assert WriteBehindJournal(path).get_stats()["journal_pending"] == 0